@@ -0,0 +1,90 @@
+"""
+Transaction throughput against the LocalRPCServer stand-in: one-at-a-time
+send + receipt wait vs pipelined sends with local nonces and batched
+receipt polling.
+
+    python benchmarks/bench_async_web3.py --txs 500 --latency 0.002
+"""
+import argparse
+import asyncio
+import multiprocessing as mp
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "polyscale_dfl"))
+
+from chain.async_web3_client import AsyncWeb3Client
+from chain.local_chain import LocalRPCServer
+
+
+def make_txs(n):
+    return [{"to": "0x" + "5f" * 20, "data": "0x" + f"{i:08x}" * 11} for i in range(n)]
+
+
+async def sequential(client, txs):
+    for tx in txs:
+        tx_hash = await client.send_transaction(tx)
+        await client.wait_for_receipts([tx_hash], poll_interval=0.01)
+
+
+async def pipelined(client, txs):
+    hashes = await client.send_transactions(txs)
+    await client.wait_for_receipts(hashes, poll_interval=0.01)
+
+
+def run_sync_web3(url, txs):
+    try:
+        from chain.web3_client import Web3Client
+        client = Web3Client(url)
+        start = time.perf_counter()
+        for tx in txs:
+            tx_hash = client.send_transaction({**tx, "from": client.web3.eth.accounts[0]})
+            client.web3.eth.wait_for_transaction_receipt(tx_hash, poll_latency=0.01)
+        return time.perf_counter() - start
+    except Exception as e:
+        print(f"  (Web3Client skipped: {e})")
+        return None
+
+
+def serve(latency, url_queue):
+    server = LocalRPCServer(latency=latency)
+    url_queue.put(server.url)
+    server.httpd.serve_forever()
+
+
+async def run_async(url, mode, txs):
+    async with AsyncWeb3Client(url) as client:
+        await client.get_accounts()
+        start = time.perf_counter()
+        await mode(client, txs)
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--txs", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.002, help="simulated per-request node latency (s)")
+    args = parser.parse_args()
+
+    # Node runs in its own process so client and server do not share a GIL
+    url_queue = mp.Queue()
+    node = mp.Process(target=serve, args=(args.latency, url_queue), daemon=True)
+    node.start()
+    url = url_queue.get()
+    try:
+        txs = make_txs(args.txs)
+        results = {
+            "Web3Client (sync)": run_sync_web3(url, txs),
+            "async sequential": asyncio.run(run_async(url, sequential, txs)),
+            "async pipelined": asyncio.run(run_async(url, pipelined, txs)),
+        }
+    finally:
+        node.terminate()
+    for name, elapsed in results.items():
+        if elapsed is not None:
+            print(f"{name:>18}: {args.txs / elapsed:9.1f} tx/s  ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
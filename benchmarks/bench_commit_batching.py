@@ -0,0 +1,49 @@
+"""
+Transactions and gas per round: one commit per client vs one Merkle-root
+commit per round, on FLContractStub and the LocalChain stand-in.
+
+    python benchmarks/bench_commit_batching.py --clients 10 100 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "polyscale_dfl"))
+
+from chain.batcher import CommitBatcher
+from chain.chain_stub import FLContractStub
+from chain.local_chain import LocalChain
+
+
+def per_update(backend, n):
+    for i in range(n):
+        backend.commit_update(f"Qm{i:044d}")
+
+
+def batched(backend, n):
+    batcher = CommitBatcher(backend)
+    for i in range(n):
+        batcher.add(f"client-{i}", 1, f"Qm{i:044d}")
+    batcher.flush(1)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 100, 1000])
+    args = parser.parse_args()
+
+    print(f"{'backend':>14} {'clients':>8} {'mode':>10} {'txs':>6} {'gas':>12} {'ms':>8}")
+    for backend_cls in (FLContractStub, LocalChain):
+        for n in args.clients:
+            for mode, fn in (("per-update", per_update), ("batched", batched)):
+                backend = backend_cls()
+                start = time.perf_counter()
+                fn(backend, n)
+                elapsed = (time.perf_counter() - start) * 1000
+                print(f"{backend_cls.__name__:>14} {n:>8} {mode:>10} {backend.tx_count:>6} "
+                      f"{backend.gas_used:>12} {elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
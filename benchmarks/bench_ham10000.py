@@ -0,0 +1,67 @@
+"""
+Compare images/sec of the original HAM10000 loader (decode + resize on every
+access) against the memory-mapped cache loader.
+
+    python benchmarks/bench_ham10000.py --images 512 --epochs 3 --workers 2
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "polyscale_dfl"))
+
+from datasets.ham10000_loader import load_ham10000
+
+
+def make_fake_ham10000(root, num_images, size=(600, 450)):
+    img_dir = os.path.join(root, "images")
+    os.makedirs(img_dir, exist_ok=True)
+    rng = np.random.default_rng(0)
+    rows = ["image_id,dx"]
+    for i in range(num_images):
+        name = f"ISIC_{i:07d}.jpg"
+        pixels = rng.integers(0, 256, size=(size[1], size[0], 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(os.path.join(img_dir, name), quality=90)
+        rows.append(f"{name},{i % 7}")
+    csv_file = os.path.join(root, "metadata.csv")
+    with open(csv_file, "w") as f:
+        f.write("\n".join(rows) + "\n")
+    return csv_file, img_dir
+
+
+def time_epochs(loader, epochs):
+    rates = []
+    for _ in range(epochs):
+        start = time.perf_counter()
+        seen = 0
+        for x, _ in loader:
+            seen += x.shape[0]
+        rates.append(seen / (time.perf_counter() - start))
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--images", type=int, default=256)
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--workers", type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        csv_file, img_dir = make_fake_ham10000(root, args.images)
+        baseline = load_ham10000(csv_file, img_dir, args.batch_size, num_workers=args.workers)
+        cached = load_ham10000(csv_file, img_dir, args.batch_size, num_workers=args.workers,
+                               cache_dir=os.path.join(root, "cache"))
+        for name, loader in (("baseline", baseline), ("cached", cached)):
+            rates = time_epochs(loader, args.epochs)
+            print(f"{name:>8}: " + "  ".join(f"epoch {i + 1}: {r:8.1f} img/s" for i, r in enumerate(rates)))
+
+
+if __name__ == "__main__":
+    main()
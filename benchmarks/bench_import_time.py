@@ -0,0 +1,66 @@
+"""
+Measure the cold import time of a minimal client process (ClientNode + MLP)
+and check that no heavy optional backend is loaded along the way.
+
+    python benchmarks/bench_import_time.py --budget 2.0
+
+Exits non-zero if the import phase exceeds the budget (seconds) or if one of
+the optional backends shows up in sys.modules.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "polyscale_dfl")
+
+HEAVY_MODULES = ["torchvision", "web3", "cryptography", "pandas", "PIL", "ipfshttpclient", "libp2p"]
+
+CHILD = """
+import json, sys, time
+start = time.perf_counter()
+from client.client_node import ClientNode
+from models.mlp import MLP
+from datasets.synthetic import generate_synthetic
+import_s = time.perf_counter() - start
+
+from torch.utils.data import DataLoader
+data = generate_synthetic(num_clients=1, num_samples=64, input_dim=10)[0]
+client = ClientNode(0, MLP(input_dim=10, hidden_dim=16, num_classes=2), DataLoader(data, batch_size=16))
+client.train_one_round(epochs=1)
+total_s = time.perf_counter() - start
+heavy = [m for m in %r if m in sys.modules]
+print(json.dumps({"import_s": import_s, "total_s": total_s, "heavy_modules": heavy}))
+""" % (HEAVY_MODULES,)
+
+
+def measure(repeats):
+    runs = []
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, "-c", CHILD], cwd=PACKAGE_DIR,
+                             capture_output=True, text=True, check=True)
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return runs
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget", type=float, default=2.0, help="max import time in seconds")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    runs = measure(args.repeats)
+    best = min(runs, key=lambda r: r["import_s"])
+    print(f"import: {best['import_s']:.3f}s  import+train: {best['total_s']:.3f}s  (best of {args.repeats})")
+    heavy = sorted({m for r in runs for m in r["heavy_modules"]})
+    if heavy:
+        print(f"FAIL: heavy modules imported: {', '.join(heavy)}")
+        sys.exit(1)
+    if best["import_s"] > args.budget:
+        print(f"FAIL: import time over budget ({args.budget:.2f}s)")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
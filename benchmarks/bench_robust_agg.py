@@ -0,0 +1,56 @@
+"""
+Time the robust aggregation rules on a stacked [N, P] update matrix.
+
+    python benchmarks/bench_robust_agg.py --clients 10 100 1000 --params 100000 --workers 4
+"""
+import argparse
+import os
+import sys
+import time
+
+import torch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "polyscale_dfl"))
+
+from aggregator.robust import AGGREGATION_RULES
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--params", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--byzantine", type=float, default=0.1, help="fraction of outlier updates")
+    args = parser.parse_args()
+
+    print(f"P = {args.params}, chunk = {args.chunk_size}, workers = {args.workers}")
+    print(f"{'rule':>18} " + " ".join(f"{'N=' + str(n):>10}" for n in args.clients))
+    matrices = {}
+    for n in args.clients:
+        matrix = torch.randn(n, args.params)
+        matrix[: int(n * args.byzantine)] += 100.0
+        matrices[n] = matrix
+
+    options = {
+        "mean": (lambda m, **_: m.mean(dim=0), {}),
+        "median": (AGGREGATION_RULES["median"], {"chunk_size": args.chunk_size, "num_workers": args.workers}),
+        "trimmed_mean": (AGGREGATION_RULES["trimmed_mean"],
+                         {"trim_ratio": args.byzantine, "chunk_size": args.chunk_size, "num_workers": args.workers}),
+        "krum": (AGGREGATION_RULES["krum"], {}),
+        "multi_krum": (AGGREGATION_RULES["multi_krum"], {}),
+        "geometric_median": (AGGREGATION_RULES["geometric_median"], {"chunk_size": args.chunk_size}),
+    }
+    for name, (rule, kwargs) in options.items():
+        row = []
+        for n in args.clients:
+            if name in ("krum", "multi_krum"):
+                kwargs = {"num_byzantine": int(n * args.byzantine)}
+            start = time.perf_counter()
+            rule(matrices[n], **kwargs)
+            row.append(f"{(time.perf_counter() - start) * 1000:8.1f}ms")
+        print(f"{name:>18} " + " ".join(f"{r:>10}" for r in row))
+
+
+if __name__ == "__main__":
+    main()
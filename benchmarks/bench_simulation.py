@@ -0,0 +1,73 @@
+"""
+Scale test on one machine: launch a LocalCluster per node count and report
+how rounds per hour change as the number of clients grows.
+
+    python benchmarks/bench_simulation.py --clients 10 100 1000 5000 --clients-per-process 50
+    python benchmarks/bench_simulation.py --clients 1000 --aggregators 4 --latency-ms 50 \
+        --bandwidth-mbps 20 --dropout 0.1 --output sim_results.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "polyscale_dfl"))
+
+from simulation.launcher import LocalCluster, SimulationConfig
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--clients-per-process", type=int, default=50)
+    parser.add_argument("--aggregators", type=int, default=1)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--samples", type=int, default=64, help="samples per client")
+    parser.add_argument("--input-dim", type=int, default=10)
+    parser.add_argument("--hidden-dim", type=int, default=32)
+    parser.add_argument("--bandwidth-mbps", type=float, default=None)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--dropout", type=float, default=0.0)
+    parser.add_argument("--round-timeout", type=float, default=600.0)
+    parser.add_argument("--threads-per-process", type=int, default=1)
+    parser.add_argument("--memory-limit-mb", type=int, default=None)
+    parser.add_argument("--pin-cpus", action="store_true")
+    parser.add_argument("--output", default="simulation_results.json")
+    args = parser.parse_args()
+
+    print(f"{'clients':>8} {'procs':>6} {'s/round':>9} {'rounds/h':>10} {'particip.':>10} {'MB moved':>9} {'txs':>5}")
+    runs = []
+    for n in args.clients:
+        config = SimulationConfig(
+            num_clients=n, clients_per_process=args.clients_per_process, num_aggregators=args.aggregators,
+            rounds=args.rounds, local_epochs=args.epochs, samples_per_client=args.samples,
+            input_dim=args.input_dim, hidden_dim=args.hidden_dim, bandwidth_mbps=args.bandwidth_mbps,
+            latency_ms=args.latency_ms, dropout=args.dropout, round_timeout=args.round_timeout,
+            threads_per_process=args.threads_per_process, memory_limit_mb=args.memory_limit_mb,
+            pin_cpus=args.pin_cpus)
+        summary = LocalCluster(config).run()
+        runs.append(summary)
+        mean_round = sum(summary["round_seconds"]) / len(summary["round_seconds"])
+        participation = sum(summary["participation"]) / (len(summary["participation"]) * n)
+        print(f"{n:>8} {summary['client_processes'] + summary['aggregator_processes']:>6} {mean_round:>9.2f} "
+              f"{summary['rounds_per_hour']:>10.1f} {participation:>10.1%} "
+              f"{summary['update_bytes'] / 1e6:>9.1f} {summary['tx_count']:>5}")
+
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "config": vars(args),
+        "runs": runs,
+    }
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
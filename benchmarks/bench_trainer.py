@@ -0,0 +1,76 @@
+"""
+Per-round CPU training time for every model in polyscale_dfl/models under
+the LocalTrainer options, relative to the original fresh-optimizer fp32 round.
+
+    python benchmarks/bench_trainer.py --models mlp resnet18 mobilenetv2 --rounds 3
+"""
+import argparse
+import os
+import sys
+import time
+
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "polyscale_dfl"))
+
+from client.trainer import LocalTrainer, train_one_round
+from models.mlp import MLP
+from models.mobilenet import MobileNetV2
+from models.resnet import ResNet18
+from models.vit import VisionTransformer
+
+MODELS = {
+    # name: (factory, input shape, supports channels_last)
+    "mlp": (lambda: MLP(input_dim=3 * 32 * 32), (3, 32, 32), False),
+    "resnet18": (ResNet18, (3, 64, 64), True),
+    "mobilenetv2": (MobileNetV2, (3, 64, 64), True),
+    "vit": (VisionTransformer, (3, 224, 224), False),
+}
+
+CONFIGS = {
+    "fp32 persistent": {},
+    "bf16": {"precision": "bf16"},
+    "bf16+channels_last": {"precision": "bf16", "channels_last": True},
+    "compile": {"compile": True},
+    "bf16+compile": {"precision": "bf16", "compile": True},
+}
+
+
+def time_rounds(run_round, rounds):
+    run_round()  # warm-up (and compilation for torch.compile)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        run_round()
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--models", nargs="+", default=["mlp", "resnet18", "mobilenetv2"], choices=list(MODELS))
+    parser.add_argument("--configs", nargs="+", default=list(CONFIGS), choices=list(CONFIGS))
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--batches", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=16)
+    args = parser.parse_args()
+
+    for name in args.models:
+        factory, shape, conv = MODELS[name]
+        n = args.batches * args.batch_size
+        data = TensorDataset(torch.randn(n, *shape), torch.randint(0, 10, (n,)))
+        loader = DataLoader(data, batch_size=args.batch_size)
+
+        model = factory()
+        baseline = time_rounds(lambda: train_one_round(model, loader), args.rounds)
+        print(f"{name}: baseline {baseline * 1000:8.1f} ms/round")
+        for config in args.configs:
+            kwargs = CONFIGS[config]
+            if kwargs.get("channels_last") and not conv:
+                continue
+            trainer = LocalTrainer(factory(), **kwargs)
+            elapsed = time_rounds(lambda: trainer.train(loader), args.rounds)
+            print(f"  {config:>20}: {elapsed * 1000:8.1f} ms/round  x{baseline / elapsed:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
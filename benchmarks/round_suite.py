@@ -0,0 +1,138 @@
+"""
+Offline end-to-end round benchmark: synthetic data, MLP clients, the local
+IPFSClient and FLContractStub. Reports per-phase timings (train, mask,
+serialize, upload, download, aggregate, evaluate, commit), peak RSS, bytes
+moved and chain cost, and writes everything to a JSON file that later runs
+can be compared against.
+
+    python benchmarks/round_suite.py --clients 4 16 --rounds 3 --output results.json
+    python benchmarks/round_suite.py --compare results.json --threshold 0.25
+    python benchmarks/round_suite.py --profile cprofile --profile-dir prof/
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import torch
+from torch.utils.data import DataLoader
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "polyscale_dfl"))
+
+from aggregator.aggregator_node import AggregatorNode
+from chain.chain_stub import FLContractStub
+from client.client_node import ClientNode
+from datasets.synthetic import generate_synthetic
+from ipfs.ipfs_client import IPFSClient
+from models.mlp import MLP
+from training.orchestrator import TrainingOrchestrator
+from training.profiling import PhaseProfiler
+
+
+def run_scenario(num_clients, args, storage_dir, profile_dir):
+    torch.manual_seed(0)
+    datasets = generate_synthetic(num_clients + 1, args.samples, args.input_dim, args.num_classes)
+    make_model = lambda: MLP(input_dim=args.input_dim, hidden_dim=args.hidden_dim, num_classes=args.num_classes)
+    clients = [ClientNode(i, make_model(), DataLoader(d, batch_size=args.batch_size, shuffle=True))
+               for i, d in enumerate(datasets[:-1])]
+    aggregator = AggregatorNode(make_model(), clients, DataLoader(datasets[-1], batch_size=256))
+    contract = FLContractStub()
+    profiler = PhaseProfiler(args.profile, profile_dir)
+    orchestrator = TrainingOrchestrator(aggregator, clients, rounds=args.rounds, mask=not args.no_mask,
+                                        ipfs_client=IPFSClient(storage_dir), contract=contract, profiler=profiler)
+    start = time.perf_counter()
+    history = orchestrator.run(epochs_per_round=args.epochs)
+    elapsed = time.perf_counter() - start
+    profiler.dump()
+    summary = profiler.summary()
+    return {
+        "clients": num_clients,
+        "rounds": args.rounds,
+        "round_s": elapsed / args.rounds,
+        "phases": {name: {**stats, "per_round_s": stats["total_s"] / args.rounds}
+                   for name, stats in summary["phases"].items()},
+        "bytes_moved": summary["bytes_moved"],
+        "peak_rss_mb": summary["peak_rss_mb"],
+        "tx_count": contract.tx_count,
+        "gas_used": contract.gas_used,
+        "final_accuracy": history[-1]["accuracy"],
+    }
+
+
+def compare(results, baseline, threshold):
+    """Print per-phase changes against a previous results file; returns True on regression"""
+    regressed = False
+    previous = {s["clients"]: s for s in baseline["scenarios"]}
+    for scenario in results["scenarios"]:
+        old = previous.get(scenario["clients"])
+        if old is None:
+            continue
+        print(f"-- {scenario['clients']} clients vs baseline")
+        rows = [("round", old["round_s"], scenario["round_s"])]
+        rows += [(name, old["phases"][name]["per_round_s"], stats["per_round_s"])
+                 for name, stats in scenario["phases"].items() if name in old["phases"]]
+        for name, before, after in rows:
+            change = (after - before) / before if before else 0.0
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressed = True
+            print(f"  {name:>10}: {before * 1000:9.2f} -> {after * 1000:9.2f} ms ({change:+.1%}){flag}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[4, 16])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--epochs", type=int, default=1)
+    parser.add_argument("--samples", type=int, default=512)
+    parser.add_argument("--input-dim", type=int, default=784)
+    parser.add_argument("--hidden-dim", type=int, default=128)
+    parser.add_argument("--num-classes", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--no-mask", action="store_true", help="skip pairwise masking")
+    parser.add_argument("--profile", choices=["cprofile", "torch"], default=None)
+    parser.add_argument("--profile-dir", default="round_profiles")
+    parser.add_argument("--output", default="round_results.json")
+    parser.add_argument("--compare", default=None, help="previous results JSON to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative slowdown counted as a regression")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    scenarios = []
+    with tempfile.TemporaryDirectory() as storage_root:
+        for n in args.clients:
+            scenario = run_scenario(n, args, os.path.join(storage_root, str(n)),
+                                    os.path.join(args.profile_dir, f"{n}_clients"))
+            scenarios.append(scenario)
+            phases = "  ".join(f"{k}={v['per_round_s'] * 1000:.1f}ms" for k, v in scenario["phases"].items())
+            print(f"{n:>5} clients: {scenario['round_s'] * 1000:.1f} ms/round  {phases}  "
+                  f"rss={scenario['peak_rss_mb']:.0f}MB  bytes={sum(scenario['bytes_moved'].values())}")
+
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "torch": torch.__version__,
+        "platform": platform.platform(),
+        "config": vars(args),
+        "scenarios": scenarios,
+    }
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"results written to {args.output}")
+
+    if baseline is not None:
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
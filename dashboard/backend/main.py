@@ -1,9 +1,18 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from routers import metrics, nodes, models
+from routers import metrics, nodes, models, live, telemetry
+from utils.websocket_manager import manager
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    manager.start()
+    yield
+    await manager.stop()
 
-app = FastAPI(title="PolyScale-FL Dashboard")
+app = FastAPI(title="PolyScale-FL Dashboard", lifespan=lifespan)
 
 # Allow frontend access
 app.add_middleware(
@@ -17,6 +26,8 @@ app.add_middleware(
 app.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
 app.include_router(nodes.router, prefix="/nodes", tags=["nodes"])
 app.include_router(models.router, prefix="/models", tags=["models"])
+app.include_router(live.router, prefix="/live", tags=["live"])
+app.include_router(telemetry.router, prefix="/telemetry", tags=["telemetry"])
 
 @app.get("/")
 async def root():
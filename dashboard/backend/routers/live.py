@@ -0,0 +1,21 @@
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from typing import Optional
+
+from utils.websocket_manager import manager
+
+router = APIRouter()
+
+@router.websocket("/ws")
+async def live_updates(websocket: WebSocket, topics: Optional[str] = None, policy: Optional[str] = None):
+    """
+    Stream batched deltas for the given comma-separated topics (metrics, nodes, models, telemetry).
+    """
+    subscriber = await manager.connect(websocket, topics.split(",") if topics else None, policy)
+    try:
+        while True:
+            # Clients do not need to send anything; this just notices disconnects
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        manager.disconnect(subscriber)
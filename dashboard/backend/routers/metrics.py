@@ -1,6 +1,9 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 from pydantic import BaseModel
-from typing import List
+from typing import List, Optional, Union
+
+from utils.storage import get_store
+from utils.websocket_manager import manager
 
 router = APIRouter()
 
@@ -8,15 +11,41 @@ router = APIRouter()
 class Metric(BaseModel):
     round: int
     cid: str
-    accuracy: float = None
-
-metrics_storage: List[Metric] = []
+    accuracy: Optional[float] = None
+    client_id: Optional[str] = None
+    loss: Optional[float] = None
 
 @router.post("/")
-async def post_metric(metric: Metric):
-    metrics_storage.append(metric)
-    return {"status": "ok"}
+def post_metric(metric: Union[List[Metric], Metric]):
+    """Ingest one metric or a batch of metrics in a single request"""
+    metrics = metric if isinstance(metric, list) else [metric]
+    rows = [m.model_dump() for m in metrics]
+    count = get_store().add_metrics(rows)
+    for row in rows:
+        manager.publish("metrics", f"{row['round']}:{row['client_id']}", row)
+    return {"status": "ok", "count": count}
 
 @router.get("/")
-async def get_metrics():
-    return metrics_storage
+def get_metrics(
+    round_from: Optional[int] = None,
+    round_to: Optional[int] = None,
+    client_id: Optional[str] = None,
+    cursor: int = 0,
+    limit: int = Query(500, ge=1, le=5000),
+):
+    items, next_cursor = get_store().query_metrics(round_from, round_to, client_id, cursor, limit)
+    return {"items": items, "next_cursor": next_cursor}
+
+@router.get("/rounds")
+def get_round_summary(round_from: Optional[int] = None, round_to: Optional[int] = None,
+                      client_id: Optional[str] = None):
+    return get_store().round_summary(round_from, round_to, client_id)
+
+@router.get("/downsample")
+def get_downsampled(
+    round_from: Optional[int] = None,
+    round_to: Optional[int] = None,
+    client_id: Optional[str] = None,
+    buckets: int = Query(200, ge=1, le=5000),
+):
+    return get_store().downsample(round_from, round_to, client_id, buckets)
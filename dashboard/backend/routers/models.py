@@ -1,16 +1,31 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
+from pydantic import BaseModel
 from typing import List
 
+from utils.storage import get_store
+from utils.websocket_manager import manager
+
 router = APIRouter()
 
-# Example in-memory model store
-models_store = []
+class ModelRecord(BaseModel):
+    cid: str
+    round: int
 
 @router.post("/register")
-async def register_model(cid: str, round: int):
-    models_store.append({"cid": cid, "round": round})
+def register_model(cid: str, round: int):
+    get_store().add_models([{"cid": cid, "round": round}])
+    manager.publish("models", cid, {"cid": cid, "round": round})
     return {"status": "registered"}
 
+@router.post("/batch")
+def register_models(models: List[ModelRecord]):
+    records = [m.model_dump() for m in models]
+    get_store().add_models(records)
+    for record in records:
+        manager.publish("models", record["cid"], record)
+    return {"status": "registered", "count": len(models)}
+
 @router.get("/")
-async def list_models():
-    return models_store
+def list_models(cursor: int = 0, limit: int = Query(500, ge=1, le=5000)):
+    items, next_cursor = get_store().list_models(cursor, limit)
+    return {"items": items, "next_cursor": next_cursor}
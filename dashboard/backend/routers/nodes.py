@@ -1,16 +1,29 @@
 from fastapi import APIRouter
-from typing import List, Dict
+from pydantic import BaseModel
+from typing import List, Optional
+
+from utils.storage import get_store
+from utils.websocket_manager import manager
 
 router = APIRouter()
 
-# In-memory node status
-nodes_status: Dict[str, Dict] = {}
+class NodeStatus(BaseModel):
+    node_id: str
+    status: str
 
 @router.post("/update")
-async def update_node_status(node_id: str, status: str):
-    nodes_status[node_id] = {"status": status}
+def update_node_status(node_id: str, status: str):
+    get_store().set_node_statuses([(node_id, status)])
+    manager.publish("nodes", node_id, {"status": status})
     return {"status": "ok"}
 
+@router.post("/batch")
+def update_node_statuses(updates: List[NodeStatus]):
+    get_store().set_node_statuses([(u.node_id, u.status) for u in updates])
+    for u in updates:
+        manager.publish("nodes", u.node_id, {"status": u.status})
+    return {"status": "ok", "count": len(updates)}
+
 @router.get("/")
-async def list_nodes():
-    return nodes_status
+def list_nodes(status: Optional[str] = None):
+    return get_store().list_nodes(status)
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Query
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+
+from utils.storage import get_store
+from utils.websocket_manager import manager
+
+router = APIRouter()
+
+# One sample as produced by polyscale_dfl.utils.telemetry.Telemetry.collect()
+class TelemetrySample(BaseModel):
+    name: str
+    type: str
+    labels: Dict[str, str] = {}
+    value: Optional[float] = None
+    count: Optional[int] = None
+    sum: Optional[float] = None
+    ts: Optional[float] = None
+
+class TelemetryBatch(BaseModel):
+    source: Optional[str] = None
+    samples: List[TelemetrySample]
+
+@router.post("/batch")
+def post_telemetry(batch: TelemetryBatch):
+    """Ingest a whole exporter snapshot in one request"""
+    rows = [s.model_dump() for s in batch.samples]
+    count = get_store().add_telemetry(batch.source, rows)
+    for row in rows:
+        labels = ",".join(f"{k}={v}" for k, v in sorted(row["labels"].items()))
+        manager.publish("telemetry", f"{batch.source}:{row['name']}:{labels}", {"source": batch.source, **row})
+    return {"status": "ok", "count": count}
+
+@router.get("/")
+def get_telemetry(
+    name: Optional[str] = None,
+    source: Optional[str] = None,
+    since: Optional[float] = None,
+    cursor: int = 0,
+    limit: int = Query(500, ge=1, le=5000),
+):
+    items, next_cursor = get_store().query_telemetry(name, source, since, cursor, limit)
+    return {"items": items, "next_cursor": next_cursor}
+
+@router.get("/latest")
+def get_latest_telemetry(source: Optional[str] = None):
+    return get_store().latest_telemetry(source)
@@ -1,9 +1,15 @@
-import ipfshttpclient
+_client = None
 
-client = ipfshttpclient.connect("/ip4/127.0.0.1/tcp/5001")
+def get_client():
+    """Connect to the IPFS daemon on first use rather than at import time"""
+    global _client
+    if _client is None:
+        import ipfshttpclient
+        _client = ipfshttpclient.connect("/ip4/127.0.0.1/tcp/5001")
+    return _client
 
 def fetch_json(cid: str):
     try:
-        return client.cat(cid).decode("utf-8")
+        return get_client().cat(cid).decode("utf-8")
     except Exception as e:
         return {"error": str(e)}
@@ -0,0 +1,197 @@
+import json
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metrics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    round INTEGER NOT NULL,
+    client_id TEXT,
+    cid TEXT,
+    accuracy REAL,
+    loss REAL,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_metrics_round ON metrics (round, id);
+CREATE INDEX IF NOT EXISTS idx_metrics_client ON metrics (client_id, round);
+
+CREATE TABLE IF NOT EXISTS nodes (
+    node_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS models (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    cid TEXT NOT NULL,
+    round INTEGER NOT NULL,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_models_round ON models (round);
+
+CREATE TABLE IF NOT EXISTS telemetry (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    source TEXT,
+    name TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    labels TEXT NOT NULL,
+    value REAL,
+    count INTEGER,
+    sum REAL,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_telemetry_name ON telemetry (name, id);
+"""
+
+METRIC_COLUMNS = ("round", "client_id", "cid", "accuracy", "loss")
+
+class MetricsStore:
+    """
+    SQLite store behind the dashboard routers: per-round/per-client metrics,
+    node status, registered models and telemetry samples pushed by nodes. Reads are paginated with an id cursor
+    so a poll never serializes more than one page.
+    """
+    def __init__(self, path="./dashboard.db"):
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        with self.lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+
+    def _query(self, sql, params=()):
+        with self.lock:
+            return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def _write_many(self, sql, rows):
+        with self.lock:
+            self.conn.execute("BEGIN")
+            try:
+                self.conn.executemany(sql, rows)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def _filters(round_from=None, round_to=None, client_id=None):
+        clauses, params = [], []
+        if round_from is not None:
+            clauses.append("round >= ?")
+            params.append(round_from)
+        if round_to is not None:
+            clauses.append("round <= ?")
+            params.append(round_to)
+        if client_id is not None:
+            clauses.append("client_id = ?")
+            params.append(client_id)
+        return clauses, params
+
+    # Metrics
+
+    def add_metrics(self, metrics):
+        now = time.time()
+        rows = [tuple(m.get(c) for c in METRIC_COLUMNS) + (now,) for m in metrics]
+        self._write_many("INSERT INTO metrics (round, client_id, cid, accuracy, loss, ts) VALUES (?, ?, ?, ?, ?, ?)", rows)
+        return len(rows)
+
+    def query_metrics(self, round_from=None, round_to=None, client_id=None, cursor=0, limit=500):
+        """One page of raw metrics ordered by insertion; pass next_cursor back to continue"""
+        clauses, params = self._filters(round_from, round_to, client_id)
+        clauses.append("id > ?")
+        params.append(cursor or 0)
+        rows = self._query(
+            f"SELECT * FROM metrics WHERE {' AND '.join(clauses)} ORDER BY id LIMIT ?", (*params, limit + 1))
+        next_cursor = rows[limit - 1]["id"] if len(rows) > limit else None
+        return rows[:limit], next_cursor
+
+    def round_summary(self, round_from=None, round_to=None, client_id=None):
+        """Per-round aggregates across clients"""
+        clauses, params = self._filters(round_from, round_to, client_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._query(
+            f"""SELECT round, COUNT(*) AS count, AVG(accuracy) AS accuracy, MIN(accuracy) AS min_accuracy,
+                       MAX(accuracy) AS max_accuracy, AVG(loss) AS loss
+                FROM metrics {where} GROUP BY round ORDER BY round""", params)
+
+    def downsample(self, round_from=None, round_to=None, client_id=None, buckets=200):
+        """Aggregate metrics into at most `buckets` equal-width round ranges"""
+        clauses, params = self._filters(round_from, round_to, client_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        bounds = self._query(f"SELECT MIN(round) AS lo, MAX(round) AS hi FROM metrics {where}", params)[0]
+        if bounds["lo"] is None:
+            return []
+        lo, hi = bounds["lo"], bounds["hi"]
+        width = max(1, -(-(hi - lo + 1) // buckets))
+        return self._query(
+            f"""SELECT ? + ((round - ?) / ?) * ? AS round, COUNT(*) AS count, AVG(accuracy) AS accuracy,
+                       MIN(accuracy) AS min_accuracy, MAX(accuracy) AS max_accuracy, AVG(loss) AS loss
+                FROM metrics {where} GROUP BY (round - ?) / ? ORDER BY 1""",
+            (lo, lo, width, width, *params, lo, width))
+
+    # Nodes
+
+    def set_node_statuses(self, statuses):
+        now = time.time()
+        self._write_many(
+            "INSERT INTO nodes (node_id, status, updated_at) VALUES (?, ?, ?) "
+            "ON CONFLICT(node_id) DO UPDATE SET status = excluded.status, updated_at = excluded.updated_at",
+            [(node_id, status, now) for node_id, status in statuses])
+
+    def list_nodes(self, status=None):
+        if status is None:
+            rows = self._query("SELECT node_id, status FROM nodes")
+        else:
+            rows = self._query("SELECT node_id, status FROM nodes WHERE status = ?", (status,))
+        return {row["node_id"]: {"status": row["status"]} for row in rows}
+
+    # Models
+
+    def add_models(self, models):
+        now = time.time()
+        self._write_many("INSERT INTO models (cid, round, ts) VALUES (?, ?, ?)",
+                         [(m["cid"], m["round"], now) for m in models])
+
+    def list_models(self, cursor=0, limit=500):
+        rows = self._query("SELECT id, cid, round FROM models WHERE id > ? ORDER BY id LIMIT ?", (cursor or 0, limit + 1))
+        next_cursor = rows[limit - 1]["id"] if len(rows) > limit else None
+        return rows[:limit], next_cursor
+
+    # Telemetry
+
+    def add_telemetry(self, source, samples):
+        """Store one exported snapshot; histograms keep count and sum"""
+        now = time.time()
+        rows = [(source, s["name"], s["type"], json.dumps(s.get("labels") or {}, sort_keys=True),
+                 s.get("value"), s.get("count"), s.get("sum"), s.get("ts") or now) for s in samples]
+        self._write_many(
+            "INSERT INTO telemetry (source, name, kind, labels, value, count, sum, ts) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            rows)
+        return len(rows)
+
+    @staticmethod
+    def _telemetry_row(row):
+        row["labels"] = json.loads(row["labels"])
+        return row
+
+    def query_telemetry(self, name=None, source=None, since=None, cursor=0, limit=500):
+        clauses, params = ["id > ?"], [cursor or 0]
+        for clause, value in (("name = ?", name), ("source = ?", source), ("ts >= ?", since)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        rows = self._query(
+            f"SELECT * FROM telemetry WHERE {' AND '.join(clauses)} ORDER BY id LIMIT ?", (*params, limit + 1))
+        next_cursor = rows[limit - 1]["id"] if len(rows) > limit else None
+        return [self._telemetry_row(row) for row in rows[:limit]], next_cursor
+
+    def latest_telemetry(self, source=None):
+        """Most recent sample of every (source, name, labels) series"""
+        where, params = ("WHERE source = ?", (source,)) if source is not None else ("", ())
+        rows = self._query(
+            f"""SELECT * FROM telemetry WHERE id IN (
+                    SELECT MAX(id) FROM telemetry {where} GROUP BY source, name, labels)
+                ORDER BY name""", params)
+        return [self._telemetry_row(row) for row in rows]
@@ -1,12 +1,25 @@
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 
+from .metrics_store import MetricsStore
+
 STORAGE_FILE = Path("./storage.json")
+DB_FILE = os.environ.get("DASHBOARD_DB", "./dashboard.db")
 
 def save(data):
-    STORAGE_FILE.write_text(json.dumps(data, indent=2))
+    # Compact, and written to a temp file first so readers never see a partial file
+    tmp = STORAGE_FILE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(data, separators=(",", ":")))
+    os.replace(tmp, STORAGE_FILE)
 
 def load():
     if STORAGE_FILE.exists():
         return json.loads(STORAGE_FILE.read_text())
     return {}
+
+@lru_cache(maxsize=None)
+def get_store():
+    """Shared MetricsStore, opened on first use"""
+    return MetricsStore(DB_FILE)
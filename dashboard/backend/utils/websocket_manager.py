@@ -1,19 +1,157 @@
-from typing import List
+import asyncio
+import json
+import logging
+import threading
+from collections import deque
+from typing import Dict, Iterable, Optional, Set, Tuple
+
 from fastapi import WebSocket
 
+logger = logging.getLogger(__name__)
+
+class Subscriber:
+    """
+    One connected viewer with a bounded send queue drained by its own task,
+    so a slow client only ever delays itself.
+    When the queue is over max_queue, policy "coalesce" first merges every
+    queued batch into one (latest value per key wins; raw broadcast messages
+    are kept, in order, ahead of it) and "drop_oldest" only discards the
+    oldest entries. Either way the queue never exceeds max_queue.
+    """
+    def __init__(self, websocket: WebSocket, topics: Optional[Iterable[str]] = None,
+                 max_queue: int = 32, policy: str = "coalesce"):
+        if policy not in ("coalesce", "drop_oldest"):
+            raise ValueError(f"Unknown queue policy {policy!r}")
+        self.websocket = websocket
+        self.topics = frozenset(topics) if topics else None
+        self.max_queue = max_queue
+        self.policy = policy
+        self.queue = deque()
+        self.dropped = 0
+        self.wakeup = asyncio.Event()
+        self.task = None
+
+    def offer(self, updates: Dict[Tuple[str, str], dict], text: Optional[str] = None):
+        """Queue a batch of updates, or a raw message (empty updates, text set)"""
+        self.queue.append((updates, text))
+        if len(self.queue) > self.max_queue and self.policy == "coalesce":
+            self._coalesce()
+        while len(self.queue) > self.max_queue:
+            self.queue.popleft()
+            self.dropped += 1
+        self.wakeup.set()
+
+    def _coalesce(self):
+        merged, raw = {}, []
+        for updates, text in self.queue:
+            if updates:
+                merged.update(updates)
+            else:
+                raw.append((updates, text))
+        self.queue = deque(raw + ([(merged, None)] if merged else []))
+
+    async def run(self):
+        while True:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+            while self.queue:
+                updates, text = self.queue.popleft()
+                if text is None:
+                    text = encode_batch(updates)
+                await self.websocket.send_text(text)
+
+def encode_batch(updates: Dict[Tuple[str, str], dict]):
+    return json.dumps({"type": "batch", "updates": list(updates.values())}, separators=(",", ":"))
+
 class WebSocketManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    """
+    Push channel for live dashboard updates.
+    publish() records a delta keyed by (topic, key); deltas for the same key
+    are merged until the next tick, when one batch per topic filter is
+    serialized and handed to every subscriber's queue.
+    publish() is thread-safe so it can be called from sync route handlers.
+    """
+    def __init__(self, tick_interval: float = 0.1, max_queue: int = 32, policy: str = "coalesce"):
+        self.tick_interval = tick_interval
+        self.max_queue = max_queue
+        self.policy = policy
+        self.subscribers: Set[Subscriber] = set()
+        self.pending: Dict[Tuple[str, str], dict] = {}
+        self._lock = threading.Lock()
+        self._ticker = None
 
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket, topics: Optional[Iterable[str]] = None,
+                      policy: Optional[str] = None):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        subscriber = Subscriber(websocket, topics, self.max_queue, policy or self.policy)
+        subscriber.task = asyncio.create_task(self._send_loop(subscriber))
+        self.subscribers.add(subscriber)
+        return subscriber
 
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+    def disconnect(self, subscriber: Subscriber):
+        self.subscribers.discard(subscriber)
+        if subscriber.task is not None and subscriber.task is not asyncio.current_task():
+            subscriber.task.cancel()
+
+    async def _send_loop(self, subscriber: Subscriber):
+        try:
+            await subscriber.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info("Dropping websocket subscriber after failed send: %s", e)
+            self.disconnect(subscriber)
+            try:
+                await subscriber.websocket.close()
+            except Exception:
+                pass
+
+    def publish(self, topic: str, key, data: dict):
+        update_key = (topic, str(key))
+        with self._lock:
+            update = self.pending.get(update_key)
+            if update is None:
+                self.pending[update_key] = {"topic": topic, "key": str(key), "data": dict(data)}
+            else:
+                update["data"].update(data)
+
+    def flush(self):
+        """Hand everything published since the last tick to the subscribers"""
+        with self._lock:
+            pending, self.pending = self.pending, {}
+        if not pending:
+            return
+        encoded = {}
+        for subscriber in list(self.subscribers):
+            if subscriber.topics not in encoded:
+                if subscriber.topics is None:
+                    updates = pending
+                else:
+                    updates = {k: v for k, v in pending.items() if k[0] in subscriber.topics}
+                encoded[subscriber.topics] = (updates, encode_batch(updates) if updates else None)
+            updates, text = encoded[subscriber.topics]
+            if updates:
+                subscriber.offer(updates, text)
 
     async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            await connection.send_text(message)
+        """Send a raw message to every subscriber through their queues"""
+        for subscriber in list(self.subscribers):
+            subscriber.offer({}, message)
+
+    async def _tick(self):
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            self.flush()
+
+    def start(self):
+        if self._ticker is None:
+            self._ticker = asyncio.create_task(self._tick())
+
+    async def stop(self):
+        if self._ticker is not None:
+            self._ticker.cancel()
+            self._ticker = None
+        for subscriber in list(self.subscribers):
+            self.disconnect(subscriber)
 
 manager = WebSocketManager()
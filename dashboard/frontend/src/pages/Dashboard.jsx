@@ -3,18 +3,50 @@ import axios from "axios";
 import RoundChart from "../components/RoundChart";
 import NodeList from "../components/NodeList";
 
+const METRICS_REFETCH_MS = 1000;
+
 export default function Dashboard() {
   const [metrics, setMetrics] = useState([]);
   const [nodes, setNodes] = useState({});
 
   useEffect(() => {
-    async function fetchData() {
-      const metricsRes = await axios.get("http://localhost:8000/metrics");
+    // The chart shows /metrics/downsample buckets, so raw metric deltas are
+    // not appended; they trigger a (throttled) re-fetch of the buckets instead
+    let refetchTimer = null;
+    async function fetchMetrics() {
+      refetchTimer = null;
+      const metricsRes = await axios.get("http://localhost:8000/metrics/downsample", { params: { buckets: 200 } });
       setMetrics(metricsRes.data);
+    }
+    async function fetchData() {
+      await fetchMetrics();
       const nodesRes = await axios.get("http://localhost:8000/nodes");
       setNodes(nodesRes.data);
     }
     fetchData();
+
+    // Live deltas pushed by the backend, batched per tick
+    const ws = new WebSocket("ws://localhost:8000/live/ws?topics=metrics,nodes");
+    ws.onmessage = (event) => {
+      const { updates } = JSON.parse(event.data);
+      if (!updates) return;
+      const hasMetrics = updates.some(u => u.topic === "metrics");
+      const nodeUpdates = updates.filter(u => u.topic === "nodes");
+      if (hasMetrics && refetchTimer === null) {
+        refetchTimer = setTimeout(fetchMetrics, METRICS_REFETCH_MS);
+      }
+      if (nodeUpdates.length) {
+        setNodes(prev => {
+          const next = { ...prev };
+          nodeUpdates.forEach(u => { next[u.key] = { ...next[u.key], ...u.data }; });
+          return next;
+        });
+      }
+    };
+    return () => {
+      ws.close();
+      if (refetchTimer !== null) clearTimeout(refetchTimer);
+    };
   }, []);
 
   return (
@@ -8,7 +8,7 @@ export default function Models() {
   useEffect(() => {
     async function fetchModels() {
       const res = await axios.get("http://localhost:8000/models");
-      setModels(res.data);
+      setModels(res.data.items);
     }
     fetchModels();
   }, []);
@@ -9,15 +9,43 @@ contract ModelRegistry {
         uint256 timestamp;
     }
 
+    struct RoundCommit {
+        bytes32 root;
+        uint32 count;
+    }
+
     Model[] public models;
+    mapping(uint256 => RoundCommit) public roundCommits;
 
     event ModelRegistered(uint256 round, string cid, address uploader);
+    event RoundCommitted(uint256 round, bytes32 root, uint32 count, address committer);
 
     function registerModel(uint256 round, string memory cid) public {
         models.push(Model(round, cid, msg.sender, block.timestamp));
         emit ModelRegistered(round, cid, msg.sender);
     }
 
+    // Commit a whole round as the Merkle root of its updates (one tx instead of one per client)
+    function commitRound(uint256 round, bytes32 root, uint32 count) public {
+        require(roundCommits[round].root == bytes32(0), "Round already committed");
+        roundCommits[round] = RoundCommit(root, count);
+        emit RoundCommitted(round, root, count, msg.sender);
+    }
+
+    // Leaf and node hashing match polyscale_dfl/chain/merkle.py (sha256, sorted pairs)
+    function verifyUpdate(uint256 round, string memory clientId, string memory cid, bytes32[] memory proof)
+        public view returns (bool)
+    {
+        bytes32 node = sha256(abi.encodePacked(bytes1(0x00), uint64(round), uint16(bytes(clientId).length), clientId, cid));
+        for (uint256 i = 0; i < proof.length; i++) {
+            bytes32 sibling = proof[i];
+            node = node < sibling
+                ? sha256(abi.encodePacked(bytes1(0x01), node, sibling))
+                : sha256(abi.encodePacked(bytes1(0x01), sibling, node));
+        }
+        return node == roundCommits[round].root;
+    }
+
     function getModels() public view returns (Model[] memory) {
         return models;
     }
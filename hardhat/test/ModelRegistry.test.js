@@ -17,4 +17,24 @@ describe("ModelRegistry", function () {
     expect(models.length).to.equal(1);
     expect(models[0].cid).to.equal("QmTestCID123");
   });
+
+  it("should commit a round root and verify inclusion", async function () {
+    const leaf = (round, clientId, cid) =>
+      ethers.utils.sha256(
+        ethers.utils.solidityPack(
+          ["bytes1", "uint64", "uint16", "string", "string"],
+          ["0x00", round, ethers.utils.toUtf8Bytes(clientId).length, clientId, cid]
+        )
+      );
+    const a = leaf(1, "client-a", "QmA");
+    const b = leaf(1, "client-b", "QmB");
+    const [lo, hi] = a < b ? [a, b] : [b, a];
+    const root = ethers.utils.sha256(ethers.utils.solidityPack(["bytes1", "bytes32", "bytes32"], ["0x01", lo, hi]));
+
+    await modelRegistry.commitRound(1, root, 2);
+    expect(await modelRegistry.verifyUpdate(1, "client-a", "QmA", [b])).to.equal(true);
+    expect(await modelRegistry.verifyUpdate(1, "client-b", "QmB", [a])).to.equal(true);
+    expect(await modelRegistry.verifyUpdate(1, "client-b", "QmX", [a])).to.equal(false);
+    await expect(modelRegistry.commitRound(1, root, 2)).to.be.revertedWith("Round already committed");
+  });
 });
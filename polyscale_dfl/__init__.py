@@ -0,0 +1,19 @@
+"""PolyScale-FL: Decentralized Federated Learning Framework"""
+import importlib
+
+__version__ = "1.0.0"
+
+# Subpackages pull in torch, torchvision, web3, cryptography, ... so they are
+# only imported when first accessed (PEP 562)
+_SUBPACKAGES = ("aggregator", "chain", "client", "datasets", "ipfs", "models",
+                "networking", "secure_agg", "simulation", "training", "utils")
+
+def __getattr__(name):
+    if name in _SUBPACKAGES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_SUBPACKAGES))
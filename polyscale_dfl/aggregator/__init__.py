@@ -0,0 +1,23 @@
+"""PolyScale-FL Aggregator Module"""
+import importlib
+
+_EXPORTS = {
+    "AggregatorNode":    ".aggregator_node",
+    "fed_avg":           ".model_avg",
+    "robust_aggregate":  ".robust",
+    "AGGREGATION_RULES": ".robust",
+    "RoundScheduler":    ".scheduler",
+    "ModelVersioning":   ".versioning",
+    "EvaluationMetrics": ".metrics",
+}
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
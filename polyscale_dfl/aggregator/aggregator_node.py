@@ -1,23 +1,62 @@
 import torch
-from .model_avg import fed_avg
+if "." in __package__:
+    from ..utils.logging_utils import get_logger
+    from ..utils.telemetry import SIZE_BUCKETS, get_telemetry
+else:
+    from utils.logging_utils import get_logger
+    from utils.telemetry import SIZE_BUCKETS, get_telemetry
+from .robust import robust_aggregate
 from .metrics import EvaluationMetrics
 
+logger = get_logger(__name__)
+
 class AggregatorNode:
-    def __init__(self, model, clients, test_loader=None):
+    def __init__(self, model, clients, test_loader=None, rule="mean", rule_kwargs=None):
+        """
+        rule: "mean" (FedAvg) or a robust rule from aggregator.robust.AGGREGATION_RULES
+              ("median", "trimmed_mean", "krum", "multi_krum", "geometric_median")
+        rule_kwargs: options for the rule, e.g. {"trim_ratio": 0.2} or {"num_byzantine": 2}
+        """
         self.global_model = model
         self.clients = clients
         self.test_loader = test_loader
         self.metrics = EvaluationMetrics()
+        self.rule = rule
+        self.rule_kwargs = rule_kwargs or {}
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         self.global_model.to(self.device)
+        telemetry = get_telemetry()
+        self._updates_total = telemetry.counter("aggregator_updates_total", "Client updates aggregated")
+        self._update_bytes = telemetry.histogram("update_size_bytes", "Size of one client update", SIZE_BUCKETS)
+        self._telemetry = telemetry
 
-    def aggregate_round(self, client_updates):
+    def aggregate(self, client_updates):
         """
-        Perform aggregation of client updates using FedAvg
+        Aggregate client updates with the configured rule into the global model.
+        Keys missing from (partial) updates keep their current global values.
         """
-        self.global_model.load_state_dict(fed_avg(client_updates))
+        for update in client_updates:
+            self._update_bytes.observe(sum(t.numel() * t.element_size() for t in update.values()))
+        self._updates_total.inc(len(client_updates), rule=self.rule)
+        with self._telemetry.span("aggregate", rule=self.rule):
+            aggregated = robust_aggregate(client_updates, self.rule, **self.rule_kwargs)
+            # Check before loading so a bad update leaves the global model untouched
+            unknown = sorted(set(aggregated) - set(self.global_model.state_dict()))
+            if unknown:
+                raise KeyError(f"Updates contain unknown keys: {unknown}")
+            self.global_model.load_state_dict(aggregated, strict=False)
+
+    def evaluate(self):
         if self.test_loader:
-            acc = self.metrics.evaluate(self.global_model, self.test_loader, self.device)
-            print(f"Round accuracy: {acc:.4f}")
-            return acc
+            return self.metrics.evaluate(self.global_model, self.test_loader, self.device)
         return None
+
+    def aggregate_round(self, client_updates):
+        """
+        Perform aggregation of client updates and evaluate the new global model
+        """
+        self.aggregate(client_updates)
+        acc = self.evaluate()
+        if acc is not None:
+            logger.info("Round accuracy: %.4f", acc)
+        return acc
@@ -1,6 +0,0 @@
-"""PolyScale-FL Aggregator Module"""
-from .aggregator_node import AggregatorNode
-from .model_avg import fed_avg
-from .scheduler import RoundScheduler
-from .versioning import ModelVersioning
-from .metrics import EvaluationMetrics
@@ -3,9 +3,11 @@ import torch
 def fed_avg(updates: list):
     """
     Federated averaging of client weight updates
-    updates: list of state_dict dictionaries from clients
+    updates: list of state_dict dictionaries from clients. Partial updates may
+    carry only some keys; each key is averaged over the clients that sent it.
     """
-    avg_update = {}
-    for k in updates[0].keys():
-        avg_update[k] = sum([u[k] for u in updates]) / len(updates)
-    return avg_update
+    by_key = {}
+    for u in updates:
+        for k, v in u.items():
+            by_key.setdefault(k, []).append(v)
+    return {k: sum(vs) / len(vs) for k, vs in by_key.items()}
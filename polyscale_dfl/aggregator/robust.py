@@ -0,0 +1,131 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+from .model_avg import fed_avg
+
+def stack_updates(updates, keys):
+    """
+    Copy the given keys of every update into one float32 [N, P] matrix.
+    Returns the matrix and the layout needed to turn a row back into a state_dict.
+    """
+    first = updates[0]
+    layout = [(k, first[k].shape, first[k].dtype, first[k].numel()) for k in keys]
+    total = sum(numel for *_, numel in layout)
+    matrix = torch.empty(len(updates), total, dtype=torch.float32, device=first[keys[0]].device)
+    for i, update in enumerate(updates):
+        offset = 0
+        for k, _, _, numel in layout:
+            matrix[i, offset:offset + numel] = update[k].reshape(-1)
+            offset += numel
+    return matrix, layout
+
+def unstack_update(vector, layout):
+    result = {}
+    offset = 0
+    for k, shape, dtype, numel in layout:
+        value = vector[offset:offset + numel].reshape(shape)
+        if not dtype.is_floating_point:
+            value = value.round()
+        result[k] = value.to(dtype)
+        offset += numel
+    return result
+
+def _map_columns(fn, matrix, chunk_size, num_workers):
+    """Apply a column-wise reduction [N, c] -> [c] chunk by chunk so temporaries stay O(N * chunk_size)"""
+    out = torch.empty(matrix.shape[1], dtype=matrix.dtype, device=matrix.device)
+
+    def run(start):
+        end = min(start + chunk_size, matrix.shape[1])
+        out[start:end] = fn(matrix[:, start:end])
+
+    starts = range(0, matrix.shape[1], chunk_size)
+    if num_workers > 1:
+        # torch kernels release the GIL, so threads process chunks in parallel
+        with ThreadPoolExecutor(num_workers) as pool:
+            list(pool.map(run, starts))
+    else:
+        for start in starts:
+            run(start)
+    return out
+
+def coordinate_median(matrix, chunk_size=65536, num_workers=1):
+    n = matrix.shape[0]
+
+    def median(chunk):
+        ordered = chunk.sort(dim=0).values
+        if n % 2:
+            return ordered[n // 2]
+        return (ordered[n // 2 - 1] + ordered[n // 2]) / 2
+
+    return _map_columns(median, matrix, chunk_size, num_workers)
+
+def trimmed_mean(matrix, trim_ratio=0.1, chunk_size=65536, num_workers=1):
+    """Drop the `trim_ratio` largest and smallest values of each coordinate, average the rest"""
+    n = matrix.shape[0]
+    k = int(trim_ratio * n)
+    if 2 * k >= n:
+        raise ValueError(f"trim_ratio {trim_ratio} leaves no values for {n} updates")
+    return _map_columns(lambda chunk: chunk.sort(dim=0).values[k:n - k].mean(dim=0),
+                        matrix, chunk_size, num_workers)
+
+def krum_scores(matrix, num_byzantine=0):
+    """Krum score per update: sum of squared distances to its n - f - 2 nearest neighbours"""
+    n = matrix.shape[0]
+    distances = torch.cdist(matrix, matrix).pow_(2)
+    distances.fill_diagonal_(float("inf"))
+    neighbours = max(1, n - num_byzantine - 2)
+    return distances.topk(neighbours, dim=1, largest=False).values.sum(dim=1)
+
+def krum(matrix, num_byzantine=0, num_selected=1):
+    """(Multi-)Krum: average of the `num_selected` updates with the lowest Krum scores"""
+    selected = krum_scores(matrix, num_byzantine).topk(num_selected, largest=False).indices
+    return matrix[selected].mean(dim=0)
+
+def multi_krum(matrix, num_byzantine=0, num_selected=None):
+    if num_selected is None:
+        num_selected = max(1, matrix.shape[0] - num_byzantine)
+    return krum(matrix, num_byzantine, num_selected)
+
+def geometric_median(matrix, max_iter=100, tol=1e-6, eps=1e-8, chunk_size=65536):
+    """Weiszfeld iterations starting from the mean; distances are accumulated chunk by chunk"""
+    median = matrix.mean(dim=0)
+    for _ in range(max_iter):
+        sq_dist = torch.zeros(matrix.shape[0], dtype=matrix.dtype, device=matrix.device)
+        for start in range(0, matrix.shape[1], chunk_size):
+            end = start + chunk_size
+            sq_dist += (matrix[:, start:end] - median[start:end]).pow_(2).sum(dim=1)
+        weights = 1.0 / sq_dist.sqrt_().clamp_(min=eps)
+        updated = weights @ matrix / weights.sum()
+        shift = torch.linalg.vector_norm(updated - median)
+        median = updated
+        if shift <= tol * torch.linalg.vector_norm(median).clamp(min=eps):
+            break
+    return median
+
+AGGREGATION_RULES = {
+    "median": coordinate_median,
+    "trimmed_mean": trimmed_mean,
+    "krum": krum,
+    "multi_krum": multi_krum,
+    "geometric_median": geometric_median,
+}
+
+def robust_aggregate(updates: list, rule="mean", **kwargs):
+    """
+    Aggregate client state_dicts with one of AGGREGATION_RULES (or "mean" for fed_avg).
+    The rule runs on the keys every client sent; keys only some (partial)
+    clients sent are averaged over those clients.
+    """
+    if rule == "mean":
+        return fed_avg(updates)
+    if rule not in AGGREGATION_RULES:
+        raise ValueError(f"Unknown aggregation rule {rule!r}, expected mean or one of {list(AGGREGATION_RULES)}")
+    common = [k for k in updates[0] if all(k in u for u in updates)]
+    result = {}
+    if common:
+        matrix, layout = stack_updates(updates, common)
+        result = unstack_update(AGGREGATION_RULES[rule](matrix, **kwargs), layout)
+    rest = [{k: v for k, v in u.items() if k not in result} for u in updates]
+    result.update(fed_avg(rest))
+    return result
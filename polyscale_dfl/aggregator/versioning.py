@@ -1,15 +1,29 @@
 class ModelVersioning:
     """
-    Track different versions of the global model
+    Track different versions of the global model.
+    Versions saved with partial=True hold only the keys that changed that round;
+    get_version rebuilds full weights from the latest full version before it.
     """
     def __init__(self):
         self.versions = []
+        self.index = {}
 
-    def save_version(self, round_number, state_dict):
-        self.versions.append({"round": round_number, "weights": state_dict.copy()})
+    def save_version(self, round_number, state_dict, partial=False):
+        self.index[round_number] = len(self.versions)
+        self.versions.append({"round": round_number, "weights": state_dict.copy(), "partial": partial})
 
     def get_version(self, round_number):
-        for v in self.versions:
-            if v["round"] == round_number:
-                return v["weights"]
-        return None
+        i = self.index.get(round_number)
+        if i is None:
+            return None
+        if not self.versions[i]["partial"]:
+            return self.versions[i]["weights"]
+        start = i
+        while start > 0 and self.versions[start]["partial"]:
+            start -= 1
+        if self.versions[start]["partial"]:
+            raise ValueError(f"Round {round_number} has no full version to rebuild its partial updates on")
+        weights = {}
+        for v in self.versions[start:i + 1]:
+            weights.update(v["weights"])
+        return weights
@@ -0,0 +1,28 @@
+"""PolyScale-FL Blockchain Module"""
+import importlib
+
+_EXPORTS = {
+    "FLContractStub":   ".chain_stub",
+    "Web3Client":       ".web3_client",
+    "AsyncWeb3Client":  ".async_web3_client",
+    "encode_update_tx": ".tx_encoder",
+    "EventListener":    ".events",
+    "AsyncEventBus":    ".events",
+    "UpdateLedger":     ".ledger",
+    "CommitBatcher":    ".batcher",
+    "verify_update":    ".batcher",
+    "MerkleTree":       ".merkle",
+    "LocalChain":       ".local_chain",
+    "LocalRPCServer":   ".local_chain",
+}
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,168 @@
+import asyncio
+import itertools
+
+from .tx_encoder import encode_commit_round_call
+
+class RPCError(Exception):
+    def __init__(self, code, message):
+        super().__init__(f"JSON-RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+
+class NonceManager:
+    """
+    Hands out nonces locally so several transactions from one account can be
+    in flight at once. The chain is asked once per account (pending count);
+    call reset() after any failed send to resynchronise, otherwise the
+    unsent nonce leaves a gap that every later transaction waits behind.
+    """
+    def __init__(self, fetch_nonce):
+        self.fetch_nonce = fetch_nonce
+        self.next_nonce = {}
+        self.locks = {}
+
+    async def next(self, address: str):
+        lock = self.locks.setdefault(address, asyncio.Lock())
+        async with lock:
+            if address not in self.next_nonce:
+                self.next_nonce[address] = await self.fetch_nonce(address)
+            nonce = self.next_nonce[address]
+            self.next_nonce[address] = nonce + 1
+            return nonce
+
+    def reset(self, address: str):
+        self.next_nonce.pop(address, None)
+
+class AsyncWeb3Client:
+    """
+    asyncio JSON-RPC client for Ethereum-compatible nodes.
+    Uses one pooled aiohttp session (created on first request), a local
+    nonce manager so transactions are pipelined rather than sent one by one,
+    and JSON-RPC batch requests for receipt polling and balance queries.
+    """
+    def __init__(self, rpc_url="http://127.0.0.1:8545", account=None, registry_address=None,
+                 max_connections=32, timeout=30.0):
+        self.rpc_url = rpc_url
+        self.account = account
+        self.registry_address = registry_address
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.nonces = NonceManager(self.get_transaction_count)
+        self._session = None
+        self._ids = itertools.count(1)
+
+    async def _get_session(self):
+        if self._session is None:
+            try:
+                import aiohttp
+            except ImportError as e:
+                raise ImportError("AsyncWeb3Client requires aiohttp: pip install decentralized-federated-learning[chain]") from e
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def _post(self, payload):
+        session = await self._get_session()
+        async with session.post(self.rpc_url, json=payload) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    @staticmethod
+    def _result(response):
+        if "error" in response:
+            raise RPCError(response["error"].get("code"), response["error"].get("message"))
+        return response["result"]
+
+    async def request(self, method: str, params=None):
+        response = await self._post({"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": params or []})
+        return self._result(response)
+
+    async def batch_request(self, calls):
+        """Send [(method, params), ...] as one JSON-RPC batch; results come back in call order"""
+        if not calls:
+            return []
+        payload = [{"jsonrpc": "2.0", "id": next(self._ids), "method": m, "params": p} for m, p in calls]
+        responses = {r["id"]: r for r in await self._post(payload)}
+        return [self._result(responses[call["id"]]) for call in payload]
+
+    async def get_accounts(self):
+        return await self.request("eth_accounts")
+
+    async def get_transaction_count(self, address: str):
+        return int(await self.request("eth_getTransactionCount", [address, "pending"]), 16)
+
+    async def get_balance(self, address: str):
+        return int(await self.request("eth_getBalance", [address, "latest"]), 16)
+
+    async def get_balances(self, addresses):
+        results = await self.batch_request([("eth_getBalance", [a, "latest"]) for a in addresses])
+        return {a: int(r, 16) for a, r in zip(addresses, results)}
+
+    async def _sender(self, tx):
+        if "from" in tx:
+            return tx["from"]
+        if self.account is None:
+            self.account = (await self.get_accounts())[0]
+        return self.account
+
+    async def _send_with_nonce(self, sender, tx):
+        tx = {**tx, "from": sender, "nonce": hex(await self.nonces.next(sender))}
+        try:
+            return await self.request("eth_sendTransaction", [tx])
+        except Exception:
+            # The nonce may never have reached the node; the next one handed out fills the gap
+            self.nonces.reset(sender)
+            raise
+
+    async def send_transaction(self, tx: dict):
+        sender = await self._sender(tx)
+        try:
+            return await self._send_with_nonce(sender, tx)
+        except RPCError as e:
+            if "nonce" not in e.message.lower():
+                raise
+            # Someone else used this account: retry once with a resynced nonce
+            return await self._send_with_nonce(sender, tx)
+
+    async def send_transactions(self, txs):
+        """Pipeline several transactions; hashes come back in input order"""
+        return await asyncio.gather(*(self.send_transaction(tx) for tx in txs))
+
+    async def wait_for_receipts(self, tx_hashes, poll_interval=0.1, timeout=120.0):
+        """Poll all outstanding receipts with one batch request per interval"""
+        receipts = {}
+        pending = list(tx_hashes)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while pending:
+            results = await self.batch_request([("eth_getTransactionReceipt", [h]) for h in pending])
+            for tx_hash, receipt in zip(pending, results):
+                if receipt is not None:
+                    receipts[tx_hash] = receipt
+            pending = [h for h in pending if h not in receipts]
+            if pending:
+                if loop.time() > deadline:
+                    raise TimeoutError(f"{len(pending)} transaction receipts still pending")
+                await asyncio.sleep(poll_interval)
+        return [receipts[h] for h in tx_hashes]
+
+    async def commit_batch(self, round_number: int, root: bytes, count: int):
+        """Call ModelRegistry.commitRound(round, root, count)"""
+        if self.registry_address is None:
+            # A transaction without "to" would deploy a contract instead
+            raise ValueError("registry_address is not set")
+        data = encode_commit_round_call(round_number, root, count)
+        return await self.send_transaction({"to": self.registry_address, "data": "0x" + data.hex()})
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -0,0 +1,48 @@
+from .merkle import MerkleTree, verify_proof
+from .tx_encoder import encode_update_leaf
+
+class CommitBatcher:
+    """
+    Collect a round's update CIDs and commit only their Merkle root.
+    `contract` is any backend exposing commit_batch(round_number, root, count),
+    e.g. FLContractStub or LocalChain.
+    """
+    def __init__(self, contract):
+        self.contract = contract
+        self.pending = {}
+        self.receipts = {}
+
+    def add(self, client_id, round_number: int, cid: str):
+        """Queue one update; a client can only have one leaf (and one proof) per round"""
+        updates = self.pending.setdefault(round_number, {})
+        if client_id in updates:
+            raise ValueError(f"Client {client_id!r} already has an update pending for round {round_number}")
+        updates[client_id] = cid
+
+    def flush(self, round_number: int):
+        """Commit all pending updates of a round; returns the round receipt with per-client proofs"""
+        updates = list(self.pending.pop(round_number, {}).items())
+        if not updates:
+            return None
+        tree = MerkleTree([encode_update_leaf(c, round_number, cid) for c, cid in updates])
+        tx_hash = self.contract.commit_batch(round_number, tree.root, len(tree))
+        receipt = {
+            "round": round_number,
+            "root": tree.root,
+            "count": len(tree),
+            "tx_hash": tx_hash,
+            "proofs": {client_id: {"cid": cid, "proof": tree.proof(i)}
+                       for i, (client_id, cid) in enumerate(updates)},
+        }
+        self.receipts[round_number] = receipt
+        return receipt
+
+    def get_proof(self, round_number: int, client_id):
+        receipt = self.receipts.get(round_number)
+        if receipt is None:
+            return None
+        return receipt["proofs"].get(client_id)
+
+def verify_update(client_id, round_number: int, cid: str, proof, root: bytes):
+    """Client-side check that (client_id, round, cid) is included under a committed root"""
+    return verify_proof(encode_update_leaf(client_id, round_number, cid), proof, root)
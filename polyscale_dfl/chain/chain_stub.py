@@ -1,15 +1,79 @@
+from .ledger import UpdateLedger
+from .tx_encoder import encode_batch_tx, estimate_gas
+
 class FLContractStub:
     """
     Simple stub for FL blockchain contract interactions.
     Simulates committing updates and retrieving history.
+    Updates are kept in an indexed UpdateLedger and batch roots in a second
+    one keyed by the hex root (pass `ledger_path` to persist both; batches go
+    to `<ledger_path>.batches`). Reopening restores batches, tx_count and
+    gas_used. An optional event bus is notified of every commit.
     """
-    def __init__(self):
-        self.update_history = []
+    def __init__(self, ledger_path=None, event_bus=None):
+        self.ledger = UpdateLedger(ledger_path)
+        self.batch_ledger = UpdateLedger(ledger_path + ".batches" if ledger_path else None)
+        self.event_bus = event_bus
+        self.batches = {}
+        self.gas_used = sum(estimate_gas(r["cid"].encode()) for r in self.ledger.records)
+        for record in self.batch_ledger.records:
+            batch = {"root": bytes.fromhex(record["cid"]), "count": record["count"], "tx_hash": record["tx_hash"]}
+            self.batches[record["round"]] = batch
+            self.gas_used += estimate_gas(encode_batch_tx(record["round"], batch["root"], batch["count"]))
+        self.tx_count = len(self.ledger) + len(self.batch_ledger)
+
+    @property
+    def update_history(self):
+        return self.ledger.records
+
+    def _next_tx(self, payload: bytes):
+        self.tx_count += 1
+        self.gas_used += estimate_gas(payload)
+        return f"tx_{self.tx_count}"
+
+    def _publish(self, topic, data):
+        if self.event_bus is not None:
+            self.event_bus.publish(topic, data)
+
+    def commit_update(self, cid: str, client_id=None, round_number=None):
+        tx_hash = self._next_tx(cid.encode())
+        record = {"cid": cid, "tx_hash": tx_hash, "client_id": client_id, "round": round_number}
+        self.ledger.append(record)
+        self._publish("UpdateCommitted", record)
+        return tx_hash
 
-    def commit_update(self, cid: str):
-        tx_hash = f"tx_{len(self.update_history)+1}"
-        self.update_history.append({"cid": cid, "tx_hash": tx_hash})
+    def commit_batch(self, round_number: int, root: bytes, count: int):
+        """Commit the Merkle root of a whole round's updates in one transaction"""
+        if round_number in self.batches:
+            raise ValueError(f"Round {round_number} already committed")
+        tx_hash = self._next_tx(encode_batch_tx(round_number, root, count))
+        self.batches[round_number] = {"root": root, "count": count, "tx_hash": tx_hash}
+        self.batch_ledger.append({"cid": root.hex(), "round": round_number, "count": count, "tx_hash": tx_hash})
+        self._publish("BatchCommitted", {"round": round_number, **self.batches[round_number]})
         return tx_hash
 
+    def close(self):
+        self.ledger.close()
+        self.batch_ledger.close()
+
+    def get_batch_root(self, round_number: int):
+        batch = self.batches.get(round_number)
+        return batch["root"] if batch else None
+
+    def get_update(self, cid: str):
+        return self.ledger.get(cid)
+
+    def get_updates(self, round_number=None, client_id=None):
+        if round_number is not None and client_id is not None:
+            return [u for u in self.ledger.get_round(round_number) if u["client_id"] == client_id]
+        if round_number is not None:
+            return self.ledger.get_round(round_number)
+        if client_id is not None:
+            return self.ledger.get_client(client_id)
+        return list(self.ledger.records)
+
+    def get_updates_in_rounds(self, start: int, end: int):
+        return self.ledger.get_round_range(start, end)
+
     def get_update_history(self):
-        return [u["cid"] for u in self.update_history]
+        return list(self.ledger.cids)
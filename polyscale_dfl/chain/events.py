@@ -1,3 +1,9 @@
+import logging
+import queue
+import threading
+
+logger = logging.getLogger(__name__)
+
 class EventListener:
     """
     Simulated blockchain event listener for FL updates
@@ -11,3 +17,101 @@ class EventListener:
     def trigger_event(self, event_type, data):
         for callback in self.listeners:
             callback(event_type, data)
+
+class Subscription:
+    """
+    One subscriber of an AsyncEventBus with its own queue and delivery thread.
+    """
+    def __init__(self, callback, topics=None, batched=False, max_batch=100, max_queue=0):
+        self.callback = callback
+        self.topics = set(topics) if topics else None
+        self.batched = batched
+        self.max_batch = max_batch
+        self.queue = queue.Queue(max_queue)
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def accepts(self, topic):
+        return self.topics is None or topic in self.topics
+
+    def offer(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except queue.Full:
+            self.dropped += 1
+
+    def _deliver(self, events):
+        try:
+            if self.batched:
+                self.callback(events)
+            else:
+                for topic, data in events:
+                    self.callback(topic, data)
+        except Exception:
+            logger.exception("Event listener %r failed", self.callback)
+
+    def _run(self):
+        while True:
+            event = self.queue.get()
+            if event is None:
+                self.queue.task_done()
+                return
+            events = [event]
+            stop = False
+            while len(events) < self.max_batch:
+                try:
+                    event = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if event is None:
+                    stop = True
+                    break
+                events.append(event)
+            self._deliver(events)
+            for _ in range(len(events) + stop):
+                self.queue.task_done()
+            if stop:
+                return
+
+    def close(self):
+        self.queue.put(None)
+        self._thread.join()
+
+class AsyncEventBus:
+    """
+    Event bus that never runs listeners on the publisher's thread.
+    Each subscriber only receives its topics, gets events in batches when
+    `batched=True`, and a full bounded queue drops events instead of
+    blocking the publisher.
+    """
+    def __init__(self):
+        self.subscriptions = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback, topics=None, batched=False, max_batch=100, max_queue=0):
+        subscription = Subscription(callback, topics, batched, max_batch, max_queue)
+        with self._lock:
+            self.subscriptions = self.subscriptions + [subscription]
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self.subscriptions = [s for s in self.subscriptions if s is not subscription]
+        subscription.close()
+
+    def publish(self, topic, data):
+        for subscription in self.subscriptions:
+            if subscription.accepts(topic):
+                subscription.offer((topic, data))
+
+    def flush(self):
+        """Block until every published event has been delivered"""
+        for subscription in self.subscriptions:
+            subscription.queue.join()
+
+    def close(self):
+        with self._lock:
+            subscriptions, self.subscriptions = self.subscriptions, []
+        for subscription in subscriptions:
+            subscription.close()
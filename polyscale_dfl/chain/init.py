@@ -1,5 +0,0 @@
-"""PolyScale-FL Blockchain Module"""
-from .chain_stub import FLContractStub
-from .web3_client import Web3Client
-from .tx_encoder import encode_update_tx
-from .events import EventListener
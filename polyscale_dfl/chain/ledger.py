@@ -0,0 +1,108 @@
+import bisect
+import glob
+import json
+import os
+
+class UpdateLedger:
+    """
+    Append-only ledger of committed updates with O(1) lookups by CID, round
+    and client, and range queries over rounds.
+    If `path` is given, every record is appended to `<path>.log` (JSON lines).
+    Every `segment_size` records the log is sealed by renaming it to
+    `<path>.segment.<count>` and a new log is started, so persisting never
+    rewrites earlier records. Reopening replays the segments, then the log.
+    """
+    def __init__(self, path=None, segment_size=1000):
+        self.path = path
+        self.segment_size = segment_size
+        self.records = []
+        self.cids = []
+        self.by_cid = {}
+        self.by_round = {}
+        self.by_client = {}
+        self.rounds = []
+        self._log = None
+        self._log_records = 0
+        if path:
+            self._load()
+            self._log = open(path + ".log", "a")
+
+    def __len__(self):
+        return len(self.records)
+
+    def _index(self, record):
+        seq = len(self.records)
+        self.records.append(record)
+        self.cids.append(record["cid"])
+        self.by_cid[record["cid"]] = seq
+        round_number = record.get("round")
+        if round_number is not None:
+            if round_number not in self.by_round:
+                self.by_round[round_number] = []
+                bisect.insort(self.rounds, round_number)
+            self.by_round[round_number].append(seq)
+        client_id = record.get("client_id")
+        if client_id is not None:
+            self.by_client.setdefault(client_id, []).append(seq)
+
+    def _replay(self, path):
+        """Index the records of a log or segment file; returns how many were new"""
+        added = 0
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                # A crash between sealing and reopening can leave records in both files
+                if entry.pop("seq") >= len(self.records):
+                    self._index(entry)
+                    added += 1
+        return added
+
+    def _load(self):
+        # Segment names carry a zero-padded record count, so they sort in order
+        for segment in sorted(glob.glob(glob.escape(self.path) + ".segment.*")):
+            self._replay(segment)
+        if os.path.exists(self.path + ".log"):
+            self._log_records = self._replay(self.path + ".log")
+
+    def append(self, record: dict):
+        seq = len(self.records)
+        self._index(record)
+        if self._log is not None:
+            self._log.write(json.dumps({"seq": seq, **record}, separators=(",", ":")) + "\n")
+            self._log.flush()
+            self._log_records += 1
+            if self._log_records >= self.segment_size:
+                self.seal_segment()
+        return seq
+
+    def seal_segment(self):
+        """Close the current log as an immutable segment and start a new one (O(1))"""
+        if self._log is None or not self._log_records:
+            return
+        self._log.close()
+        os.replace(self.path + ".log", f"{self.path}.segment.{len(self.records):012d}")
+        self._log = open(self.path + ".log", "a")
+        self._log_records = 0
+
+    def close(self):
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+
+    def get(self, cid: str):
+        seq = self.by_cid.get(cid)
+        return None if seq is None else self.records[seq]
+
+    def get_round(self, round_number: int):
+        return [self.records[i] for i in self.by_round.get(round_number, [])]
+
+    def get_client(self, client_id):
+        return [self.records[i] for i in self.by_client.get(client_id, [])]
+
+    def get_round_range(self, start: int, end: int):
+        """Records of all rounds in [start, end], ordered by round"""
+        lo = bisect.bisect_left(self.rounds, start)
+        hi = bisect.bisect_right(self.rounds, end)
+        return [self.records[i] for r in self.rounds[lo:hi] for i in self.by_round[r]]
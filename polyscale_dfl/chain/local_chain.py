@@ -0,0 +1,193 @@
+import hashlib
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .tx_encoder import encode_batch_tx, estimate_gas
+
+class LocalChain:
+    """
+    In-process stand-in for a Hardhat node: funded accounts, nonces,
+    auto-mining (one block per transaction), a pool for future-nonce
+    transactions and receipts with gasUsed.
+    Addresses, hashes and calldata are 0x-prefixed hex strings as in JSON-RPC.
+    """
+    REGISTRY_ADDRESS = "0x" + "5f" * 20
+
+    def __init__(self, num_accounts=10, balance=10**22, gas_price=10**9):
+        self.accounts = [f"0x{i + 1:040x}" for i in range(num_accounts)]
+        self.balances = {a: balance for a in self.accounts}
+        self.nonces = {a: 0 for a in self.accounts}
+        self.gas_price = gas_price
+        self.receipts = {}
+        self.pool = {}
+        self.block_number = 0
+        self.gas_used = 0
+        self._counter = itertools.count()
+
+    def get_balance(self, address: str):
+        return self.balances.get(address, 0)
+
+    def get_transaction_count(self, address: str, block="latest"):
+        """
+        Mined count, or for "pending" the next nonce after the pooled
+        transactions that directly follow it; as in geth/Hardhat, pooled
+        transactions behind a nonce gap are not counted, so the gap is
+        what gets handed out next.
+        """
+        count = self.nonces.get(address, 0)
+        if block == "pending":
+            queued = self.pool.get(address, {})
+            while count in queued:
+                count += 1
+        return count
+
+    def send_transaction(self, tx: dict):
+        """
+        Mine `tx` if its nonce is next for the sender. Like a real node, a
+        transaction with a future nonce waits in the pool (no receipt yet)
+        until the gap is filled; a used nonce, or one already waiting in the
+        pool, is rejected.
+        """
+        sender = tx.get("from", self.accounts[0])
+        expected = self.nonces.get(sender, 0)
+        nonce = int(tx.get("nonce", expected))
+        if nonce < expected:
+            raise ValueError(f"Nonce too low for {sender}: expected {expected}, got {nonce}")
+        tx_hash = "0x" + hashlib.sha256(f"{sender}:{nonce}:{next(self._counter)}:{tx.get('data', '')}".encode()).hexdigest()
+        queued = self.pool.setdefault(sender, {})
+        if nonce in queued:
+            raise ValueError(f"Nonce {nonce} already pending for {sender}")
+        queued[nonce] = (tx_hash, tx)
+        while expected in queued:
+            self._mine(sender, *queued.pop(expected))
+            expected += 1
+        return tx_hash
+
+    def _mine(self, sender, tx_hash, tx):
+        data = bytes.fromhex(tx.get("data", "0x")[2:])
+        gas = estimate_gas(data)
+        cost = gas * self.gas_price + int(tx.get("value", 0))
+        status = 1
+        if self.balances.get(sender, 0) < cost:
+            status = 0
+        else:
+            self.balances[sender] -= cost
+        self.nonces[sender] = self.nonces.get(sender, 0) + 1
+        self.block_number += 1
+        self.gas_used += gas
+        self.receipts[tx_hash] = {
+            "transactionHash": tx_hash,
+            "from": sender,
+            "to": tx.get("to"),
+            "blockNumber": self.block_number,
+            "gasUsed": gas,
+            "status": status,
+        }
+
+    def get_transaction_receipt(self, tx_hash: str):
+        return self.receipts.get(tx_hash)
+
+    @property
+    def tx_count(self):
+        return len(self.receipts)
+
+    def commit_update(self, cid: str, sender=None):
+        return self.send_transaction({"from": sender or self.accounts[0], "to": self.REGISTRY_ADDRESS,
+                                      "data": "0x" + cid.encode().hex()})
+
+    def commit_batch(self, round_number: int, root: bytes, count: int, sender=None):
+        data = encode_batch_tx(round_number, root, count)
+        return self.send_transaction({"from": sender or self.accounts[0], "to": self.REGISTRY_ADDRESS,
+                                      "data": "0x" + data.hex()})
+
+class _RPCHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Pipelining clients open many connections at once; the default backlog of 5 drops SYNs
+    request_queue_size = 128
+
+class LocalRPCServer:
+    """
+    Serve a LocalChain over HTTP JSON-RPC (including batch requests) on localhost,
+    for exercising Web3Client/AsyncWeb3Client without a Hardhat node.
+    `latency` adds a fixed delay per HTTP request to mimic a remote node.
+    """
+    def __init__(self, chain=None, host="127.0.0.1", port=0, latency=0.0):
+        self.chain = chain or LocalChain()
+        self.latency = latency
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if server.latency:
+                    time.sleep(server.latency)
+                payload = json.loads(body)
+                if isinstance(payload, list):
+                    response = [server.handle(call) for call in payload]
+                else:
+                    response = server.handle(payload)
+                data = json.dumps(response).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = _RPCHTTPServer((host, port), Handler)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def handle(self, call):
+        try:
+            with self._lock:
+                result = self._dispatch(call["method"], call.get("params", []))
+            return {"jsonrpc": "2.0", "id": call.get("id"), "result": result}
+        except Exception as e:
+            return {"jsonrpc": "2.0", "id": call.get("id"), "error": {"code": -32000, "message": str(e)}}
+
+    def _dispatch(self, method, params):
+        chain = self.chain
+        if method == "eth_chainId":
+            return hex(31337)
+        if method == "eth_accounts":
+            return chain.accounts
+        if method == "eth_blockNumber":
+            return hex(chain.block_number)
+        if method == "eth_getBalance":
+            return hex(chain.get_balance(params[0]))
+        if method == "eth_getTransactionCount":
+            return hex(chain.get_transaction_count(*params[:2]))
+        if method == "eth_sendTransaction":
+            tx = {k: int(v, 16) if k in ("nonce", "value") and isinstance(v, str) else v
+                  for k, v in params[0].items()}
+            return chain.send_transaction(tx)
+        if method == "eth_getTransactionReceipt":
+            receipt = chain.get_transaction_receipt(params[0])
+            if receipt is None:
+                return None
+            return {**receipt, "blockNumber": hex(receipt["blockNumber"]),
+                    "gasUsed": hex(receipt["gasUsed"]), "status": hex(receipt["status"])}
+        raise ValueError(f"Method {method} not supported")
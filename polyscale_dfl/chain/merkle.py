@@ -0,0 +1,52 @@
+import hashlib
+
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+
+def hash_leaf(data: bytes):
+    return hashlib.sha256(LEAF_PREFIX + data).digest()
+
+def hash_pair(a: bytes, b: bytes):
+    # Pairs are sorted so proofs need no left/right flags
+    if b < a:
+        a, b = b, a
+    return hashlib.sha256(NODE_PREFIX + a + b).digest()
+
+class MerkleTree:
+    """
+    Binary Merkle tree over encoded update leaves.
+    An unpaired node is carried up to the next level unchanged.
+    """
+    def __init__(self, leaves):
+        if not leaves:
+            raise ValueError("MerkleTree needs at least one leaf")
+        self.levels = [[hash_leaf(leaf) for leaf in leaves]]
+        while len(self.levels[-1]) > 1:
+            level = self.levels[-1]
+            parents = [hash_pair(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                parents.append(level[-1])
+            self.levels.append(parents)
+
+    @property
+    def root(self):
+        return self.levels[-1][0]
+
+    def __len__(self):
+        return len(self.levels[0])
+
+    def proof(self, index: int):
+        """Sibling hashes from leaf `index` up to the root"""
+        path = []
+        for level in self.levels[:-1]:
+            sibling = index ^ 1
+            if sibling < len(level):
+                path.append(level[sibling])
+            index //= 2
+        return path
+
+def verify_proof(leaf: bytes, proof, root: bytes):
+    node = hash_leaf(leaf)
+    for sibling in proof:
+        node = hash_pair(node, sibling)
+    return node == root
@@ -1,3 +1,16 @@
+import struct
+
+# Ethereum gas schedule used to cost payloads on the local chain stand-ins
+TX_BASE_GAS = 21000
+CALLDATA_ZERO_GAS = 4
+CALLDATA_NONZERO_GAS = 16
+STORAGE_SLOT_GAS = 20000
+
+BATCH_HEADER = struct.Struct(">QI32s")
+
+# keccak256("commitRound(uint256,bytes32,uint32)")[:4], see hardhat/contracts/ModelRegistry.sol
+COMMIT_ROUND_SELECTOR = bytes.fromhex("ba5873a3")
+
 def encode_update_tx(client_id: str, round_number: int, cid: str):
     """
     Encode a model update as a transaction payload
@@ -7,3 +20,33 @@ def encode_update_tx(client_id: str, round_number: int, cid: str):
         "round": round_number,
         "cid": cid
     }
+
+def encode_update_leaf(client_id: str, round_number: int, cid: str):
+    """
+    Canonical bytes of one update, used as a Merkle leaf:
+    uint64 round | uint16 len(client_id) | client_id | cid
+    """
+    client = str(client_id).encode()
+    return struct.pack(">QH", round_number, len(client)) + client + cid.encode()
+
+def encode_batch_tx(round_number: int, root: bytes, count: int):
+    """
+    Compact calldata committing a whole round: uint64 round | uint32 count | bytes32 root
+    """
+    return BATCH_HEADER.pack(round_number, count, root)
+
+def decode_batch_tx(data: bytes):
+    round_number, count, root = BATCH_HEADER.unpack(data)
+    return {"round": round_number, "count": count, "root": root}
+
+def encode_commit_round_call(round_number: int, root: bytes, count: int):
+    """ABI calldata for ModelRegistry.commitRound(round, root, count)"""
+    return COMMIT_ROUND_SELECTOR + round_number.to_bytes(32, "big") + root + count.to_bytes(32, "big")
+
+def estimate_gas(data: bytes, storage_slots=None):
+    """Intrinsic + calldata gas, plus storing the payload (one slot per 32 bytes by default)"""
+    if storage_slots is None:
+        storage_slots = 1 + (len(data) + 31) // 32
+    zeros = data.count(0)
+    calldata = zeros * CALLDATA_ZERO_GAS + (len(data) - zeros) * CALLDATA_NONZERO_GAS
+    return TX_BASE_GAS + calldata + storage_slots * STORAGE_SLOT_GAS
@@ -1,12 +1,28 @@
-from web3 import Web3
+from .tx_encoder import encode_commit_round_call
 
 class Web3Client:
     """
     Web3 client to interact with Ethereum-compatible blockchain.
+    web3 is imported and the node contacted only on first use.
     """
-    def __init__(self, rpc_url="http://127.0.0.1:8545"):
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
-        assert self.web3.is_connected(), "Cannot connect to blockchain node"
+    def __init__(self, rpc_url="http://127.0.0.1:8545", account=None, registry_address=None):
+        self.rpc_url = rpc_url
+        self.account = account
+        self.registry_address = registry_address
+        self._web3 = None
+
+    @property
+    def web3(self):
+        if self._web3 is None:
+            try:
+                from web3 import Web3
+            except ImportError as e:
+                raise ImportError("Web3Client requires web3: pip install decentralized-federated-learning[chain]") from e
+            web3 = Web3(Web3.HTTPProvider(self.rpc_url))
+            if not web3.is_connected():
+                raise ConnectionError(f"Cannot connect to blockchain node at {self.rpc_url}")
+            self._web3 = web3
+        return self._web3
 
     def get_balance(self, address: str):
         return self.web3.eth.get_balance(address)
@@ -14,3 +30,15 @@ class Web3Client:
     def send_transaction(self, tx):
         tx_hash = self.web3.eth.send_transaction(tx)
         return tx_hash.hex()
+
+    def commit_batch(self, round_number: int, root: bytes, count: int):
+        """Call ModelRegistry.commitRound(round, root, count) with a single transaction"""
+        if self.registry_address is None:
+            # A transaction without "to" would deploy a contract instead
+            raise ValueError("registry_address is not set")
+        data = encode_commit_round_call(round_number, root, count)
+        return self.send_transaction({
+            "from": self.account or self.web3.eth.accounts[0],
+            "to": self.registry_address,
+            "data": "0x" + data.hex(),
+        })
@@ -0,0 +1,24 @@
+"""PolyScale-FL client module"""
+import importlib
+
+_EXPORTS = {
+    "ClientNode":              ".client_node",
+    "train_one_round":         ".trainer",
+    "LocalTrainer":            ".trainer",
+    "apply_dp":                ".dp",
+    "generate_pairwise_masks": ".mpc_masking",
+    "ClientDatasetWrapper":    ".dataset_wrapper",
+    "configure_partial_training": ".partial",
+    "add_lora_adapters":       ".partial",
+}
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,20 +1,30 @@
 import torch
-from .trainer import train_one_round
+from .trainer import LocalTrainer
+from .partial import configure_partial_training
 from .dp import apply_dp
 from .mpc_masking import generate_pairwise_masks
 
 class ClientNode:
-    def __init__(self, id: int, model, train_loader, dp_noise=0.0):
+    def __init__(self, id: int, model, train_loader, dp_noise=0.0, partial=None, **trainer_kwargs):
+        """
+        partial: optional configure_partial_training kwargs, e.g. {"mode": "last_blocks", "n_blocks": 2};
+                 the client then trains and uploads only those parameter groups
+        trainer_kwargs are passed to LocalTrainer (lr, momentum, precision, channels_last, compile, ...)
+        momentum defaults to 0.0 as before, so the optimizer state kept across rounds
+        only carries over once momentum (or optimizer="adam") is set explicitly
+        """
         self.id = id
         self.model = model
         self.train_loader = train_loader
         self.dp_noise = dp_noise
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.update_keys = configure_partial_training(model, **partial) if partial else None
         self.model.to(self.device)
+        self.trainer = LocalTrainer(self.model, self.device, update_keys=self.update_keys, **trainer_kwargs)
 
     def train_one_round(self, epochs=1):
         """Train locally and return weight update"""
-        update = train_one_round(self.model, self.train_loader, epochs, self.device)
+        update = self.trainer.train(self.train_loader, epochs)
         if self.dp_noise > 0.0:
             update = apply_dp(update, self.dp_noise)
         return update
@@ -1,4 +1,4 @@
-from torch.utils.data import DataLoader, Dataset
+from torch.utils.data import DataLoader, Dataset, Subset
 
 class ClientDatasetWrapper:
     """
@@ -6,7 +6,7 @@ class ClientDatasetWrapper:
     """
     def __init__(self, dataset: Dataset, batch_size=32, shuffle=True, sample_size=None):
         if sample_size:
-            self.dataset = torch.utils.data.Subset(dataset, range(sample_size))
+            self.dataset = Subset(dataset, range(sample_size))
         else:
             self.dataset = dataset
         self.loader = DataLoader(self.dataset, batch_size=batch_size, shuffle=shuffle)
@@ -1,6 +0,0 @@
-"""PolyScale-FL client module"""
-from .client_node import ClientNode
-from .trainer import train_one_round
-from .dp import apply_dp
-from .mpc_masking import generate_pairwise_masks
-from .dataset_wrapper import ClientDatasetWrapper
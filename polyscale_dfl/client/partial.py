@@ -0,0 +1,111 @@
+import fnmatch
+import math
+import torch.nn as nn
+import torch.nn.functional as F
+
+LORA_PATTERNS = ["*.lora_A", "*.lora_B"]
+
+def _matches(name, patterns):
+    return any(fnmatch.fnmatchcase(name, p) for p in patterns)
+
+def block_names(model):
+    """Ordered names of the model's repeated blocks, used to pick the last N"""
+    names = [name for name, _ in model.named_modules()]
+    for pattern in ("layer[1-4].*", "encoder.layers.encoder_layer_*", "features.*"):
+        blocks = [n for n in names if fnmatch.fnmatchcase(n, pattern) and n.count(".") == pattern.count(".")]
+        if blocks:
+            return blocks
+    return [name for name, _ in model.named_children()]
+
+class LoRALinear(nn.Module):
+    """
+    Frozen nn.Linear plus a trainable low-rank update: y = base(x) + (x A^T B^T) * alpha / rank
+    """
+    def __init__(self, base: nn.Linear, rank=4, alpha=8):
+        super().__init__()
+        self.base = base
+        for p in base.parameters():
+            p.requires_grad_(False)
+        self.lora_A = nn.Parameter(base.weight.new_empty(rank, base.in_features))
+        self.lora_B = nn.Parameter(base.weight.new_zeros(base.out_features, rank))
+        nn.init.kaiming_uniform_(self.lora_A, a=math.sqrt(5))
+        self.scaling = alpha / rank
+
+    def forward(self, x):
+        return self.base(x) + F.linear(F.linear(x, self.lora_A), self.lora_B) * self.scaling
+
+def add_lora_adapters(model, target_patterns=("*",), rank=4, alpha=8):
+    """
+    Wrap matching nn.Linear modules with LoRALinear. Attention output projections are
+    skipped because nn.MultiheadAttention reads their weights directly.
+    Apply the same call to the global model so state_dict keys line up.
+    """
+    targets = []
+    for name, module in model.named_modules():
+        if isinstance(module, nn.MultiheadAttention):
+            continue
+        for child_name, child in module.named_children():
+            full_name = f"{name}.{child_name}" if name else child_name
+            if type(child) is nn.Linear and _matches(full_name, target_patterns):
+                targets.append((module, child_name, child))
+    for parent, child_name, child in targets:
+        setattr(parent, child_name, LoRALinear(child, rank, alpha))
+    return model
+
+def head_name(model):
+    """
+    Name of the model's classifier head: its last nn.Linear in registration
+    order (fc, heads.head, classifier.1 or layers.3 for the models in
+    polyscale_dfl/models). A LoRA-wrapped head is returned as the wrapper.
+    """
+    names = [name for name, m in model.named_modules() if isinstance(m, nn.Linear)]
+    if not names:
+        raise ValueError("Model has no nn.Linear head; pass head= explicitly")
+    name = names[-1]
+    parent = name.rpartition(".")[0]
+    if parent and isinstance(model.get_submodule(parent), LoRALinear):
+        return parent
+    return name
+
+def freeze_parameters(model, patterns):
+    """Only parameters whose names match `patterns` keep requires_grad; returns their names"""
+    trainable = []
+    for name, param in model.named_parameters():
+        param.requires_grad_(_matches(name, patterns))
+        if param.requires_grad:
+            trainable.append(name)
+    if not trainable:
+        raise ValueError(f"No parameters match {patterns}")
+    return trainable
+
+def trainable_state_keys(model):
+    """state_dict keys a partial client uploads: trainable parameters and the buffers of their modules"""
+    params = [name for name, p in model.named_parameters() if p.requires_grad]
+    modules = {name.rpartition(".")[0] for name in params}
+    buffers = [name for name, _ in model.named_buffers() if name.rpartition(".")[0] in modules]
+    return params + buffers
+
+def configure_partial_training(model, mode="heads", n_blocks=1, patterns=None, lora_rank=4, lora_targets=("*",),
+                               head=None):
+    """
+    Freeze everything except the selected parameter groups and return the state_dict
+    keys the client should upload.
+    mode: "heads" (classifier only), "last_blocks" (last `n_blocks` blocks + head),
+          "lora" (low-rank adapters on Linear layers + head) or "patterns" (explicit fnmatch patterns)
+    head: module name of the classifier head; defaults to head_name(model)
+    """
+    if mode == "patterns":
+        selected = list(patterns or [])
+    elif mode in ("heads", "last_blocks", "lora"):
+        head_patterns = [f"{head or head_name(model)}.*"]
+        if mode == "heads":
+            selected = head_patterns
+        elif mode == "last_blocks":
+            selected = [f"{b}.*" for b in block_names(model)[-n_blocks:]] + head_patterns
+        else:
+            add_lora_adapters(model, lora_targets, lora_rank)
+            selected = LORA_PATTERNS + head_patterns
+    else:
+        raise ValueError(f"Unknown partial training mode {mode!r}")
+    freeze_parameters(model, selected)
+    return trainable_state_keys(model)
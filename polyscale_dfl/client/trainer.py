@@ -2,17 +2,88 @@ import torch
 import torch.nn as nn
 import torch.optim as optim
 
+PRECISIONS = {"fp32": None, "bf16": torch.bfloat16, "fp16": torch.float16}
+
+class LocalTrainer:
+    """
+    Local training engine that a client keeps across rounds.
+    The optimizer (with its momentum state), loss function and compiled model
+    are built once and reused every round.
+
+    precision: "fp32", "bf16" (autocast on CPU or GPU) or "fp16" (GPU autocast with loss scaling)
+    channels_last: NHWC memory format, faster for conv nets such as ResNet18 and MobileNetV2
+    compile: wrap the model with torch.compile once and reuse the compiled module
+    grad_accum_steps: step the optimizer every N batches (gradients averaged over
+                      the window; a shorter trailing window is averaged over its own size)
+    update_keys: only return these state_dict keys (partial training); frozen
+                 parameters (requires_grad=False) are never handed to the optimizer
+    """
+    def __init__(self, model, device="cpu", lr=0.01, momentum=0.0, weight_decay=0.0, optimizer="sgd",
+                 precision="fp32", channels_last=False, compile=False, grad_accum_steps=1, update_keys=None):
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision {precision!r}, expected one of {list(PRECISIONS)}")
+        self.model = model
+        self.device = device
+        self.device_type = "cuda" if str(device).startswith("cuda") else "cpu"
+        if precision == "fp16" and self.device_type != "cuda":
+            raise ValueError("precision='fp16' needs a CUDA device; use 'bf16' on CPU")
+        self.precision = precision
+        self.channels_last = channels_last
+        self.grad_accum_steps = max(1, grad_accum_steps)
+        self.update_keys = list(update_keys) if update_keys is not None else None
+        self.criterion = nn.CrossEntropyLoss()
+        if channels_last:
+            model.to(memory_format=torch.channels_last)
+        params = [p for p in model.parameters() if p.requires_grad]
+        if optimizer == "sgd":
+            self.optimizer = optim.SGD(params, lr=lr, momentum=momentum, weight_decay=weight_decay)
+        elif optimizer == "adam":
+            self.optimizer = optim.Adam(params, lr=lr, weight_decay=weight_decay)
+        else:
+            raise ValueError(f"Unknown optimizer {optimizer!r}")
+        self.scaler = torch.amp.GradScaler("cuda", enabled=precision == "fp16")
+        self.forward_model = torch.compile(model) if compile else model
+
+    def _step(self, batches):
+        if batches != self.grad_accum_steps:
+            # Losses were divided by grad_accum_steps; rescale to the window's real size
+            for group in self.optimizer.param_groups:
+                for p in group["params"]:
+                    if p.grad is not None:
+                        p.grad.mul_(self.grad_accum_steps / batches)
+        self.scaler.step(self.optimizer)
+        self.scaler.update()
+        self.optimizer.zero_grad(set_to_none=True)
+
+    def train(self, train_loader, epochs=1):
+        """Train locally and return the updated weights"""
+        self.model.train()
+        if self.update_keys is not None:
+            # Frozen layers stay in eval mode so e.g. BatchNorm running stats don't drift
+            for module in self.model.modules():
+                params = list(module.parameters(recurse=False))
+                if params and not any(p.requires_grad for p in params):
+                    module.eval()
+        dtype = PRECISIONS[self.precision]
+        self.optimizer.zero_grad(set_to_none=True)
+        pending = 0
+        for _ in range(epochs):
+            for x, y in train_loader:
+                x, y = x.to(self.device, non_blocking=True), y.to(self.device, non_blocking=True)
+                if self.channels_last and x.dim() == 4:
+                    x = x.contiguous(memory_format=torch.channels_last)
+                with torch.autocast(device_type=self.device_type, dtype=dtype, enabled=dtype is not None):
+                    loss = self.criterion(self.forward_model(x), y) / self.grad_accum_steps
+                self.scaler.scale(loss).backward()
+                pending += 1
+                if pending == self.grad_accum_steps:
+                    self._step(pending)
+                    pending = 0
+        if pending:
+            self._step(pending)
+        state = self.model.state_dict()
+        keys = self.update_keys if self.update_keys is not None else state.keys()
+        return {k: state[k].clone().detach() for k in keys}
+
 def train_one_round(model, train_loader, epochs=1, device="cpu"):
-    model.train()
-    criterion = nn.CrossEntropyLoss()
-    optimizer = optim.SGD(model.parameters(), lr=0.01)
-    for _ in range(epochs):
-        for x, y in train_loader:
-            x, y = x.to(device), y.to(device)
-            optimizer.zero_grad()
-            pred = model(x)
-            loss = criterion(pred, y)
-            loss.backward()
-            optimizer.step()
-    # Return weight difference
-    return {k: v.clone().detach() for k, v in model.state_dict().items()}
+    return LocalTrainer(model, device).train(train_loader, epochs)
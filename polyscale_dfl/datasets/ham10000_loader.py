@@ -1,27 +1,109 @@
+import hashlib
 import os
+import numpy as np
 import pandas as pd
+import torch
 from torch.utils.data import Dataset, DataLoader
 from PIL import Image
 from torchvision import transforms
 
 class HAM10000Dataset(Dataset):
     def __init__(self, csv_file, img_dir, transform=None):
-        self.data = pd.read_csv(csv_file)
+        data = pd.read_csv(csv_file)
+        # Plain arrays instead of per-item DataFrame.iloc lookups
+        self.filenames = data.iloc[:, 0].astype(str).to_numpy()
+        self.labels = data.iloc[:, 1].to_numpy(dtype=np.int64)
         self.img_dir = img_dir
         self.transform = transform
 
     def __len__(self):
-        return len(self.data)
+        return len(self.labels)
 
     def __getitem__(self, idx):
-        img_path = os.path.join(self.img_dir, self.data.iloc[idx, 0])
+        img_path = os.path.join(self.img_dir, self.filenames[idx])
         image = Image.open(img_path).convert("RGB")
-        label = int(self.data.iloc[idx, 1])
+        label = int(self.labels[idx])
         if self.transform:
             image = self.transform(image)
         return image, label
 
-def load_ham10000(csv_file, img_dir, batch_size=32):
-    transform = transforms.Compose([transforms.Resize((224,224)), transforms.ToTensor()])
-    dataset = HAM10000Dataset(csv_file, img_dir, transform)
-    return DataLoader(dataset, batch_size=batch_size, shuffle=True)
+class CachedHAM10000Dataset(HAM10000Dataset):
+    """
+    HAM10000 dataset backed by a memory-mapped uint8 cache of resized images.
+    Each image is decoded and resized once (on first access, from any worker);
+    later epochs read straight from the cache file.
+    """
+    def __init__(self, csv_file, img_dir, cache_dir, image_size=224, transform=None):
+        super().__init__(csv_file, img_dir, transform)
+        self.image_size = image_size
+        os.makedirs(cache_dir, exist_ok=True)
+        prefix = os.path.join(cache_dir, f"ham10000_{self._cache_key()}_{image_size}")
+        self.images_path = prefix + "_images.npy"
+        self.filled_path = prefix + "_filled.npy"
+        shape = (len(self), image_size, image_size, 3)
+        # The flags file is written last, so a missing one means an interrupted init
+        if not (os.path.exists(self.images_path) and os.path.exists(self.filled_path)):
+            np.lib.format.open_memmap(self.images_path, mode="w+", dtype=np.uint8, shape=shape).flush()
+            np.lib.format.open_memmap(self.filled_path, mode="w+", dtype=np.uint8, shape=(len(self),)).flush()
+        # Opened lazily so each DataLoader worker maps the files itself
+        self._images = None
+        self._filled = None
+
+    def _cache_key(self):
+        """Identifies the image set, so splits sharing a cache_dir never share pixels"""
+        digest = hashlib.sha256(os.path.abspath(self.img_dir).encode())
+        digest.update("\0".join(self.filenames.tolist()).encode())
+        return digest.hexdigest()[:16]
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_images"] = None
+        state["_filled"] = None
+        return state
+
+    def _open(self):
+        if self._images is None:
+            self._images = np.load(self.images_path, mmap_mode="r+")
+            self._filled = np.load(self.filled_path, mmap_mode="r+")
+
+    def _decode(self, idx):
+        img_path = os.path.join(self.img_dir, self.filenames[idx])
+        with Image.open(img_path) as image:
+            image = image.convert("RGB").resize((self.image_size, self.image_size), Image.BILINEAR)
+            return np.asarray(image, dtype=np.uint8)
+
+    def is_cached(self):
+        self._open()
+        return bool(self._filled.all())
+
+    def build_cache(self):
+        """Decode and resize every image not yet in the cache"""
+        self._open()
+        for idx in np.flatnonzero(self._filled == 0):
+            self._images[idx] = self._decode(idx)
+            self._filled[idx] = 1
+        self._images.flush()
+        self._filled.flush()
+
+    def __getitem__(self, idx):
+        self._open()
+        if not self._filled[idx]:
+            self._images[idx] = self._decode(idx)
+            self._filled[idx] = 1
+        # HWC uint8 -> CHW float in [0, 1], same as transforms.ToTensor()
+        image = torch.from_numpy(np.array(self._images[idx])).permute(2, 0, 1).float().div_(255)
+        if self.transform:
+            image = self.transform(image)
+        return image, int(self.labels[idx])
+
+def load_ham10000(csv_file, img_dir, batch_size=32, cache_dir=None, num_workers=0, image_size=224):
+    if cache_dir is None:
+        transform = transforms.Compose([transforms.Resize((image_size, image_size)), transforms.ToTensor()])
+        dataset = HAM10000Dataset(csv_file, img_dir, transform)
+    else:
+        dataset = CachedHAM10000Dataset(csv_file, img_dir, cache_dir, image_size)
+    loader_kwargs = {}
+    if num_workers > 0:
+        loader_kwargs = {"persistent_workers": True, "prefetch_factor": 4}
+    return DataLoader(dataset, batch_size=batch_size, shuffle=True, num_workers=num_workers,
+                      pin_memory=torch.cuda.is_available(), **loader_kwargs)
@@ -1,4 +0,0 @@
-from .synthetic import generate_synthetic
-from .mnist_loader import load_mnist
-from .cifar_loader import load_cifar
-from .ham10000_loader import load_ham10000
@@ -1,2 +0,0 @@
-"""PolyScale-FL: Decentralized Federated Learning Framework"""
-__version__ = "1.0.0"
@@ -1,15 +1,24 @@
+if "." in __package__:
+    from ..utils.telemetry import get_telemetry
+else:
+    from utils.telemetry import get_telemetry
+
 class CacheManager:
     """
-    Simple in-memory cache for IPFS content
+    Simple in-memory cache for IPFS content.
+    Lookups are counted in ipfs_cache_requests_total{result="hit"|"miss"}.
     """
     def __init__(self):
         self.cache = {}
+        self._requests = get_telemetry().counter("ipfs_cache_requests_total", "IPFS cache lookups")
 
     def add(self, cid: str, data):
         self.cache[cid] = data
 
     def get(self, cid: str):
-        return self.cache.get(cid, None)
+        data = self.cache.get(cid, None)
+        self._requests.inc(result="miss" if data is None else "hit")
+        return data
 
     def exists(self, cid: str):
         return cid in self.cache
@@ -1,4 +0,0 @@
-"""PolyScale-FL IPFS Module"""
-from .ipfs_client import IPFSClient
-from .pinning import PinManager
-from .caching import CacheManager
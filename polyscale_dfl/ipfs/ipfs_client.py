@@ -1,3 +1,4 @@
+import hashlib
 import json
 import os
 
@@ -25,3 +26,24 @@ class IPFSClient:
             with open(path, "r") as f:
                 return json.load(f)
         raise FileNotFoundError(f"CID {cid} not found in local storage")
+
+    def upload_bytes(self, data: bytes):
+        """
+        Store a binary blob under a content-derived CID (identical blobs share a CID,
+        and concurrent uploaders never race on the name).
+        """
+        cid = "Qm" + hashlib.sha256(data).hexdigest()[:44]
+        path = os.path.join(self.storage_dir, cid + ".bin")
+        if not os.path.exists(path):
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return cid
+
+    def fetch_bytes(self, cid: str):
+        path = os.path.join(self.storage_dir, cid + ".bin")
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                return f.read()
+        raise FileNotFoundError(f"CID {cid} not found in local storage")
@@ -0,0 +1,19 @@
+import importlib
+
+_EXPORTS = {
+    "MLP":               ".mlp",
+    "ResNet18":          ".resnet",
+    "MobileNetV2":       ".mobilenet",
+    "VisionTransformer": ".vit",
+}
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
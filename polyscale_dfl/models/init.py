@@ -1,4 +0,0 @@
-from .mlp import MLP
-from .resnet import ResNet18
-from .mobilenet import MobileNetV2
-from .vit import VisionTransformer
@@ -1,6 +1,7 @@
 import torchvision.models as models
+import torch.nn as nn
 
 def ResNet18(pretrained=False, num_classes=10):
     model = models.resnet18(weights=None if not pretrained else models.ResNet18_Weights.IMAGENET1K_V1)
-    model.fc = torch.nn.Linear(model.fc.in_features, num_classes)
+    model.fc = nn.Linear(model.fc.in_features, num_classes)
     return model
@@ -1,5 +0,0 @@
-"""PolyScale-FL Networking Module"""
-from .p2p_stub import P2PNode
-from .libp2p_node import LibP2PNode
-from .webrtc_signaling import WebRTCSignaler
-from .msg_types import MessageType
@@ -1,5 +1,12 @@
-import asyncio
-from p2p_stub import P2PNode
+if "." in __package__:
+    from ..utils.logging_utils import get_logger
+    from ..utils.telemetry import get_telemetry
+else:
+    from utils.logging_utils import get_logger
+    from utils.telemetry import get_telemetry
+from .p2p_stub import P2PNode
+
+logger = get_logger(__name__)
 
 class LibP2PNode(P2PNode):
     """
@@ -7,8 +14,9 @@ class LibP2PNode(P2PNode):
     You can replace this with actual libp2p-python implementation.
     """
     async def start(self):
-        print(f"[LibP2P] Node {self.id} started")
+        logger.info("Node %s started", self.id)
 
     async def broadcast(self, message):
-        for peer_id, peer in self.peers.items():
+        for peer_id in self.peers:
             self.send_message(peer_id, message)
+        get_telemetry().counter("p2p_messages_sent_total").inc(len(self.peers), kind="broadcast")
@@ -6,3 +6,4 @@ class MessageType(Enum):
     AGGREGATION_RESULT = auto()
     CONTROL = auto()
     HEARTBEAT = auto()
+    GOSSIP = auto()
@@ -0,0 +1,23 @@
+"""PolyScale-FL Secure Aggregation Module"""
+import importlib
+
+_EXPORTS = {
+    "SecureAggregator":        ".bonawitz",
+    "generate_keypair":        ".crypto_utils",
+    "encrypt_tensor":          ".crypto_utils",
+    "decrypt_tensor":          ".crypto_utils",
+    "generate_pairwise_masks": ".pairwise_masks",
+    "mask_updates":            ".pairwise_masks",
+    "KeyExchange":             ".key_exchange",
+}
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
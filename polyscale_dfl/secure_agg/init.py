@@ -1,5 +0,0 @@
-"""PolyScale-FL Secure Aggregation Module"""
-from .bonawitz import SecureAggregator
-from .crypto_utils import generate_keypair, encrypt_tensor, decrypt_tensor
-from .pairwise_masks import generate_pairwise_masks
-from .key_exchange import KeyExchange
@@ -11,3 +11,21 @@ def generate_pairwise_masks(update: dict, peers: list):
         for k in masked_update:
             masked_update[k] += peer_masks[k]
     return masked_update, masks
+
+def mask_updates(updates: list, seed: int = 0):
+    """
+    Mask a round of client updates with pairwise masks that cancel in the sum:
+    for each pair i < j a mask drawn from a shared seed is added to update i and
+    subtracted from update j. Only floating point tensors are masked.
+    """
+    masked = [{k: v.clone() for k, v in u.items()} for u in updates]
+    generator = torch.Generator()
+    for i in range(len(masked)):
+        for j in range(i + 1, len(masked)):
+            generator.manual_seed(hash((seed, i, j)) & 0x7FFFFFFF)
+            for k, v in masked[i].items():
+                if v.is_floating_point():
+                    mask = torch.randn(v.shape, generator=generator, dtype=v.dtype).to(v.device)
+                    masked[i][k] += mask
+                    masked[j][k] -= mask
+    return masked
@@ -0,0 +1,22 @@
+"""PolyScale-FL Simulation Module"""
+import importlib
+
+_EXPORTS = {
+    "SimulationConfig": ".launcher",
+    "LocalCluster":     ".launcher",
+    "LinkProfile":      ".transport",
+    "DelayedSender":    ".transport",
+    "send_frame":       ".transport",
+    "recv_frame":       ".transport",
+}
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
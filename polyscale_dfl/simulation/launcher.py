@@ -0,0 +1,167 @@
+import multiprocessing
+import os
+import queue
+import shutil
+import tempfile
+import time
+
+from .nodes import run_aggregator_process, run_client_process
+
+class SimulationConfig:
+    """
+    Settings for a LocalCluster run.
+    Clients are packed clients_per_process to an OS process; client process p
+    reports to aggregator p % num_aggregators. bandwidth_mbps / latency_ms /
+    dropout describe every client's simulated link; threads_per_process,
+    memory_limit_mb (address-space cap) and pin_cpus bound each process.
+    Each run writes its ledgers to work_dir/chain/<run_id> (generated when
+    not given), so reusing a work_dir never mixes runs; the IPFS store is
+    content-addressed and shared.
+    """
+    def __init__(self, num_clients=10, clients_per_process=10, num_aggregators=1, rounds=3,
+                 local_epochs=1, samples_per_client=64, batch_size=32, input_dim=10, hidden_dim=32,
+                 num_classes=2, lr=0.05, bandwidth_mbps=None, latency_ms=0.0, dropout=0.0,
+                 round_timeout=300.0, threads_per_process=1, memory_limit_mb=None, pin_cpus=False,
+                 work_dir=None, run_id=None, seed=0):
+        self.num_clients = num_clients
+        self.clients_per_process = clients_per_process
+        self.num_aggregators = num_aggregators
+        self.rounds = rounds
+        self.local_epochs = local_epochs
+        self.samples_per_client = samples_per_client
+        self.batch_size = batch_size
+        self.input_dim = input_dim
+        self.hidden_dim = hidden_dim
+        self.num_classes = num_classes
+        self.lr = lr
+        self.bandwidth_mbps = bandwidth_mbps
+        self.latency_ms = latency_ms
+        self.dropout = dropout
+        self.round_timeout = round_timeout
+        self.threads_per_process = threads_per_process
+        self.memory_limit_mb = memory_limit_mb
+        self.pin_cpus = pin_cpus
+        self.work_dir = work_dir
+        self.run_id = run_id
+        self.seed = seed
+
+    @property
+    def ipfs_dir(self):
+        return os.path.join(self.work_dir, "ipfs")
+
+    @property
+    def ledger_dir(self):
+        return os.path.join(self.work_dir, "chain", self.run_id)
+
+    def to_dict(self):
+        return dict(vars(self))
+
+class LocalCluster:
+    """
+    Launch a simulated deployment on this machine: num_aggregators aggregator
+    processes (gossiping partial aggregates when there are several) and
+    ceil(num_clients / clients_per_process) client processes, all talking
+    over local TCP, sharing a local IPFSClient store and committing to
+    FLContractStub ledgers under work_dir.
+    """
+    def __init__(self, config: SimulationConfig, start_method="spawn"):
+        self.config = config
+        self.ctx = multiprocessing.get_context(start_method)
+
+    def _client_groups(self):
+        ids = list(range(self.config.num_clients))
+        size = self.config.clients_per_process
+        return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+    @staticmethod
+    def _recv(pipe, process):
+        while not pipe.poll(1.0):
+            if not process.is_alive():
+                raise RuntimeError(f"{process.name} exited with code {process.exitcode}")
+        return pipe.recv()
+
+    def run(self):
+        """Run all rounds and return a summary including rounds per hour"""
+        config = self.config
+        cleanup = config.work_dir is None
+        if cleanup:
+            config.work_dir = tempfile.mkdtemp(prefix="polyscale_sim_")
+        generated_id = config.run_id is None
+        if generated_id:
+            config.run_id = time.strftime("run_%Y%m%d_%H%M%S_") + f"{os.getpid()}_{time.monotonic_ns()}"
+        run_id, ledger_dir = config.run_id, config.ledger_dir
+        os.makedirs(config.ipfs_dir, exist_ok=True)
+        os.makedirs(config.ledger_dir, exist_ok=True)
+        groups = self._client_groups()
+        results = self.ctx.Queue()
+        processes = []
+        started = time.perf_counter()
+        finished = False
+        try:
+            pipes = []
+            for index in range(config.num_aggregators):
+                parent, child = self.ctx.Pipe()
+                p = self.ctx.Process(target=run_aggregator_process, args=(config, index, child, results),
+                                     name=f"aggregator-{index}", daemon=True)
+                p.start()
+                processes.append(p)
+                pipes.append(parent)
+            ports = [self._recv(pipe, p) for pipe, p in zip(pipes, processes)]
+            for index, pipe in enumerate(pipes):
+                expected = sum(1 for p in range(len(groups)) if p % config.num_aggregators == index)
+                pipe.send((ports, expected))
+
+            for p, client_ids in enumerate(groups):
+                address = ("127.0.0.1", ports[p % config.num_aggregators])
+                proc = self.ctx.Process(target=run_client_process, args=(config, p, client_ids, address),
+                                        name=f"clients-{p}", daemon=True)
+                proc.start()
+                processes.append(proc)
+            setup_s = time.perf_counter() - started
+
+            reports = []
+            while len(reports) < config.num_aggregators:
+                try:
+                    reports.append(results.get(timeout=1.0))
+                except queue.Empty:
+                    for p in processes[:config.num_aggregators]:
+                        if p.exitcode not in (None, 0):
+                            raise RuntimeError(f"{p.name} exited with code {p.exitcode}")
+            wall_s = time.perf_counter() - started
+            finished = True
+        finally:
+            for p in processes:
+                # After a failure nothing is left to wait for
+                p.join(timeout=10 if finished else 0)
+                if p.is_alive():
+                    p.terminate()
+            if cleanup:
+                shutil.rmtree(config.work_dir, ignore_errors=True)
+                config.work_dir = None
+            if generated_id:
+                config.run_id = None
+        summary = self._summarize(reports, groups, setup_s, wall_s)
+        summary["run_id"] = run_id
+        if not cleanup:
+            summary["ledger_dir"] = ledger_dir
+        return summary
+
+    def _summarize(self, reports, groups, setup_s, wall_s):
+        config = self.config
+        # Aggregators finish a round together (they wait on each other's gossip)
+        round_seconds = [max(per_round) for per_round in zip(*(r["round_seconds"] for r in reports))]
+        return {
+            "config": config.to_dict(),
+            "client_processes": len(groups),
+            "aggregator_processes": config.num_aggregators,
+            "round_seconds": round_seconds,
+            "rounds_per_hour": 3600.0 * len(round_seconds) / sum(round_seconds) if round_seconds else 0.0,
+            "participation": [sum(per_round) for per_round in zip(*(r["participation"] for r in reports))],
+            "update_bytes": sum(r["update_bytes"] for r in reports),
+            "late_updates": sum(r["late_updates"] for r in reports),
+            "tx_count": sum(r["tx_count"] for r in reports),
+            "gas_used": sum(r["gas_used"] for r in reports),
+            "global_cids": sorted({r["global_cid"] for r in reports}),
+            "setup_s": setup_s,
+            "wall_s": wall_s,
+        }
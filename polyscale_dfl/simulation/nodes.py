@@ -0,0 +1,251 @@
+import json
+import os
+import queue
+import resource
+import socket
+import threading
+import time
+
+import torch
+from torch.utils.data import DataLoader
+
+if "." in __package__:
+    from ..chain.batcher import CommitBatcher
+    from ..chain.chain_stub import FLContractStub
+    from ..client.trainer import LocalTrainer
+    from ..datasets.synthetic import generate_synthetic
+    from ..ipfs.ipfs_client import IPFSClient
+    from ..models.mlp import MLP
+    from ..networking.msg_types import MessageType
+    from ..utils.serialization import state_to_bytes, state_from_bytes
+else:
+    from chain.batcher import CommitBatcher
+    from chain.chain_stub import FLContractStub
+    from client.trainer import LocalTrainer
+    from datasets.synthetic import generate_synthetic
+    from ipfs.ipfs_client import IPFSClient
+    from models.mlp import MLP
+    from networking.msg_types import MessageType
+    from utils.serialization import state_to_bytes, state_from_bytes
+from .transport import DelayedSender, LinkProfile, connect, recv_frame, send_frame
+
+def apply_resource_limits(config, slot=0):
+    """Per-process caps: torch threads, optional address-space limit and CPU pinning"""
+    torch.set_num_threads(config.threads_per_process)
+    try:
+        torch.set_num_interop_threads(config.threads_per_process)
+    except RuntimeError:
+        # Only settable before any inter-op work has started
+        pass
+    if config.memory_limit_mb:
+        limit = config.memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    if config.pin_cpus and hasattr(os, "sched_setaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+        os.sched_setaffinity(0, {cpus[slot % len(cpus)]})
+
+def make_model(config):
+    return MLP(input_dim=config.input_dim, hidden_dim=config.hidden_dim, num_classes=config.num_classes)
+
+def run_client_process(config, process_index, client_ids, address):
+    """
+    Host a group of simulated clients behind one connection to an aggregator.
+    Clients share one model and trainer (loading the global weights before
+    each local run); every client has its own LinkProfile, and its update
+    notification is sent once its simulated upload would have finished.
+    """
+    apply_resource_limits(config, slot=config.num_aggregators + process_index)
+    torch.manual_seed(config.seed + 1 + process_index)
+    datasets = generate_synthetic(len(client_ids), config.samples_per_client, config.input_dim, config.num_classes)
+    loaders = {c: DataLoader(d, batch_size=config.batch_size, shuffle=True) for c, d in zip(client_ids, datasets)}
+    links = {c: LinkProfile(config.bandwidth_mbps, config.latency_ms, config.dropout,
+                            seed=config.seed * 1_000_003 + c) for c in client_ids}
+    model = make_model(config)
+    trainer = LocalTrainer(model, lr=config.lr)
+    ipfs = IPFSClient(config.ipfs_dir)
+
+    sock = connect(address)
+    sender = DelayedSender(sock)
+    sender.send(MessageType.CONTROL, {"op": "hello", "process": process_index, "clients": client_ids})
+    try:
+        while True:
+            frame = recv_frame(sock)
+            if frame is None:
+                break
+            msg_type, payload = frame
+            if msg_type != MessageType.CONTROL or payload["op"] == "stop":
+                break
+            r = payload["round"]
+            global_blob = ipfs.fetch_bytes(payload["cid"])
+            global_state = state_from_bytes(global_blob)
+            # Every client downloads the global model over its own link, in parallel
+            time.sleep(links[client_ids[0]].transfer_time(len(global_blob)))
+            last_send = time.monotonic()
+            for c in client_ids:
+                link = links[c]
+                if link.drops():
+                    continue
+                model.load_state_dict(global_state)
+                update = trainer.train(loaders[c], config.local_epochs)
+                blob = state_to_bytes(update)
+                cid = ipfs.upload_bytes(blob)
+                send_at = time.monotonic() + link.transfer_time(len(blob))
+                last_send = max(last_send, send_at)
+                sender.send_at(send_at, MessageType.MODEL_UPDATE,
+                               {"round": r, "client_id": c, "cid": cid, "bytes": len(blob)})
+            sender.send_at(last_send, MessageType.CONTROL, {"op": "done", "round": r})
+    finally:
+        sender.close()
+        sock.close()
+
+class _Inbox:
+    """Accepts connections and funnels every received frame into one queue"""
+    def __init__(self, server):
+        self.server = server
+        self.queue = queue.Queue()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                sock, _ = self.server.accept()
+            except OSError:
+                return
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self._read, args=(sock,), daemon=True).start()
+
+    def _read(self, sock):
+        try:
+            while True:
+                frame = recv_frame(sock)
+                if frame is None:
+                    break
+                self.queue.put((sock, *frame))
+        except OSError:
+            pass
+        self.queue.put((sock, None, None))
+
+def _accumulate(total, update):
+    if total is None:
+        return {k: v.double() for k, v in update.items()}
+    for k, v in update.items():
+        total[k] += v.double()
+    return total
+
+def run_aggregator_process(config, index, conn, results):
+    """
+    One aggregator. It owns the clients of the client processes connected to
+    it; with several aggregators each one gossips its partial sum to the
+    others and all of them derive the same global model. Update CIDs of a
+    round are committed to the aggregator's own FLContractStub ledger as one
+    Merkle batch; the batch's (client_id, cid) leaves are appended to
+    aggregator_<index>.rounds.jsonl next to it so proofs can be rebuilt.
+    """
+    apply_resource_limits(config, slot=index)
+    server = socket.create_server(("127.0.0.1", 0), backlog=4096)
+    inbox = _Inbox(server)
+    conn.send(server.getsockname()[1])
+    peer_ports, expected_processes = conn.recv()
+
+    peers = [connect(("127.0.0.1", port)) for j, port in enumerate(peer_ports) if j != index]
+    ipfs = IPFSClient(config.ipfs_dir)
+    ledger_path = os.path.join(config.ledger_dir, f"aggregator_{index}")
+    contract = FLContractStub(ledger_path=ledger_path)
+    batcher = CommitBatcher(contract)
+    manifest = open(ledger_path + ".rounds.jsonl", "a")
+
+    torch.manual_seed(config.seed)
+    global_state = make_model(config).state_dict()
+    global_cid = ipfs.upload_bytes(state_to_bytes(global_state))
+
+    active, gossip = set(), {}
+    deadline = time.monotonic() + config.round_timeout
+    while len(active) < expected_processes:
+        try:
+            sock, msg_type, payload = inbox.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Empty:
+            raise TimeoutError(f"Only {len(active)} of {expected_processes} client processes connected")
+        if msg_type == MessageType.CONTROL and payload["op"] == "hello":
+            active.add(sock)
+        elif msg_type == MessageType.GOSSIP:
+            # A faster peer may already be done with its first round
+            gossip.setdefault(payload["round"], {})[payload["aggregator"]] = payload
+
+    stats = {"round_seconds": [], "participation": [], "update_bytes": 0, "late_updates": 0}
+    for r in range(1, config.rounds + 1):
+        start = time.perf_counter()
+        deadline = time.monotonic() + config.round_timeout
+        for sock in active:
+            send_frame(sock, MessageType.CONTROL, {"op": "round", "round": r, "cid": global_cid})
+
+        total, count, done = None, 0, set()
+
+        def handle(sock, msg_type, payload):
+            nonlocal total, count
+            if msg_type is None:
+                active.discard(sock)
+            elif msg_type == MessageType.MODEL_UPDATE:
+                if payload["round"] != r:
+                    stats["late_updates"] += 1
+                    return
+                blob = ipfs.fetch_bytes(payload["cid"])
+                stats["update_bytes"] += len(blob)
+                total = _accumulate(total, state_from_bytes(blob))
+                count += 1
+                batcher.add(payload["client_id"], r, payload["cid"])
+            elif msg_type == MessageType.CONTROL and payload["op"] == "done" and payload["round"] == r:
+                done.add(sock)
+            elif msg_type == MessageType.GOSSIP:
+                gossip.setdefault(payload["round"], {})[payload["aggregator"]] = payload
+
+        def wait_for(condition):
+            while not condition():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                try:
+                    handle(*inbox.queue.get(timeout=remaining))
+                except queue.Empty:
+                    return
+
+        wait_for(lambda: active <= done)
+        partials = [(index, total, count)]
+        if peers:
+            partial_cid = ipfs.upload_bytes(state_to_bytes(total)) if total is not None else None
+            for peer in peers:
+                send_frame(peer, MessageType.GOSSIP,
+                           {"round": r, "aggregator": index, "cid": partial_cid, "count": count})
+            wait_for(lambda: len(gossip.get(r, {})) == len(peers))
+            for j, p in gossip.pop(r, {}).items():
+                partials.append((j, state_from_bytes(ipfs.fetch_bytes(p["cid"])) if p["cid"] else None, p["count"]))
+
+        # Sum in aggregator order so every aggregator computes bit-identical weights
+        combined, n = None, 0
+        for _, partial, c in sorted(partials, key=lambda p: p[0]):
+            if partial is not None:
+                combined = _accumulate(combined, partial)
+                n += c
+        if n:
+            global_state = {k: (combined[k] / n).to(v.dtype) for k, v in global_state.items()}
+            global_cid = ipfs.upload_bytes(state_to_bytes(global_state))
+        receipt = batcher.flush(r)
+        if receipt is not None:
+            leaves = [[client_id, p["cid"]] for client_id, p in receipt["proofs"].items()]
+            manifest.write(json.dumps({"round": r, "root": receipt["root"].hex(), "tx_hash": receipt["tx_hash"],
+                                       "updates": leaves}) + "\n")
+            manifest.flush()
+        if index == 0:
+            contract.commit_update(global_cid, client_id="global", round_number=r)
+        stats["round_seconds"].append(time.perf_counter() - start)
+        stats["participation"].append(count)
+
+    for sock in active:
+        try:
+            send_frame(sock, MessageType.CONTROL, {"op": "stop"})
+        except OSError:
+            pass
+    contract.close()
+    manifest.close()
+    results.put({"aggregator": index, "tx_count": contract.tx_count, "gas_used": contract.gas_used,
+                 "global_cid": global_cid, **stats})
+    server.close()
@@ -0,0 +1,135 @@
+import heapq
+import json
+import random
+import socket
+import struct
+import threading
+import time
+
+if "." in __package__:
+    from ..networking.msg_types import MessageType
+else:
+    from networking.msg_types import MessageType
+
+# Frame: message type (1 byte), payload length (4 bytes, big endian), JSON payload
+HEADER = struct.Struct(">BI")
+MAX_FRAME = 16 * 1024 * 1024
+
+def encode_frame(msg_type: MessageType, payload: dict):
+    body = json.dumps(payload, separators=(",", ":")).encode()
+    return HEADER.pack(msg_type.value, len(body)) + body
+
+def _recv_exact(sock, n):
+    buf = bytearray()
+    while len(buf) < n:
+        chunk = sock.recv(n - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return bytes(buf)
+
+def send_frame(sock, msg_type: MessageType, payload: dict):
+    sock.sendall(encode_frame(msg_type, payload))
+
+def recv_frame(sock):
+    """Read one frame; returns (MessageType, payload) or None once the peer has closed"""
+    header = _recv_exact(sock, HEADER.size)
+    if header is None:
+        return None
+    type_value, length = HEADER.unpack(header)
+    if length > MAX_FRAME:
+        raise ValueError(f"Frame of {length} bytes exceeds the {MAX_FRAME} byte limit")
+    body = _recv_exact(sock, length)
+    if body is None:
+        return None
+    return MessageType(type_value), json.loads(body)
+
+def connect(address, timeout=30.0):
+    """Connect to (host, port), retrying until the listener is up"""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            sock = socket.create_connection(address)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            return sock
+        except ConnectionRefusedError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+class LinkProfile:
+    """
+    Simulated access link of a node: one-way latency, bandwidth and the
+    probability that the node drops out of a round.
+    """
+    def __init__(self, bandwidth_mbps=None, latency_ms=0.0, dropout=0.0, seed=None):
+        if not 0.0 <= dropout < 1.0:
+            raise ValueError("dropout must be in [0, 1)")
+        self.bandwidth_mbps = bandwidth_mbps
+        self.latency_ms = latency_ms
+        self.dropout = dropout
+        self.rng = random.Random(seed)
+
+    def transfer_time(self, num_bytes):
+        """Seconds to move num_bytes over this link"""
+        seconds = self.latency_ms / 1000.0
+        if self.bandwidth_mbps:
+            seconds += num_bytes * 8 / (self.bandwidth_mbps * 1e6)
+        return seconds
+
+    def drops(self):
+        return self.dropout > 0 and self.rng.random() < self.dropout
+
+class DelayedSender:
+    """
+    Sends frames on one socket at scheduled times from a background thread,
+    so the simulated transfers of many clients sharing a process overlap
+    instead of sleeping one after another. Frames due at the same time keep
+    their submission order.
+    """
+    def __init__(self, sock):
+        self.sock = sock
+        self._heap = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._closed = False
+        self.error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def send_at(self, when, msg_type: MessageType, payload: dict):
+        frame = encode_frame(msg_type, payload)
+        with self._cond:
+            heapq.heappush(self._heap, (when, self._seq, frame))
+            self._seq += 1
+            self._cond.notify()
+
+    def send(self, msg_type: MessageType, payload: dict):
+        self.send_at(time.monotonic(), msg_type, payload)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._heap:
+                        delay = self._heap[0][0] - time.monotonic()
+                        if delay <= 0:
+                            frame = heapq.heappop(self._heap)[2]
+                            break
+                        self._cond.wait(delay)
+                    elif self._closed:
+                        return
+                    else:
+                        self._cond.wait()
+            try:
+                self.sock.sendall(frame)
+            except OSError as e:
+                self.error = e
+                return
+
+    def close(self):
+        """Send everything still scheduled, then stop"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
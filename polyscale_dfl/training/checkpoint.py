@@ -1,5 +1,13 @@
 import os
 import torch
+if "." in __package__:
+    from ..utils.logging_utils import get_logger
+    from ..utils.telemetry import get_telemetry
+else:
+    from utils.logging_utils import get_logger
+    from utils.telemetry import get_telemetry
+
+logger = get_logger(__name__)
 
 class CheckpointManager:
     """
@@ -8,16 +16,20 @@ class CheckpointManager:
     def __init__(self, checkpoint_dir="./checkpoints"):
         self.checkpoint_dir = checkpoint_dir
         os.makedirs(self.checkpoint_dir, exist_ok=True)
+        self.telemetry = get_telemetry()
 
     def save(self, model, round_number):
         path = os.path.join(self.checkpoint_dir, f"round_{round_number}.pt")
-        torch.save(model.state_dict(), path)
-        print(f"[Checkpoint] Saved model for round {round_number} at {path}")
+        with self.telemetry.span("checkpoint_save"):
+            torch.save(model.state_dict(), path)
+        self.telemetry.counter("checkpoints_saved_total").inc()
+        logger.info("Saved model for round %s at %s", round_number, path)
 
     def load(self, model, round_number):
         path = os.path.join(self.checkpoint_dir, f"round_{round_number}.pt")
         if os.path.exists(path):
-            model.load_state_dict(torch.load(path))
-            print(f"[Checkpoint] Loaded model from round {round_number}")
+            with self.telemetry.span("checkpoint_load"):
+                model.load_state_dict(torch.load(path))
+            logger.info("Loaded model from round %s", round_number)
         else:
-            print(f"[Checkpoint] No checkpoint found for round {round_number}")
+            logger.warning("No checkpoint found for round %s", round_number)
@@ -1,4 +0,0 @@
-"""PolyScale-FL Training Module"""
-from .orchestrator import TrainingOrchestrator
-from .checkpoint import CheckpointManager
-from .reporter import TrainingReporter
@@ -1,25 +1,127 @@
-from aggregator.aggregator_node import AggregatorNode
-from secure_agg.bonawitz import SecureAggregator
+from contextlib import contextmanager
+
+if "." in __package__:
+    from ..aggregator.aggregator_node import AggregatorNode
+    from ..secure_agg.bonawitz import SecureAggregator
+    from ..secure_agg.pairwise_masks import mask_updates
+    from ..utils.logging_utils import get_logger
+    from ..utils.serialization import state_to_bytes, state_from_bytes
+    from ..utils.telemetry import get_telemetry
+else:
+    from aggregator.aggregator_node import AggregatorNode
+    from secure_agg.bonawitz import SecureAggregator
+    from secure_agg.pairwise_masks import mask_updates
+    from utils.logging_utils import get_logger
+    from utils.serialization import state_to_bytes, state_from_bytes
+    from utils.telemetry import get_telemetry
+
+logger = get_logger(__name__)
 
 class TrainingOrchestrator:
     """
-    Orchestrates federated learning rounds with secure aggregation
+    Orchestrates federated learning rounds with secure aggregation.
+    Optional pieces: pairwise masking of updates, an IPFS client to move
+    updates through, a contract (or CommitBatcher-compatible backend) to
+    commit them to, and a PhaseProfiler timing each phase of a round.
+    Every round is also recorded as a "round" telemetry span; a
+    TrainingReporter passed as `reporter` receives the accuracy and timings
+    (the caller owns it and should close() it once done with the run).
+    With a robust aggregator rule (anything but "mean") the raw client
+    updates go straight to the rule; masking is then rejected, since the
+    pairwise masks only cancel in a plain sum.
     """
-    def __init__(self, aggregator: AggregatorNode, clients, rounds=5):
+    def __init__(self, aggregator: AggregatorNode, clients, rounds=5, mask=False,
+                 ipfs_client=None, contract=None, profiler=None, reporter=None, telemetry=None):
+        if mask and aggregator.rule != "mean":
+            raise ValueError(f"mask=True requires the 'mean' aggregation rule, not {aggregator.rule!r}")
         self.aggregator = aggregator
         self.clients = clients
         self.rounds = rounds
+        self.mask = mask
+        self.ipfs_client = ipfs_client
+        self.contract = contract
+        self.profiler = profiler
+        self.reporter = reporter
+        self.telemetry = telemetry or (reporter.telemetry if reporter is not None else get_telemetry())
         self.secagg = SecureAggregator()
         self.history = []
+        self._round = None
 
-    def run(self, epochs_per_round=1):
-        for r in range(1, self.rounds + 1):
-            print(f"=== Starting Round {r} ===")
-            # Train clients
+    @contextmanager
+    def _phase(self, name):
+        with self.telemetry.span("phase", phase=name, attributes={"round": self._round}):
+            if self.profiler is None:
+                yield
+            else:
+                with self.profiler.phase(name):
+                    yield
+
+    def _exchange(self, client_updates):
+        """Serialize updates and move them through IPFS; returns the received updates and CIDs"""
+        if self.ipfs_client is None and self.profiler is None:
+            return client_updates, []
+        with self._phase("serialize"):
+            blobs = [state_to_bytes(u) for u in client_updates]
+        if self.profiler is not None:
+            self.profiler.add_bytes("upload", sum(len(b) for b in blobs))
+        if self.ipfs_client is None:
+            return client_updates, []
+        with self._phase("upload"):
+            cids = [self.ipfs_client.upload_bytes(b) for b in blobs]
+        with self._phase("download"):
+            received = [self.ipfs_client.fetch_bytes(cid) for cid in cids]
+            updates = [state_from_bytes(b) for b in received]
+        if self.profiler is not None:
+            self.profiler.add_bytes("download", sum(len(b) for b in received))
+        return updates, cids
+
+    def _commit(self, r, cids):
+        with self._phase("commit"):
+            if hasattr(self.contract, "commit_batch"):
+                from chain.batcher import CommitBatcher
+                batcher = CommitBatcher(self.contract)
+                for client, cid in zip(self.clients, cids):
+                    batcher.add(client.id, r, cid)
+                batcher.flush(r)
+            else:
+                for cid in cids:
+                    self.contract.commit_update(cid)
+
+    def _run_round(self, r, epochs_per_round):
+        # Train clients
+        with self._phase("train"):
             client_updates = [c.train_one_round(epochs_per_round) for c in self.clients]
-            # Secure aggregation
-            aggregated_update = self.secagg.aggregate(client_updates)
-            # Update global model
-            acc = self.aggregator.aggregate_round([aggregated_update])
-            self.history.append({"round": r, "accuracy": acc})
+        if self.mask:
+            with self._phase("mask"):
+                client_updates = mask_updates(client_updates, seed=r)
+        client_updates, cids = self._exchange(client_updates)
+        # Secure aggregation, then update global model; robust rules need every update
+        with self._phase("aggregate"):
+            if self.aggregator.rule == "mean":
+                self.aggregator.aggregate([self.secagg.aggregate(client_updates)])
+            else:
+                self.aggregator.aggregate(client_updates)
+        with self._phase("evaluate"):
+            acc = self.aggregator.evaluate()
+        if self.contract is not None and cids:
+            self._commit(r, cids)
+        return acc
+
+    def run(self, epochs_per_round=1):
+        if self.profiler is not None:
+            self.profiler.start()
+        try:
+            for r in range(1, self.rounds + 1):
+                logger.info("Starting round %d", r)
+                self._round = r
+                with self.telemetry.span("round", attributes={"round": r}):
+                    acc = self._run_round(r, epochs_per_round)
+                self.history.append({"round": r, "accuracy": acc})
+                self.telemetry.counter("rounds_total").inc()
+                if self.reporter is not None:
+                    self.reporter.log_round(r, {"accuracy": acc} if acc is not None else {})
+                self.telemetry.flush()
+        finally:
+            if self.profiler is not None:
+                self.profiler.stop()
         return self.history
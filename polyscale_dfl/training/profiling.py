@@ -0,0 +1,91 @@
+import cProfile
+import os
+import pstats
+import resource
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+PHASES = ("train", "mask", "serialize", "upload", "download", "aggregate", "evaluate", "commit")
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes on Linux
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+class PhaseProfiler:
+    """
+    Times the phases of a federated round and counts bytes moved.
+    backend: None (wall clock only), "cprofile" (one cProfile.Profile per phase,
+    dumped as <phase>.prof) or "torch" (torch.profiler with a record_function
+    per phase, dumped as a Chrome trace).
+    """
+    def __init__(self, backend=None, output_dir=None):
+        if backend not in (None, "cprofile", "torch"):
+            raise ValueError(f"Unknown profiler backend {backend!r}")
+        self.backend = backend
+        self.output_dir = output_dir
+        self.timings = defaultdict(list)
+        self.bytes_moved = defaultdict(int)
+        self._cprofiles = {}
+        self._torch_profiler = None
+
+    def start(self):
+        if self.backend == "torch" and self._torch_profiler is None:
+            import torch.profiler
+            self._torch_profiler = torch.profiler.profile(
+                activities=[torch.profiler.ProfilerActivity.CPU], record_shapes=False)
+            self._torch_profiler.__enter__()
+
+    def stop(self):
+        if self._torch_profiler is not None:
+            self._torch_profiler.__exit__(None, None, None)
+
+    @contextmanager
+    def phase(self, name):
+        if self.backend == "cprofile":
+            profile = self._cprofiles.setdefault(name, cProfile.Profile())
+            profile.enable()
+        elif self.backend == "torch":
+            import torch.profiler
+            record = torch.profiler.record_function(name)
+            record.__enter__()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name].append(time.perf_counter() - start)
+            if self.backend == "cprofile":
+                profile.disable()
+            elif self.backend == "torch":
+                record.__exit__(None, None, None)
+
+    def add_bytes(self, name, num_bytes):
+        self.bytes_moved[name] += num_bytes
+
+    def summary(self):
+        return {
+            "phases": {name: {"calls": len(t), "total_s": sum(t), "mean_s": sum(t) / len(t)}
+                       for name, t in self.timings.items()},
+            "bytes_moved": dict(self.bytes_moved),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+
+    def dump(self, output_dir=None):
+        """Write profiler output (if any) and return the written paths"""
+        output_dir = output_dir or self.output_dir
+        if self.backend is None or output_dir is None:
+            return []
+        os.makedirs(output_dir, exist_ok=True)
+        paths = []
+        if self.backend == "cprofile":
+            for name, profile in self._cprofiles.items():
+                path = os.path.join(output_dir, f"{name}.prof")
+                pstats.Stats(profile).dump_stats(path)
+                paths.append(path)
+        elif self._torch_profiler is not None:
+            path = os.path.join(output_dir, "trace.json")
+            self._torch_profiler.export_chrome_trace(path)
+            paths.append(path)
+        return paths
@@ -1,14 +1,58 @@
+if "." in __package__:
+    from ..utils.logging_utils import get_logger
+    from ..utils.telemetry import get_telemetry
+else:
+    from utils.logging_utils import get_logger
+    from utils.telemetry import get_telemetry
+
+logger = get_logger(__name__)
+
 class TrainingReporter:
     """
-    Report training metrics and progress
+    Report training metrics and progress.
+    Also a telemetry sink: spans with a `round` attribute (the orchestrator's
+    round and phase spans) are folded into that round's entry as durations
+    keyed <name>[_<label values>]_s, e.g. round_s or phase_train_s.
+    Call close() (or use it as a context manager) once the run is over so it
+    stops receiving spans from later runs sharing the same Telemetry.
     """
-    def __init__(self):
+    def __init__(self, telemetry=None):
         self.logs = []
+        self._by_round = {}
+        self.telemetry = telemetry or get_telemetry()
+        self.telemetry.add_sink(self)
+
+    def _entry(self, round_number):
+        entry = self._by_round.get(round_number)
+        if entry is None:
+            entry = self._by_round[round_number] = {"round": round_number}
+            self.logs.append(entry)
+        return entry
 
     def log_round(self, round_number, metrics: dict):
-        log_entry = {"round": round_number, **metrics}
-        self.logs.append(log_entry)
-        print(f"[Reporter] Round {round_number}: {metrics}")
+        self._entry(round_number).update(metrics)
+        for name, value in metrics.items():
+            if isinstance(value, (int, float)):
+                self.telemetry.gauge(f"round_{name}").set(value)
+        logger.info("Round %s: %s", round_number, metrics)
+
+    def emit(self, records):
+        for record in records:
+            round_number = record["attributes"].get("round")
+            if round_number is not None:
+                key = "_".join([record["name"], *map(str, record["labels"].values())])
+                self._entry(round_number)[f"{key}_s"] = record["duration_s"]
 
     def get_history(self):
         return self.logs
+
+    def close(self):
+        """Flush pending spans into this reporter, then detach it from the telemetry"""
+        self.telemetry.flush()
+        self.telemetry.remove_sink(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
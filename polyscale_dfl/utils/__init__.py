@@ -0,0 +1,29 @@
+"""PolyScale-FL Utilities Module"""
+import importlib
+
+_EXPORTS = {
+    "get_logger":             ".logging_utils",
+    "save_state":             ".serialization",
+    "load_state":             ".serialization",
+    "state_to_bytes":         ".serialization",
+    "state_from_bytes":       ".serialization",
+    "compute_accuracy":       ".metrics",
+    "compute_loss":           ".metrics",
+    "Config":                 ".config",
+    "Telemetry":              ".telemetry",
+    "get_telemetry":          ".telemetry",
+    "PrometheusTextExporter": ".telemetry",
+    "OTLPFileExporter":       ".telemetry",
+    "HTTPBatchExporter":      ".telemetry",
+}
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +0,0 @@
-"""PolyScale-FL Utilities Module"""
-from .logging_utils import get_logger
-from .serialization import save_state, load_state
-from .metrics import compute_accuracy, compute_loss
-from .config import Config
@@ -1,12 +1,46 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
+from .telemetry import get_telemetry
+
+_queue = None
+_listener = None
+
+def _start_listener():
+    """One background QueueListener per process does the actual (blocking) stdout writes"""
+    global _queue, _listener
+    if _listener is None:
+        if _queue is None:
+            _queue = queue.SimpleQueue()
+            get_telemetry().gauge("log_queue_depth", "Log records waiting to be written").set_function(log_queue_depth)
+            atexit.register(stop_logging)
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s %(name)s: %(message)s'))
+        _listener = logging.handlers.QueueListener(_queue, handler, respect_handler_level=True)
+        _listener.start()
+    return _queue
+
+def stop_logging():
+    """Drain queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+def log_queue_depth():
+    return _queue.qsize() if _queue is not None else 0
+
 def get_logger(name="PolyScaleFL", level=logging.INFO):
+    """
+    Logger whose records are handed to a queue and formatted/written by a
+    listener thread, so logging never blocks the training loop on I/O.
+    """
     logger = logging.getLogger(name)
     if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter('[%(asctime)s] %(levelname)s: %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        logger.addHandler(logging.handlers.QueueHandler(_start_listener()))
         logger.setLevel(level)
+        logger.propagate = False
     return logger
@@ -1,3 +1,4 @@
+import io
 import torch
 import json
 import os
@@ -18,3 +19,12 @@ def load_state(model, path):
             model.load_state_dict(state)
         return model
     raise FileNotFoundError(f"File {path} not found")
+
+def state_to_bytes(state: dict):
+    buffer = io.BytesIO()
+    torch.save(state, buffer)
+    return buffer.getvalue()
+
+def state_from_bytes(data: bytes):
+    # Bytes come from peers over IPFS, so never unpickle arbitrary objects
+    return torch.load(io.BytesIO(data), weights_only=True)
@@ -0,0 +1,340 @@
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+import urllib.request
+from collections import deque
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+SIZE_BUCKETS = (1e3, 1e4, 1e5, 1e6, 1e7, 1e8, 1e9)
+
+def _label_key(labels):
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+class _Metric:
+    kind = None
+
+    def __init__(self, name, description=""):
+        self.name = name
+        self.description = description
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def samples(self, ts):
+        with self._lock:
+            items = list(self._values.items())
+        return [{"name": self.name, "type": self.kind, "labels": dict(key), "value": value, "ts": ts}
+                for key, value in items]
+
+class Counter(_Metric):
+    """Monotonic total per label set"""
+    kind = "counter"
+
+    def inc(self, value=1, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def value(self, **labels):
+        return self._values.get(_label_key(labels), 0)
+
+class Gauge(_Metric):
+    """
+    Last value per label set. A gauge can also be backed by a function
+    (e.g. a queue's qsize) that is only called when samples are collected.
+    """
+    kind = "gauge"
+
+    def __init__(self, name, description=""):
+        super().__init__(name, description)
+        self._functions = {}
+
+    def set(self, value, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def set_function(self, fn, **labels):
+        self._functions[_label_key(labels)] = fn
+
+    def value(self, **labels):
+        key = _label_key(labels)
+        if key in self._functions:
+            return self._functions[key]()
+        return self._values.get(key)
+
+    def samples(self, ts):
+        for key, fn in list(self._functions.items()):
+            self.set(fn(), **dict(key))
+        return super().samples(ts)
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label set"""
+    kind = "histogram"
+
+    def __init__(self, name, description="", buckets=DEFAULT_BUCKETS):
+        super().__init__(name, description)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0, 0.0]
+            state[0][index] += 1
+            state[1] += 1
+            state[2] += value
+
+    def count(self, **labels):
+        state = self._values.get(_label_key(labels))
+        return state[1] if state else 0
+
+    def samples(self, ts):
+        with self._lock:
+            items = [(key, (list(counts), count, total)) for key, (counts, count, total) in self._values.items()]
+        samples = []
+        for key, (counts, count, total) in items:
+            cumulative, running = {}, 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                running += n
+                cumulative[str(bound)] = running
+            samples.append({"name": self.name, "type": self.kind, "labels": dict(key),
+                            "count": count, "sum": total, "buckets": cumulative, "ts": ts})
+        return samples
+
+class Telemetry:
+    """
+    Registry of counters, gauges and histograms plus finished spans.
+    Recording only touches in-memory state; sinks (which receive span records)
+    and exporters (which receive metric samples) run on flush() / export(),
+    or periodically from a background thread started with start().
+    """
+    def __init__(self, max_spans=10000):
+        self.metrics = {}
+        self.sinks = []
+        self.exporters = []
+        self._spans = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    def _get(self, cls, name, description, **kwargs):
+        metric = self.metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self.metrics.get(name)
+                if metric is None:
+                    metric = self.metrics[name] = cls(name, description, **kwargs)
+        if not isinstance(metric, cls):
+            raise TypeError(f"Metric {name!r} is already registered as a {metric.kind}")
+        return metric
+
+    def counter(self, name, description=""):
+        return self._get(Counter, name, description)
+
+    def gauge(self, name, description=""):
+        return self._get(Gauge, name, description)
+
+    def histogram(self, name, description="", buckets=DEFAULT_BUCKETS):
+        return self._get(Histogram, name, description, buckets=buckets)
+
+    @contextmanager
+    def span(self, name, attributes=None, **labels):
+        """
+        Time a block; records <name>_seconds{labels} and queues a span record
+        for the sinks. `attributes` go on the record only, so high-cardinality
+        values (round numbers, CIDs) don't multiply histogram series.
+        """
+        start = time.time()
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - t0
+            self.histogram(f"{name}_seconds").observe(duration, **labels)
+            self._spans.append({"name": name, "start": start, "duration_s": duration,
+                                "labels": labels, "attributes": attributes or {}})
+
+    def add_sink(self, sink):
+        """sink.emit(records) receives batches of finished span records"""
+        self.sinks.append(sink)
+
+    def remove_sink(self, sink):
+        """Stop delivering span records to sink; unknown sinks are ignored"""
+        if sink in self.sinks:
+            self.sinks.remove(sink)
+
+    def add_exporter(self, exporter):
+        """exporter.export(samples) receives a snapshot of every metric"""
+        self.exporters.append(exporter)
+
+    def collect(self):
+        ts = time.time()
+        return [s for metric in list(self.metrics.values()) for s in metric.samples(ts)]
+
+    def flush(self):
+        """Deliver queued span records to the sinks"""
+        records = []
+        while self._spans:
+            records.append(self._spans.popleft())
+        if records:
+            for sink in self.sinks:
+                try:
+                    sink.emit(records)
+                except Exception:
+                    logger.exception("Telemetry sink %r failed", sink)
+
+    def export(self):
+        self.flush()
+        if not self.exporters:
+            return
+        samples = self.collect()
+        for exporter in self.exporters:
+            try:
+                exporter.export(samples)
+            except Exception:
+                logger.exception("Telemetry exporter %r failed", exporter)
+
+    def start(self, interval=10.0):
+        """Flush and export every `interval` seconds from a daemon thread"""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, args=(interval,), daemon=True)
+            self._thread.start()
+
+    def _run(self, interval):
+        while not self._stop.wait(interval):
+            self.export()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.export()
+
+_default = None
+
+def get_telemetry():
+    """Process-wide Telemetry registry, created on first use"""
+    global _default
+    if _default is None:
+        _default = Telemetry()
+    return _default
+
+# Exporters
+
+def _prometheus_labels(labels, extra=None):
+    items = list(labels.items()) + (list(extra.items()) if extra else [])
+    if not items:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in items)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(items, escaped)) + "}"
+
+class PrometheusTextExporter:
+    """
+    Render samples in the Prometheus text exposition format. With a path,
+    each export atomically rewrites the file (for node_exporter's textfile
+    collector); render() returns the text for serving it directly.
+    """
+    def __init__(self, path=None, prefix="polyscale_"):
+        self.path = path
+        self.prefix = prefix
+
+    def render(self, samples):
+        lines, typed = [], set()
+        for s in samples:
+            name = self.prefix + s["name"]
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} {s['type']}")
+            if s["type"] == "histogram":
+                for bound, count in s["buckets"].items():
+                    le = "+Inf" if bound == "inf" else bound
+                    lines.append(f"{name}_bucket{_prometheus_labels(s['labels'], {'le': le})} {count}")
+                lines.append(f"{name}_sum{_prometheus_labels(s['labels'])} {s['sum']}")
+                lines.append(f"{name}_count{_prometheus_labels(s['labels'])} {s['count']}")
+            else:
+                lines.append(f"{name}{_prometheus_labels(s['labels'])} {s['value']}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, samples):
+        if self.path is None:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            f.write(self.render(samples))
+        os.replace(tmp, self.path)
+
+def _otlp_attributes(labels):
+    return [{"key": k, "value": {"stringValue": str(v)}} for k, v in labels.items()]
+
+class OTLPFileExporter:
+    """
+    Append one OTLP/JSON ExportMetricsServiceRequest per export as a line,
+    the format read by the OpenTelemetry collector's otlpjsonfile receiver.
+    """
+    def __init__(self, path, service_name="polyscale-fl"):
+        self.path = path
+        self.service_name = service_name
+
+    def to_otlp(self, samples):
+        metrics = {}
+        for s in samples:
+            ts = str(int(s["ts"] * 1e9))
+            attributes = _otlp_attributes(s["labels"])
+            if s["type"] == "histogram":
+                bounds = [float(b) for b in s["buckets"] if b != "inf"]
+                cumulative = list(s["buckets"].values())
+                counts = [str(c - p) for c, p in zip(cumulative, [0] + cumulative[:-1])]
+                point = {"attributes": attributes, "timeUnixNano": ts, "count": str(s["count"]),
+                         "sum": s["sum"], "explicitBounds": bounds, "bucketCounts": counts}
+                entry = metrics.setdefault(s["name"], {"name": s["name"], "histogram": {
+                    "aggregationTemporality": 2, "dataPoints": []}})
+                entry["histogram"]["dataPoints"].append(point)
+            else:
+                point = {"attributes": attributes, "timeUnixNano": ts, "asDouble": float(s["value"])}
+                if s["type"] == "counter":
+                    entry = metrics.setdefault(s["name"], {"name": s["name"], "sum": {
+                        "aggregationTemporality": 2, "isMonotonic": True, "dataPoints": []}})
+                    entry["sum"]["dataPoints"].append(point)
+                else:
+                    entry = metrics.setdefault(s["name"], {"name": s["name"], "gauge": {"dataPoints": []}})
+                    entry["gauge"]["dataPoints"].append(point)
+        return {"resourceMetrics": [{
+            "resource": {"attributes": _otlp_attributes({"service.name": self.service_name})},
+            "scopeMetrics": [{"scope": {"name": "polyscale_dfl"}, "metrics": list(metrics.values())}],
+        }]}
+
+    def export(self, samples):
+        line = json.dumps(self.to_otlp(samples), separators=(",", ":"))
+        with open(self.path, "a") as f:
+            f.write(line + "\n")
+
+class HTTPBatchExporter:
+    """
+    POST each snapshot to the dashboard's /telemetry/batch endpoint as one
+    request. Samples from a failed post are kept (up to max_pending) and
+    retried with the next export.
+    """
+    def __init__(self, url, source=None, timeout=5.0, max_pending=50000):
+        self.url = url
+        self.source = source
+        self.timeout = timeout
+        self.pending = deque(maxlen=max_pending)
+
+    def export(self, samples):
+        self.pending.extend(samples)
+        batch = list(self.pending)
+        body = json.dumps({"source": self.source, "samples": batch}, separators=(",", ":")).encode()
+        request = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+        self.pending.clear()
@@ -8,20 +8,16 @@ setup(
     packages=find_packages(),
     install_requires=[
         "torch>=2.0",
-        "torchvision>=0.15",
-        "fastapi",
-        "uvicorn",
-        "pydantic>=2.0",
-        "requests",
-        "web3>=6.0",
-        "ipfshttpclient>=0.8",
-        "cryptography",
         "numpy",
-        "pandas",
-        "protobuf",
-        "scikit-learn",
-        "matplotlib",
-        "libp2p==0.1.7",
     ],
+    extras_require={
+        "vision": ["torchvision>=0.15", "pandas", "pillow"],
+        "chain": ["web3>=6.0", "aiohttp"],
+        "ipfs": ["ipfshttpclient>=0.8"],
+        "crypto": ["cryptography"],
+        "p2p": ["libp2p==0.1.7", "protobuf"],
+        "dashboard": ["fastapi", "uvicorn", "pydantic>=2.0", "requests"],
+        "analysis": ["scikit-learn", "matplotlib"],
+    },
     python_requires=">=3.10",
 )
@@ -0,0 +1,32 @@
+import os
+import sys
+
+# Subpackages are imported top-level (e.g. ``from chain.chain_stub import ...``)
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "polyscale_dfl"))
+
+import importlib
+import pytest
+
+DASHBOARD_DIR = os.path.join(os.path.dirname(__file__), "..", "dashboard", "backend")
+_DASHBOARD_MODULES = ("main", "utils", "routers")
+
+def _is_dashboard_module(name):
+    return name in _DASHBOARD_MODULES or name.startswith(tuple(m + "." for m in _DASHBOARD_MODULES))
+
+@pytest.fixture
+def dashboard(tmp_path, monkeypatch):
+    """
+    The dashboard backend's main module, imported fresh against a temporary
+    DASHBOARD_DB. Its top-level ``utils`` package clashes with polyscale_dfl's,
+    so those modules are swapped out for the duration of the test.
+    """
+    pytest.importorskip("fastapi")
+    monkeypatch.setenv("DASHBOARD_DB", str(tmp_path / "dashboard.db"))
+    monkeypatch.syspath_prepend(DASHBOARD_DIR)
+    stashed = {name: sys.modules.pop(name) for name in list(sys.modules) if _is_dashboard_module(name)}
+    try:
+        yield importlib.import_module("main")
+    finally:
+        for name in [n for n in sys.modules if _is_dashboard_module(n)]:
+            del sys.modules[name]
+        sys.modules.update(stashed)
@@ -1,14 +1,15 @@
 import pytest
 import torch
-from models.cnn import SimpleCNN
-from aggregator.server import Aggregator
+from models.mlp import MLP
+from aggregator.aggregator_node import AggregatorNode
 
 def test_aggregator_update():
-    model = SimpleCNN()
-    aggregator = Aggregator(model=model)
+    model = MLP()
+    aggregator = AggregatorNode(model=model, clients=[])
     
     dummy_update = {k: torch.ones_like(v) for k, v in model.state_dict().items()}
-    global_model = aggregator.update_global_model([dummy_update, dummy_update])
+    aggregator.aggregate_round([dummy_update, dummy_update])
+    global_model = aggregator.global_model
     
     for k, v in global_model.state_dict().items():
         assert torch.allclose(v, torch.ones_like(v))
@@ -0,0 +1,74 @@
+import asyncio
+import pytest
+from chain.local_chain import LocalChain, LocalRPCServer
+from chain.async_web3_client import AsyncWeb3Client
+
+pytest.importorskip("aiohttp")
+
+def test_pipelined_transactions_and_batched_queries():
+    server = LocalRPCServer().start()
+
+    async def run():
+        async with AsyncWeb3Client(server.url) as client:
+            accounts = await client.get_accounts()
+            hashes = await client.send_transactions([{"to": accounts[1], "data": "0x01"} for _ in range(20)])
+            receipts = await client.wait_for_receipts(hashes)
+            balances = await client.get_balances(accounts[:2])
+            return accounts, hashes, receipts, balances
+
+    try:
+        accounts, hashes, receipts, balances = asyncio.run(run())
+    finally:
+        server.stop()
+    assert len(set(hashes)) == 20
+    assert all(int(r["status"], 16) == 1 for r in receipts)
+    assert server.chain.get_transaction_count(accounts[0]) == 20
+    assert balances[accounts[0]] < balances[accounts[1]]
+
+def test_local_chain_pool_rejects_duplicate_nonces():
+    chain = LocalChain()
+    sender = chain.accounts[0]
+    future = chain.send_transaction({"from": sender, "nonce": 1, "data": "0x01"})
+    assert chain.get_transaction_receipt(future) is None
+    assert chain.get_transaction_count(sender) == 0
+    # Nonce 0 is still missing, so it is what "pending" hands out next
+    assert chain.get_transaction_count(sender, "pending") == 0
+    with pytest.raises(ValueError, match="already pending"):
+        chain.send_transaction({"from": sender, "nonce": 1, "data": "0x02"})
+    chain.send_transaction({"from": sender, "nonce": 0, "data": "0x03"})
+    assert chain.get_transaction_receipt(future)["status"] == 1
+    assert chain.get_transaction_count(sender) == 2
+
+def test_failed_send_does_not_leave_a_nonce_gap():
+    server = LocalRPCServer().start()
+
+    async def run():
+        async with AsyncWeb3Client(server.url) as client:
+            accounts = await client.get_accounts()
+            request = client.request
+            failed = []
+
+            async def flaky(method, params=None):
+                if method == "eth_sendTransaction" and not failed:
+                    failed.append(params[0]["nonce"])
+                    raise OSError("connection reset")
+                return await request(method, params)
+
+            client.request = flaky
+            results = await asyncio.gather(*(client.send_transaction({"to": accounts[1], "data": "0x01"})
+                                             for _ in range(4)), return_exceptions=True)
+            hashes = [h for h in results if isinstance(h, str)]
+            hashes.append(await client.send_transaction({"to": accounts[1], "data": "0x02"}))
+            return accounts, failed, await client.wait_for_receipts(hashes, timeout=5.0)
+
+    try:
+        accounts, failed, receipts = asyncio.run(run())
+    finally:
+        server.stop()
+    assert failed == ["0x0"] and len(receipts) == 4
+    assert server.chain.get_transaction_count(accounts[0]) == 4
+    assert not server.chain.pool.get(accounts[0])
+
+def test_commit_batch_requires_registry_address():
+    with pytest.raises(ValueError, match="registry_address"):
+        asyncio.run(AsyncWeb3Client("http://127.0.0.1:1").commit_batch(1, b"\x00" * 32, 1))
@@ -1,8 +1,8 @@
 import pytest
-from chain.contract import FLContract
+from chain.chain_stub import FLContractStub
 
 def test_commit_and_query():
-    contract = FLContract()
+    contract = FLContractStub()
     cid = "QmTestCID123"
     tx_hash = contract.commit_update(cid)
     
@@ -0,0 +1,30 @@
+import pytest
+from chain.batcher import CommitBatcher, verify_update
+from chain.chain_stub import FLContractStub
+from chain.local_chain import LocalChain
+
+@pytest.mark.parametrize("backend", [FLContractStub, LocalChain])
+def test_batch_commit_and_proofs(backend):
+    contract = backend()
+    batcher = CommitBatcher(contract)
+    for i in range(5):
+        batcher.add(f"client-{i}", 3, f"QmCID{i}")
+    receipt = batcher.flush(3)
+
+    assert contract.tx_count == 1
+    assert receipt["count"] == 5
+    for client_id, entry in receipt["proofs"].items():
+        assert verify_update(client_id, 3, entry["cid"], entry["proof"], receipt["root"])
+    proof = batcher.get_proof(3, "client-0")["proof"]
+    assert not verify_update("client-0", 3, "QmForged", proof, receipt["root"])
+    assert not verify_update("client-0", 4, "QmCID0", proof, receipt["root"])
+
+def test_duplicate_client_in_round_is_rejected():
+    batcher = CommitBatcher(FLContractStub())
+    batcher.add("client-0", 1, "QmA")
+    with pytest.raises(ValueError, match="already has an update"):
+        batcher.add("client-0", 1, "QmB")
+    batcher.add("client-0", 2, "QmB")
+    receipt = batcher.flush(1)
+    assert receipt["count"] == len(receipt["proofs"]) == 1
+    assert receipt["proofs"]["client-0"]["cid"] == "QmA"
@@ -0,0 +1,69 @@
+import threading
+import pytest
+from chain.batcher import CommitBatcher, verify_update
+from chain.chain_stub import FLContractStub
+from chain.events import AsyncEventBus
+from chain.ledger import UpdateLedger
+
+def test_indexed_queries_and_persistence(tmp_path):
+    path = str(tmp_path / "ledger")
+    contract = FLContractStub(ledger_path=path)
+    contract.ledger.segment_size = 4
+    for r in range(1, 4):
+        for c in ("a", "b"):
+            contract.commit_update(f"Qm{r}{c}", client_id=c, round_number=r)
+
+    assert contract.get_update("Qm2b")["round"] == 2
+    assert [u["cid"] for u in contract.get_updates(round_number=3)] == ["Qm3a", "Qm3b"]
+    assert [u["cid"] for u in contract.get_updates(client_id="a")] == ["Qm1a", "Qm2a", "Qm3a"]
+    assert [u["cid"] for u in contract.get_updates_in_rounds(2, 3)] == ["Qm2a", "Qm2b", "Qm3a", "Qm3b"]
+    contract.ledger.close()
+
+    # 6 records: one sealed segment of 4, plus 2 still in the log
+    assert len(list(tmp_path.glob("ledger.segment.*"))) == 1
+    reopened = UpdateLedger(path)
+    assert reopened.cids == contract.get_update_history()
+    assert reopened.get("Qm1b")["client_id"] == "b"
+
+def test_batches_and_tx_count_survive_reopen(tmp_path):
+    path = str(tmp_path / "ledger")
+    contract = FLContractStub(ledger_path=path)
+    batcher = CommitBatcher(contract)
+    batcher.add("a", 1, "QmA")
+    batcher.add("b", 1, "QmB")
+    assert batcher.flush(1)["tx_hash"] == "tx_1"
+    assert contract.commit_update("QmGlobal", client_id="global", round_number=1) == "tx_2"
+    gas_used = contract.gas_used
+    contract.close()
+
+    reopened = FLContractStub(ledger_path=path)
+    assert reopened.tx_count == 2
+    assert reopened.gas_used == gas_used
+    assert reopened.get_batch_root(1) == batcher.receipts[1]["root"]
+    assert verify_update("b", 1, "QmB", batcher.get_proof(1, "b")["proof"], reopened.get_batch_root(1))
+    assert reopened.commit_update("QmNext") == "tx_3"
+    with pytest.raises(ValueError):
+        reopened.commit_batch(1, b"\x00" * 32, 1)
+    reopened.close()
+
+def test_async_event_bus_filters_and_batches():
+    bus = AsyncEventBus()
+    release = threading.Event()
+    batches = []
+
+    def slow(events):
+        release.wait()
+        batches.append(events)
+
+    bus.subscribe(slow, topics=["UpdateCommitted"], batched=True)
+    contract = FLContractStub(event_bus=bus)
+    for i in range(5):
+        contract.commit_update(f"Qm{i}")
+    contract.commit_batch(1, b"\x00" * 32, 5)
+    # Commits returned while the listener is still blocked
+    release.set()
+    bus.flush()
+    delivered = [data["cid"] for batch in batches for _, data in batch]
+    assert delivered == [f"Qm{i}" for i in range(5)]
+    assert len(batches) < 5
+    bus.close()
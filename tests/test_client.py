@@ -1,16 +1,96 @@
+import copy
+
 import pytest
 import torch
+import torch.nn as nn
+from torch.utils.data import DataLoader, TensorDataset
 from client.client_node import ClientNode
-from models.cnn import SimpleCNN
-from datasets.loader import load_mnist
+from client.trainer import LocalTrainer, train_one_round
+from models.mlp import MLP
+from datasets.synthetic import generate_synthetic
 
 @pytest.fixture
 def client():
-    train_loaders, _ = load_mnist(num_clients=1, batch_size=32)
-    model = SimpleCNN()
-    return ClientNode(id=0, model=model, train_loader=train_loaders[0])
+    dataset = generate_synthetic(num_clients=1, num_samples=64, input_dim=784, num_classes=10)[0]
+    model = MLP()
+    return ClientNode(id=0, model=model, train_loader=DataLoader(dataset, batch_size=32))
 
 def test_client_training(client):
     update = client.train_one_round(epochs=1)
     assert isinstance(update, dict)
     assert all(isinstance(v, torch.Tensor) for v in update.values())
+
+def _loader(n=40, batch_size=4):
+    torch.manual_seed(0)
+    data = TensorDataset(torch.randn(n, 10), torch.randint(0, 2, (n,)))
+    return DataLoader(data, batch_size=batch_size, shuffle=False)
+
+def _mlp(seed=1):
+    torch.manual_seed(seed)
+    return MLP(input_dim=10, hidden_dim=8, num_classes=2)
+
+def test_optimizer_state_persists_across_rounds():
+    loader = _loader()
+    model = _mlp()
+    trainer = LocalTrainer(model, lr=0.1, momentum=0.9)
+    trainer.train(loader)
+    optimizer = trainer.optimizer
+    start = copy.deepcopy(model.state_dict())
+    persistent = trainer.train(loader)
+    assert trainer.optimizer is optimizer
+    assert all("momentum_buffer" in optimizer.state[p] for p in model.parameters())
+
+    # A fresh trainer from the same weights starts with empty momentum
+    fresh_model = _mlp()
+    fresh_model.load_state_dict(start)
+    fresh = LocalTrainer(fresh_model, lr=0.1, momentum=0.9).train(loader)
+    assert not torch.allclose(persistent["layers.1.weight"], fresh["layers.1.weight"])
+
+def test_grad_accum_steps_counts_optimizer_steps():
+    trainer = LocalTrainer(_mlp(), grad_accum_steps=4)
+    steps = []
+    step = trainer.optimizer.step
+    trainer.optimizer.step = lambda *args, **kwargs: (steps.append(1), step(*args, **kwargs))[1]
+    # 10 batches: two full windows of 4 and a trailing partial one of 2
+    trainer.train(_loader())
+    assert len(steps) == 3
+
+def test_trailing_accumulation_window_is_averaged_over_its_batches():
+    # Two batches with grad_accum_steps=4 form one short window, the same step as grad_accum_steps=2
+    loader = _loader(n=8)
+    short = LocalTrainer(_mlp(), lr=0.1, grad_accum_steps=4).train(loader)
+    full = LocalTrainer(_mlp(), lr=0.1, grad_accum_steps=2).train(loader)
+    for k in full:
+        assert torch.allclose(short[k], full[k], atol=1e-6)
+
+def test_fp16_requires_cuda():
+    with pytest.raises(ValueError, match="fp16"):
+        LocalTrainer(_mlp(), device="cpu", precision="fp16")
+
+def test_bf16_channels_last_conv():
+    torch.manual_seed(0)
+    model = nn.Sequential(nn.Conv2d(3, 4, 3), nn.BatchNorm2d(4), nn.ReLU(),
+                          nn.AdaptiveAvgPool2d(1), nn.Flatten(), nn.Linear(4, 2))
+    before = model[0].weight.clone()
+    data = TensorDataset(torch.randn(8, 3, 8, 8), torch.randint(0, 2, (8,)))
+    trainer = LocalTrainer(model, lr=0.1, precision="bf16", channels_last=True)
+    update = trainer.train(DataLoader(data, batch_size=4))
+    assert model[0].weight.is_contiguous(memory_format=torch.channels_last)
+    assert update["0.weight"].dtype == torch.float32
+    assert all(torch.isfinite(v).all() for v in update.values() if v.is_floating_point())
+    assert not torch.equal(update["0.weight"], before)
+
+def test_train_one_round_matches_plain_sgd_loop():
+    loader = _loader()
+    reference = _mlp()
+    optimizer = torch.optim.SGD(reference.parameters(), lr=0.01)
+    criterion = nn.CrossEntropyLoss()
+    reference.train()
+    for x, y in loader:
+        optimizer.zero_grad()
+        criterion(reference(x), y).backward()
+        optimizer.step()
+
+    update = train_one_round(_mlp(), loader)
+    for k, v in reference.state_dict().items():
+        assert torch.allclose(update[k], v)
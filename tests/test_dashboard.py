@@ -0,0 +1,126 @@
+import asyncio
+import importlib
+import json
+
+from fastapi.testclient import TestClient
+
+def test_metrics_ingest_pagination_and_summaries(dashboard):
+    with TestClient(dashboard.app) as client:
+        single = client.post("/metrics/", json={"round": 1, "cid": "Qm1", "client_id": "a", "accuracy": 0.5})
+        assert single.json() == {"status": "ok", "count": 1}
+        batch = [{"round": r, "cid": f"Qm{r}{c}", "client_id": c, "accuracy": r / 10, "loss": 1 - r / 10}
+                 for r in range(2, 11) for c in ("a", "b")]
+        assert client.post("/metrics/", json=batch).json()["count"] == 18
+
+        items, cursor = [], 0
+        while cursor is not None:
+            page = client.get("/metrics/", params={"cursor": cursor, "limit": 7}).json()
+            assert len(page["items"]) <= 7
+            items += page["items"]
+            cursor = page["next_cursor"]
+        assert len(items) == 19
+        assert [m["id"] for m in items] == sorted(m["id"] for m in items)
+
+        only_b = client.get("/metrics/", params={"client_id": "b", "round_from": 9}).json()["items"]
+        assert [(m["round"], m["client_id"]) for m in only_b] == [(9, "b"), (10, "b")]
+
+        rounds = client.get("/metrics/rounds", params={"round_from": 10}).json()
+        assert rounds == [{"round": 10, "count": 2, "accuracy": 1.0, "min_accuracy": 1.0,
+                           "max_accuracy": 1.0, "loss": 0.0}]
+
+        # Rounds 1..10 in 3 buckets of width 4: [1-4], [5-8], [9-10]
+        buckets = client.get("/metrics/downsample", params={"buckets": 3}).json()
+        assert [(b["round"], b["count"]) for b in buckets] == [(1, 7), (5, 8), (9, 4)]
+        assert buckets[2]["max_accuracy"] == 1.0
+
+def test_nodes_and_models(dashboard):
+    with TestClient(dashboard.app) as client:
+        client.post("/nodes/update", params={"node_id": "n1", "status": "online"})
+        client.post("/nodes/batch", json=[{"node_id": "n1", "status": "offline"},
+                                          {"node_id": "n2", "status": "online"}])
+        assert client.get("/nodes/").json() == {"n1": {"status": "offline"}, "n2": {"status": "online"}}
+        assert client.get("/nodes/", params={"status": "online"}).json() == {"n2": {"status": "online"}}
+
+        client.post("/models/register", params={"cid": "QmM1", "round": 1})
+        client.post("/models/batch", json=[{"cid": f"QmM{r}", "round": r} for r in range(2, 5)])
+        first = client.get("/models/", params={"limit": 3}).json()
+        assert [m["round"] for m in first["items"]] == [1, 2, 3]
+        rest = client.get("/models/", params={"cursor": first["next_cursor"]}).json()
+        assert [m["cid"] for m in rest["items"]] == ["QmM4"]
+        assert rest["next_cursor"] is None
+
+class FakeWebSocket:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.sent = []
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        if self.fail:
+            raise ConnectionError("gone")
+        self.sent.append(json.loads(text))
+
+    async def close(self):
+        self.closed = True
+
+def test_subscriber_queue_policies(dashboard):
+    ws = importlib.import_module("utils.websocket_manager")
+    coalesce = ws.Subscriber(FakeWebSocket(), max_queue=2, policy="coalesce")
+    drop = ws.Subscriber(FakeWebSocket(), max_queue=2, policy="drop_oldest")
+    for subscriber in (coalesce, drop):
+        for i in range(3):
+            subscriber.offer({("metrics", "a"): {"i": i}, ("metrics", str(i)): {"i": i}})
+
+    # Every key survives in one merged batch, with its latest value
+    assert len(coalesce.queue) == 1 and coalesce.dropped == 0
+    merged, _ = coalesce.queue[0]
+    assert merged == {("metrics", "a"): {"i": 2}, ("metrics", "0"): {"i": 0},
+                      ("metrics", "1"): {"i": 1}, ("metrics", "2"): {"i": 2}}
+    assert [u[("metrics", "a")]["i"] for u, _ in drop.queue] == [1, 2] and drop.dropped == 1
+
+    # Raw messages are never merged into a batch, but they are bounded too
+    coalesce.offer({}, "raw-1")
+    coalesce.offer({}, "raw-2")
+    assert [text for _, text in coalesce.queue] == ["raw-2", None]
+    assert coalesce.queue[1][0] == merged and coalesce.dropped == 1
+
+def test_manager_topic_filtering_and_failed_send(dashboard):
+    ws = importlib.import_module("utils.websocket_manager")
+
+    async def scenario():
+        manager = ws.WebSocketManager()
+        metrics_ws, all_ws, broken_ws = FakeWebSocket(), FakeWebSocket(), FakeWebSocket(fail=True)
+        await manager.connect(metrics_ws, topics=["metrics"])
+        await manager.connect(all_ws)
+        broken = await manager.connect(broken_ws)
+        manager.publish("metrics", "r1", {"accuracy": 0.5})
+        manager.publish("nodes", "n1", {"status": "online"})
+        manager.publish("metrics", "r1", {"loss": 0.1})
+        manager.flush()
+        await manager.broadcast('{"type":"ping"}')
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await manager.stop()
+        return manager, metrics_ws, all_ws, broken_ws, broken
+
+    manager, metrics_ws, all_ws, broken_ws, broken = asyncio.run(scenario())
+    assert metrics_ws.sent[0]["updates"] == [{"topic": "metrics", "key": "r1",
+                                              "data": {"accuracy": 0.5, "loss": 0.1}}]
+    assert {u["topic"] for u in all_ws.sent[0]["updates"]} == {"metrics", "nodes"}
+    assert metrics_ws.sent[1] == all_ws.sent[1] == {"type": "ping"}
+    assert broken not in manager.subscribers and broken_ws.closed
+
+def test_telemetry_batch_ingest(dashboard):
+    samples = [{"name": "rounds_total", "type": "counter", "labels": {}, "value": 3, "ts": 1.0},
+               {"name": "rounds_total", "type": "counter", "labels": {}, "value": 5, "ts": 2.0},
+               {"name": "round_seconds", "type": "histogram", "labels": {"phase": "train"},
+                "count": 4, "sum": 2.0, "ts": 2.0}]
+    with TestClient(dashboard.app) as client:
+        assert client.post("/telemetry/batch", json={"source": "n1", "samples": samples}).json()["count"] == 3
+        latest = client.get("/telemetry/latest").json()
+        assert {(s["name"], s["value"], s["count"]) for s in latest} == {("rounds_total", 5, None),
+                                                                         ("round_seconds", None, 4)}
+        assert len(client.get("/telemetry/", params={"name": "rounds_total"}).json()["items"]) == 2
@@ -0,0 +1,58 @@
+import os
+import pytest
+import numpy as np
+import torch
+from PIL import Image
+from datasets.ham10000_loader import CachedHAM10000Dataset
+
+def test_ham10000_cache(tmp_path):
+    img_dir = tmp_path / "images"
+    img_dir.mkdir()
+    rows = ["image_id,dx"]
+    for i in range(3):
+        Image.fromarray(np.full((40, 30, 3), 50 * i, dtype=np.uint8)).save(img_dir / f"img_{i}.png")
+        rows.append(f"img_{i}.png,{i}")
+    csv_file = tmp_path / "metadata.csv"
+    csv_file.write_text("\n".join(rows))
+
+    dataset = CachedHAM10000Dataset(csv_file, img_dir, tmp_path / "cache", image_size=16)
+    assert not dataset.is_cached()
+    image, label = dataset[2]
+    assert image.shape == (3, 16, 16)
+    assert label == 2
+    assert torch.allclose(image, torch.full_like(image, 100 / 255))
+
+    dataset.build_cache()
+    reopened = CachedHAM10000Dataset(csv_file, img_dir, tmp_path / "cache", image_size=16)
+    assert reopened.is_cached()
+    assert torch.equal(reopened[1][0], dataset[1][0])
+
+def test_ham10000_cache_is_keyed_by_image_set(tmp_path):
+    img_dir = tmp_path / "images"
+    img_dir.mkdir()
+    for i in range(4):
+        Image.fromarray(np.full((8, 8, 3), 60 * i, dtype=np.uint8)).save(img_dir / f"img_{i}.png")
+    train_csv, val_csv = tmp_path / "train.csv", tmp_path / "val.csv"
+    train_csv.write_text("image_id,dx\nimg_0.png,0\nimg_1.png,1")
+    val_csv.write_text("image_id,dx\nimg_2.png,0\nimg_3.png,1")
+    cache_dir = tmp_path / "cache"
+
+    train = CachedHAM10000Dataset(train_csv, img_dir, cache_dir, image_size=8)
+    train.build_cache()
+    val = CachedHAM10000Dataset(val_csv, img_dir, cache_dir, image_size=8)
+    assert val.images_path != train.images_path
+    assert not val.is_cached()
+    assert torch.allclose(val[0][0], torch.full((3, 8, 8), 120 / 255))
+
+def test_ham10000_cache_recovers_from_interrupted_init(tmp_path):
+    img_dir = tmp_path / "images"
+    img_dir.mkdir()
+    Image.fromarray(np.full((8, 8, 3), 10, dtype=np.uint8)).save(img_dir / "img_0.png")
+    csv_file = tmp_path / "metadata.csv"
+    csv_file.write_text("image_id,dx\nimg_0.png,0")
+
+    dataset = CachedHAM10000Dataset(csv_file, img_dir, tmp_path / "cache", image_size=8)
+    os.remove(dataset.filled_path)
+    reopened = CachedHAM10000Dataset(csv_file, img_dir, tmp_path / "cache", image_size=8)
+    assert not reopened.is_cached()
+    assert reopened[0][1] == 0
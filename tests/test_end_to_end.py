@@ -1,10 +1,10 @@
 import pytest
 import torch
 from client.client_node import ClientNode
-from aggregator.server import Aggregator
-from secure_agg.secagg import SecureAggregator
-from models.cnn import SimpleCNN
-from datasets.loader import load_mnist
+from aggregator.aggregator_node import AggregatorNode
+from secure_agg.bonawitz import SecureAggregator
+from models.mlp import MLP
+from datasets.mnist_loader import load_mnist
 
 @pytest.mark.slow
 def test_full_fl_pipeline():
@@ -14,7 +14,7 @@ def test_full_fl_pipeline():
     # Initialize clients
     clients = []
     for i in range(2):
-        model = SimpleCNN()
+        model = MLP()
         clients.append(ClientNode(id=i, model=model, train_loader=train_loaders[i]))
     
     # Local training
@@ -25,8 +25,9 @@ def test_full_fl_pipeline():
     aggregated = secagg.aggregate(updates)
     
     # Global model update
-    aggregator = Aggregator(model=SimpleCNN())
-    global_model = aggregator.update_global_model([aggregated])
+    aggregator = AggregatorNode(model=MLP(), clients=clients)
+    aggregator.aggregate_round([aggregated])
+    global_model = aggregator.global_model
     
     # Check global model weights exist
     assert all(isinstance(v, torch.Tensor) for v in global_model.state_dict().values())
@@ -0,0 +1,48 @@
+import os
+import subprocess
+import sys
+
+PACKAGE_DIR = os.path.join(os.path.dirname(__file__), "..", "polyscale_dfl")
+
+def _loaded_modules(code):
+    out = subprocess.run([sys.executable, "-c", code + "\nimport sys; print(' '.join(sys.modules))"],
+                         cwd=PACKAGE_DIR, capture_output=True, text=True, check=True)
+    return set(out.stdout.split())
+
+def test_chain_stub_does_not_import_web3():
+    loaded = _loaded_modules("import chain.chain_stub, chain.web3_client, chain.tx_encoder, chain.events")
+    assert "web3" not in loaded
+
+def test_subpackage_exports_resolve_lazily():
+    code = ("import os, sys; sys.path.insert(0, os.getcwd()); sys.path.insert(0, os.path.dirname(os.getcwd()))\n"
+            "import polyscale_dfl\n"
+            "import polyscale_dfl.client\n"
+            "assert polyscale_dfl.chain.FLContractStub.__name__ == 'FLContractStub'\n"
+            "assert polyscale_dfl.chain.MerkleTree.__name__ == 'MerkleTree'")
+    loaded = _loaded_modules(code)
+    assert "polyscale_dfl.chain.chain_stub" in loaded
+    # Importing a package runs only its __init__; nothing heavy comes along
+    assert "polyscale_dfl.client.client_node" not in loaded
+    for heavy in ("torch", "torchvision", "web3"):
+        assert heavy not in loaded
+
+def test_every_export_resolves_in_package_mode():
+    # Exports whose third-party dependency isn't installed are skipped; a
+    # missing polyscale_dfl module (e.g. a bare `from utils...`) is a failure
+    code = ("import importlib\n"
+            "import polyscale_dfl\n"
+            "for name in polyscale_dfl._SUBPACKAGES:\n"
+            "    package = importlib.import_module('polyscale_dfl.' + name)\n"
+            "    for export in getattr(package, '_EXPORTS', {}):\n"
+            "        try:\n"
+            "            getattr(package, export)\n"
+            "        except ModuleNotFoundError as e:\n"
+            "            root = (e.name or '').split('.')[0]\n"
+            "            if root == 'polyscale_dfl' or root in polyscale_dfl._SUBPACKAGES:\n"
+            "                print('BROKEN', name, export, e)\n"
+            "        except Exception as e:\n"
+            "            print('BROKEN', name, export, repr(e))")
+    # Run from the repository root so polyscale_dfl/ itself is not on sys.path
+    out = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(PACKAGE_DIR),
+                         capture_output=True, text=True, check=True)
+    assert "BROKEN" not in out.stdout, out.stdout
@@ -8,3 +8,20 @@ def test_ipfs_upload_download():
     
     fetched = client.fetch_json(cid)
     assert fetched["test"] == 123
+
+
+class _Payload:
+    def __reduce__(self):
+        return (print, ("unpickled",))
+
+def test_state_from_bytes_only_loads_tensors(tmp_path):
+    torch = pytest.importorskip("torch")
+    from utils.serialization import state_from_bytes, state_to_bytes
+
+    client = IPFSClient(str(tmp_path))
+    state = {"w": torch.ones(2, 3), "step": torch.tensor(4)}
+    restored = state_from_bytes(client.fetch_bytes(client.upload_bytes(state_to_bytes(state))))
+    assert torch.equal(restored["w"], state["w"]) and restored["step"].item() == 4
+
+    with pytest.raises(Exception, match="weights_only"):
+        state_from_bytes(state_to_bytes({"w": _Payload()}))
@@ -0,0 +1,80 @@
+import pytest
+import torch
+from torch.utils.data import DataLoader, TensorDataset
+from aggregator.aggregator_node import AggregatorNode
+from aggregator.model_avg import fed_avg
+from aggregator.versioning import ModelVersioning
+from client.client_node import ClientNode
+from client.partial import configure_partial_training, head_name
+from models.mlp import MLP
+
+def test_head_only_client_uploads_head():
+    data = TensorDataset(torch.randn(32, 10), torch.randint(0, 2, (32,)))
+    model = MLP(input_dim=10, hidden_dim=8, num_classes=2)
+    frozen = model.layers[1].weight.clone()
+    client = ClientNode(0, model, DataLoader(data, batch_size=8), partial={"mode": "heads"})
+
+    update = client.train_one_round()
+    assert set(update) == {"layers.3.weight", "layers.3.bias"}
+    assert model.layers[1].weight.grad is None
+    assert torch.equal(model.layers[1].weight.cpu(), frozen)
+
+    aggregator = AggregatorNode(MLP(input_dim=10, hidden_dim=8, num_classes=2), clients=[client])
+    before = aggregator.global_model.layers[1].weight.clone()
+    aggregator.aggregate_round([update])
+    assert torch.equal(aggregator.global_model.layers[1].weight, before)
+    assert torch.allclose(aggregator.global_model.layers[3].weight, update["layers.3.weight"])
+
+def test_sparse_fed_avg_and_versioning():
+    avg = fed_avg([{"a": torch.tensor(1.0), "b": torch.tensor(2.0)}, {"a": torch.tensor(3.0)}])
+    assert avg["a"].item() == 2.0 and avg["b"].item() == 2.0
+
+    versions = ModelVersioning()
+    versions.save_version(1, {"a": 1, "b": 1})
+    versions.save_version(2, {"b": 2}, partial=True)
+    versions.save_version(3, {"a": 3}, partial=True)
+    assert versions.get_version(3) == {"a": 3, "b": 2}
+    assert versions.get_version(1) == {"a": 1, "b": 1}
+
+    orphan = ModelVersioning()
+    orphan.save_version(1, {"a": 1}, partial=True)
+    with pytest.raises(ValueError, match="no full version"):
+        orphan.get_version(1)
+
+def test_unknown_update_keys_leave_global_model_untouched():
+    aggregator = AggregatorNode(MLP(input_dim=10, hidden_dim=8, num_classes=2), clients=[])
+    before = {k: v.clone() for k, v in aggregator.global_model.state_dict().items()}
+    update = {"layers.3.weight": torch.zeros(2, 8), "bogus": torch.zeros(1)}
+    with pytest.raises(KeyError, match="bogus"):
+        aggregator.aggregate([update])
+    for k, v in aggregator.global_model.state_dict().items():
+        assert torch.equal(v, before[k])
+
+def test_head_is_resolved_from_the_model():
+    model = torch.nn.Sequential(torch.nn.Linear(10, 8), torch.nn.ReLU(), torch.nn.Linear(8, 2))
+    assert head_name(model) == "2"
+    assert set(configure_partial_training(model, mode="heads")) == {"2.weight", "2.bias"}
+
+    model = torch.nn.Sequential(torch.nn.Linear(10, 8), torch.nn.ReLU(), torch.nn.Linear(8, 2))
+    keys = configure_partial_training(model, mode="heads", head="0")
+    assert set(keys) == {"0.weight", "0.bias"}
+
+    lora = MLP(input_dim=10, hidden_dim=8, num_classes=2)
+    keys = configure_partial_training(lora, mode="lora")
+    assert head_name(lora) == "layers.3"
+    assert "layers.3.base.weight" in keys and "layers.1.base.weight" not in keys
+
+def test_frozen_batchnorm_keeps_running_stats():
+    torch.manual_seed(0)
+    model = torch.nn.Sequential(torch.nn.Linear(10, 8), torch.nn.BatchNorm1d(8), torch.nn.ReLU(),
+                                torch.nn.Linear(8, 8), torch.nn.BatchNorm1d(8), torch.nn.Linear(8, 2))
+    data = TensorDataset(torch.randn(32, 10) * 3 + 1, torch.randint(0, 2, (32,)))
+    client = ClientNode(0, model, DataLoader(data, batch_size=8),
+                        partial={"mode": "patterns", "patterns": ["3.*", "4.*", "5.*"]})
+    frozen_mean = model[1].running_mean.clone()
+    trained_mean = model[4].running_mean.clone()
+
+    client.train_one_round()
+    assert torch.equal(model[1].running_mean.cpu(), frozen_mean)
+    assert model[1].num_batches_tracked.item() == 0
+    assert not torch.equal(model[4].running_mean.cpu(), trained_mean)
@@ -0,0 +1,27 @@
+import pytest
+import torch
+from aggregator.robust import robust_aggregate, AGGREGATION_RULES
+
+@pytest.fixture
+def updates():
+    torch.manual_seed(0)
+    honest = [{"w": torch.ones(4, 3) + 0.01 * torch.randn(4, 3), "n": torch.tensor(5)} for _ in range(8)]
+    byzantine = [{"w": torch.full((4, 3), 1000.0), "n": torch.tensor(5)} for _ in range(2)]
+    return honest + byzantine
+
+@pytest.mark.parametrize("rule,kwargs", [
+    ("median", {"chunk_size": 5}),
+    ("trimmed_mean", {"trim_ratio": 0.2, "chunk_size": 5, "num_workers": 2}),
+    ("krum", {"num_byzantine": 2}),
+    ("multi_krum", {"num_byzantine": 2}),
+    ("geometric_median", {"chunk_size": 5}),
+])
+def test_robust_rules_ignore_outliers(updates, rule, kwargs):
+    result = robust_aggregate(updates, rule, **kwargs)
+    assert result["w"].shape == (4, 3)
+    assert torch.allclose(result["w"], torch.ones(4, 3), atol=0.1)
+    assert result["n"].dtype == torch.int64 and result["n"].item() == 5
+
+def test_mean_is_pulled_by_outliers(updates):
+    assert robust_aggregate(updates, "mean")["w"].mean() > 100
+    assert set(AGGREGATION_RULES) >= {"median", "trimmed_mean", "krum", "multi_krum", "geometric_median"}
@@ -1,6 +1,6 @@
 import pytest
 import torch
-from secure_agg.secagg import SecureAggregator
+from secure_agg.bonawitz import SecureAggregator
 
 def test_secure_aggregation():
     secagg = SecureAggregator()
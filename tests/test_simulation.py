@@ -0,0 +1,79 @@
+import socket
+import time
+import pytest
+from networking.msg_types import MessageType
+from simulation.transport import DelayedSender, LinkProfile, recv_frame, send_frame
+
+def test_frames_round_trip():
+    a, b = socket.socketpair()
+    send_frame(a, MessageType.MODEL_UPDATE, {"round": 1, "cid": "Qm1"})
+    send_frame(a, MessageType.CONTROL, {"op": "done"})
+    assert recv_frame(b) == (MessageType.MODEL_UPDATE, {"round": 1, "cid": "Qm1"})
+    assert recv_frame(b) == (MessageType.CONTROL, {"op": "done"})
+    a.close()
+    assert recv_frame(b) is None
+
+def test_link_profile():
+    link = LinkProfile(bandwidth_mbps=8, latency_ms=20)
+    assert link.transfer_time(1_000_000) == pytest.approx(1.02)
+    assert not any(LinkProfile().drops() for _ in range(100))
+    flaky = LinkProfile(dropout=0.5, seed=1)
+    dropped = sum(flaky.drops() for _ in range(1000))
+    assert 400 < dropped < 600
+
+def test_delayed_sender_orders_by_due_time():
+    a, b = socket.socketpair()
+    sender = DelayedSender(a)
+    now = time.monotonic()
+    sender.send_at(now + 0.05, MessageType.CONTROL, {"n": 2})
+    sender.send_at(now, MessageType.CONTROL, {"n": 1})
+    sender.close()
+    assert [recv_frame(b)[1]["n"] for _ in range(2)] == [1, 2]
+
+def test_local_cluster_with_gossip(tmp_path):
+    # The worker processes train real models
+    pytest.importorskip("torch")
+    import json
+    import os
+    from chain.chain_stub import FLContractStub
+    from chain.merkle import MerkleTree
+    from chain.tx_encoder import encode_update_leaf
+    from simulation.launcher import LocalCluster, SimulationConfig
+    config = SimulationConfig(num_clients=6, clients_per_process=2, num_aggregators=2, rounds=2,
+                              samples_per_client=16, latency_ms=5, bandwidth_mbps=100, work_dir=str(tmp_path))
+    summary = LocalCluster(config).run()
+
+    assert summary["client_processes"] == 3
+    assert len(summary["round_seconds"]) == 2
+    assert summary["rounds_per_hour"] > 0
+    assert summary["participation"] == [6, 6]
+    # Both aggregators derive the same global model from each other's partial sums
+    assert len(summary["global_cids"]) == 1
+    # One Merkle batch per aggregator per round plus aggregator 0's global model commit
+    assert summary["tx_count"] == 2 * 2 + 2
+
+    # The persisted ledgers hold every batch root, and the round manifests rebuild them
+    committed = 0
+    for index in range(2):
+        path = os.path.join(summary["ledger_dir"], f"aggregator_{index}")
+        contract = FLContractStub(ledger_path=path)
+        with open(path + ".rounds.jsonl") as f:
+            manifests = [json.loads(line) for line in f]
+        assert [m["round"] for m in manifests] == [1, 2]
+        for m in manifests:
+            leaves = [encode_update_leaf(c, m["round"], cid) for c, cid in m["updates"]]
+            assert MerkleTree(leaves).root == contract.get_batch_root(m["round"])
+            committed += len(m["updates"])
+        global_commits = contract.get_updates(client_id="global")
+        if index == 0:
+            assert [u["round"] for u in global_commits] == [1, 2]
+            assert global_commits[-1]["cid"] == summary["global_cids"][0]
+        else:
+            assert global_commits == []
+        contract.close()
+    assert committed == 12
+
+    # Reusing the work_dir starts a fresh set of ledgers
+    again = LocalCluster(config).run()
+    assert again["ledger_dir"] != summary["ledger_dir"]
+    assert again["tx_count"] == summary["tx_count"]
@@ -0,0 +1,73 @@
+import json
+import logging
+from training.reporter import TrainingReporter
+from utils.logging_utils import get_logger
+from utils.telemetry import OTLPFileExporter, PrometheusTextExporter, Telemetry
+
+def test_metrics_and_prometheus_text():
+    telemetry = Telemetry()
+    telemetry.counter("updates_total").inc(2, rule="mean")
+    telemetry.counter("updates_total").inc(rule="mean")
+    telemetry.gauge("queue_depth").set_function(lambda: 7)
+    hist = telemetry.histogram("update_size_bytes", buckets=(10, 100))
+    for size in (5, 50, 500):
+        hist.observe(size)
+
+    assert telemetry.counter("updates_total").value(rule="mean") == 3
+    text = PrometheusTextExporter(prefix="").render(telemetry.collect())
+    assert 'updates_total{rule="mean"} 3' in text
+    assert "queue_depth 7" in text
+    assert 'update_size_bytes_bucket{le="100"} 2' in text
+    assert 'update_size_bytes_bucket{le="+Inf"} 3' in text
+    assert "update_size_bytes_count 3" in text
+
+def test_otlp_file_exporter(tmp_path):
+    telemetry = Telemetry()
+    path = str(tmp_path / "metrics.jsonl")
+    telemetry.add_exporter(OTLPFileExporter(path))
+    telemetry.counter("rounds_total").inc()
+    telemetry.export()
+    telemetry.export()
+
+    lines = open(path).read().splitlines()
+    assert len(lines) == 2
+    metric = json.loads(lines[0])["resourceMetrics"][0]["scopeMetrics"][0]["metrics"][0]
+    assert metric["name"] == "rounds_total"
+    assert metric["sum"]["dataPoints"][0]["asDouble"] == 1.0
+
+def test_reporter_receives_round_spans():
+    telemetry = Telemetry()
+    reporter = TrainingReporter(telemetry)
+    with telemetry.span("round", attributes={"round": 1}):
+        with telemetry.span("phase", phase="train", attributes={"round": 1}):
+            pass
+    with telemetry.span("unrelated"):
+        pass
+    reporter.log_round(1, {"accuracy": 0.5})
+    telemetry.flush()
+
+    entry = reporter.get_history()[0]
+    assert entry["accuracy"] == 0.5
+    assert {"round_s", "phase_train_s"} <= set(entry)
+    assert telemetry.histogram("phase_seconds").count(phase="train") == 1
+    assert telemetry.gauge("round_accuracy").value() == 0.5
+
+def test_logger_uses_queue_handler():
+    logger = get_logger("polyscale.test")
+    assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+    logger.info("queued")
+
+def test_closed_reporter_stops_receiving_spans():
+    telemetry = Telemetry()
+    with TrainingReporter(telemetry) as first:
+        with telemetry.span("round", attributes={"round": 1}):
+            pass
+    assert first not in telemetry.sinks
+
+    second = TrainingReporter(telemetry)
+    with telemetry.span("round", attributes={"round": 2}):
+        pass
+    second.close()
+    assert [entry["round"] for entry in first.get_history()] == [1]
+    assert [entry["round"] for entry in second.get_history()] == [2]
+    second.close()
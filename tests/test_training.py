@@ -0,0 +1,55 @@
+import pytest
+import torch
+from torch.utils.data import DataLoader
+from aggregator.aggregator_node import AggregatorNode
+from chain.chain_stub import FLContractStub
+from client.client_node import ClientNode
+from datasets.synthetic import generate_synthetic
+from ipfs.ipfs_client import IPFSClient
+from models.mlp import MLP
+from secure_agg.bonawitz import SecureAggregator
+from secure_agg.pairwise_masks import mask_updates
+from training.orchestrator import TrainingOrchestrator
+from training.profiling import PhaseProfiler
+
+def test_pairwise_masks_cancel():
+    updates = [{"w": torch.randn(5)} for _ in range(3)]
+    masked = mask_updates(updates, seed=1)
+    assert not torch.allclose(masked[0]["w"], updates[0]["w"])
+    secagg = SecureAggregator()
+    assert torch.allclose(secagg.aggregate(masked)["w"], secagg.aggregate(updates)["w"], atol=1e-5)
+
+def test_orchestrator_profiles_round_phases(tmp_path):
+    data = generate_synthetic(num_clients=3, num_samples=32, input_dim=10)
+    clients = [ClientNode(i, MLP(input_dim=10, hidden_dim=8, num_classes=2), DataLoader(d, batch_size=16))
+               for i, d in enumerate(data[:2])]
+    aggregator = AggregatorNode(MLP(input_dim=10, hidden_dim=8, num_classes=2), clients, DataLoader(data[2]))
+    contract = FLContractStub()
+    profiler = PhaseProfiler("cprofile", str(tmp_path / "prof"))
+    orchestrator = TrainingOrchestrator(aggregator, clients, rounds=2, mask=True,
+                                        ipfs_client=IPFSClient(str(tmp_path / "ipfs")),
+                                        contract=contract, profiler=profiler)
+    history = orchestrator.run()
+
+    assert [h["round"] for h in history] == [1, 2]
+    summary = profiler.summary()
+    assert set(summary["phases"]) == {"train", "mask", "serialize", "upload", "download",
+                                      "aggregate", "evaluate", "commit"}
+    assert all(p["calls"] == 2 for p in summary["phases"].values())
+    assert summary["bytes_moved"]["upload"] > 0
+    assert contract.tx_count == 2
+    assert len(profiler.dump()) == 8
+
+def test_orchestrator_hands_raw_updates_to_robust_rules():
+    data = generate_synthetic(num_clients=3, num_samples=32, input_dim=10)
+    clients = [ClientNode(i, MLP(input_dim=10, hidden_dim=8, num_classes=2), DataLoader(d, batch_size=16))
+               for i, d in enumerate(data)]
+    aggregator = AggregatorNode(MLP(input_dim=10, hidden_dim=8, num_classes=2), clients, rule="median")
+    with pytest.raises(ValueError, match="mean"):
+        TrainingOrchestrator(aggregator, clients, rounds=1, mask=True)
+
+    seen = []
+    aggregate = aggregator.aggregate
+    aggregator.aggregate = lambda updates: (seen.append(len(updates)), aggregate(updates))[1]
+    TrainingOrchestrator(aggregator, clients, rounds=1).run()
+    assert seen == [3]